@@ -29,16 +29,27 @@ from .base import (
     __version__,
     ChainedBase,
     get_codes,
+    iter_codes_bytes,
+    iter_strip_codes,
+    StripStream,
     strip_codes,
+    strip_codes_bytes,
+    tokenize,
 )
 from .colr import (  # noqa
     Colr,
+    auto_color_mode,
     auto_disable,
     closing_code,
+    code_cache,
     codeformat,
     codes,
     codes_reverse,
     color,
+    color_mode,
+    colorize_batch,
+    ColorMode,
+    detect_color_mode,
     disable,
     disabled,
     enable,
@@ -47,6 +58,7 @@ from .colr import (  # noqa
     format_back,
     format_fore,
     get_code_num,
+    get_color_mode,
     get_known_codes,
     get_known_name,
     get_terminal_size,
@@ -55,10 +67,14 @@ from .colr import (  # noqa
     InvalidEscapeCode,
     InvalidRgbEscapeCode,
     InvalidStyle,
+    parse_color_mode,
     parse_colr_arg,
     name_data,
+    reset_color_mode,
     rgbbackformat,
     rgbforeformat,
+    set_color_mode,
+    Style,
 )
 
 from .controls import (  # noqa
@@ -81,25 +97,56 @@ from .progress_frames import (
     FrameSet,
 )
 
+from .sgr import (
+    iter_sgr_states,
+    optimize,
+    sgr_cache,
+    sgr_state_at,
+    SgrState,
+    truncate,
+    wrap,
+)
+from .width import (
+    char_width,
+    str_width,
+    width_cache,
+)
+
 try:
     from .colr_docopt import docopt  # noqa
     has_docopt = True
 except ImportError:
     has_docopt = False
 
+from .name_data import (
+    complete_name,
+    get_name_code,
+    nearest_name,
+    nearest_name_cache,
+)
 from .trans import (
     ColorCode,
+    colorcode_cache,
     fix_hex,
     hex2rgb,
+    hex2rgb_array,
     hex2term,
+    hex2term_int,
     hex2term_map,
     hex2termhex,
     rgb2hex,
+    rgb2hex_array,
     rgb2term,
+    rgb2term_array,
+    rgb2term_int,
+    rgb2term_nearest,
     rgb2termhex,
+    rgb2termhex_array,
     term2hex,
+    term2hex_array,
     term2hex_map,
-    term2rgb
+    term2rgb,
+    term2rgb_array,
 )
 
 __all__ = [
@@ -107,15 +154,26 @@ __all__ = [
     '__version__',
     'ChainedBase',
     'get_codes',
+    'iter_codes_bytes',
+    'iter_strip_codes',
+    'StripStream',
     'strip_codes',
+    'strip_codes_bytes',
+    'tokenize',
     # colr classes/functions made available.
+    'auto_color_mode',
     'auto_disable',
     'closing_code',
+    'code_cache',
     'codeformat',
     'codes',
     'codes_reverse',
     'color',
+    'color_mode',
+    'colorize_batch',
+    'ColorMode',
     'Colr',
+    'detect_color_mode',
     'disable',
     'disabled',
     'enable',
@@ -124,6 +182,7 @@ __all__ = [
     'format_back',
     'format_fore',
     'get_code_num',
+    'get_color_mode',
     'get_known_codes',
     'get_known_name',
     'get_terminal_size',
@@ -133,9 +192,13 @@ __all__ = [
     'InvalidRgbEscapeCode',
     'InvalidStyle',
     'name_data',
+    'parse_color_mode',
     'parse_colr_arg',
+    'reset_color_mode',
     'rgbforeformat',
     'rgbbackformat',
+    'set_color_mode',
+    'Style',
     # controls functions/classes made available.
     'Control',
     'EraseMethod',
@@ -150,19 +213,46 @@ __all__ = [
     'BarSet',
     'Frames',
     'FrameSet',
+    # sgr functions/classes made available.
+    'iter_sgr_states',
+    'optimize',
+    'sgr_cache',
+    'sgr_state_at',
+    'SgrState',
+    'truncate',
+    'wrap',
+    # width functions made available.
+    'char_width',
+    'str_width',
+    'width_cache',
+    # name_data functions made available.
+    'complete_name',
+    'get_name_code',
+    'nearest_name',
+    'nearest_name_cache',
     # trans functions made available.
     'ColorCode',
+    'colorcode_cache',
     'fix_hex',
     'hex2rgb',
+    'hex2rgb_array',
     'hex2term',
+    'hex2term_int',
     'hex2term_map',
     'hex2termhex',
     'rgb2hex',
+    'rgb2hex_array',
     'rgb2term',
+    'rgb2term_array',
+    'rgb2term_int',
+    'rgb2term_nearest',
     'rgb2termhex',
+    'rgb2termhex_array',
     'term2hex',
+    'term2hex_array',
     'term2hex_map',
-    'term2rgb'
+    'term2rgb',
+    'term2rgb_array',
 ]
 if has_docopt:
     __all__.append('docopt')
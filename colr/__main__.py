@@ -423,7 +423,7 @@ def translate(usercodes, rgb_mode=False):
                     raise InvalidColr(code)
                 code = (r, g, b)
 
-            colorcode = ColorCode(code, rgb_mode=rgb_mode)
+            colorcode = ColorCode.from_value(code, rgb_mode=rgb_mode)
 
             if disabled():
                 yield str(colorcode)
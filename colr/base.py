@@ -32,56 +32,442 @@
 """
 import re
 import sys
+from array import array
+from bisect import bisect_right
 from contextlib import suppress
 from functools import total_ordering
 from time import sleep
 from types import GeneratorType
-from typing import (
+from typing import (  # noqa
+    Any,
+    Iterable,
+    Iterator,
     List,
+    Tuple,
     Union,
 )
 
+from .width import str_width
+
 __version__ = '0.8.1'
 
-_codepats = (
-    # Colors.
-    r'(([\d;]+)?m{1})',
-    # Cursor show/hide.
-    r'(\?25l)',
-    r'(\?25h)',
-    # Move position.
-    r'(([\d]+[;])?([\d]+[Hf]))',
-    # Save/restore position.
-    r'([su])',
-    # Others (move, erase).
-    r'([\d]+[ABCDEFGHJKST])',
+# Escape sequences, following the ECMA-48 parser states (as used by the DEC
+# VT terminals and xterm). The character after an escape picks the state,
+# and each state decides how the sequence ends. A sequence that breaks the
+# rules is not a code, and its escape character is left in the text.
+# Each state is: (introducer characters, body pattern, partial body pattern)
+_esc_states = (
+    # CSI: parameter bytes, intermediate bytes, and a final byte.
+    # This covers colors, cursor movement, erasing, and private modes.
+    ('[', r'[\x30-\x3f]*[\x20-\x2f]*[\x40-\x7e]', r'[\x30-\x3f]*[\x20-\x2f]*'),
+    # OSC: a string ended by BEL or ST (escape + backslash), as used for
+    # window titles and hyperlinks. CAN/SUB cancel the string, and any other
+    # escape ends it early.
+    (
+        ']',
+        r'[^\x07\x18\x1a\033]*(?:[\x07\x18\x1a]|\033\\|(?=\033))',
+        r'[^\x07\x18\x1a\033]*\033?',
+    ),
+    # DCS, SOS, PM, and APC: strings ended by ST.
+    (
+        'PX^_',
+        r'[^\x18\x1a\033]*(?:[\x18\x1a]|\033\\|(?=\033))',
+        r'[^\x18\x1a\033]*\033?',
+    ),
+    # Anything else: intermediate bytes and a final byte. This covers
+    # charset selection, save/restore cursor, keypad modes, and resets.
+    ('', r'(?![\[\]PX^_])[\x20-\x2f]*[\x30-\x7e]', r'[\x20-\x2f]*'),
 )
 
+
+def _esc_pattern(body_index: int, sgr_group: bool=False) -> str:
+    """ Build a pattern from the `_esc_states` table.
+        Arguments:
+            body_index  : 1 for complete sequences, 2 for partial ones.
+            sgr_group   : Whether to capture the parameters of color codes
+                          in group 1, before trying the other states.
+    """
+    branches = [r'\[([\d;]+)m'] if sgr_group else []
+    for introducer, *bodies in _esc_states:
+        if len(introducer) > 1:
+            introducer = '[{}]'.format(re.escape(introducer))
+        else:
+            introducer = re.escape(introducer)
+        branches.append(introducer + bodies[body_index - 1])
+    return r'\033(?:{})'.format('|'.join(branches))
+
+
 closing_code = '\033[0m'
 
-# Used to strip escape codes from a string.
-codepat = re.compile(
-    '\033\[({})'.format('|'.join(_codepats))
-)
+# Used to strip escape codes from a string. Color codes (the ones that
+# `get_codes()` returns) set group 1.
+codepat = re.compile(_esc_pattern(1, sgr_group=True))
 # Used to grab codes from a string.
 codegrabpat = re.compile('\033\[[\d;]+?m{1}')
+# Bytes versions of the patterns, for `strip_codes_bytes()` and
+# `iter_codes_bytes()`. These match the same codes as `codepat` and
+# `codegrabpat`, but without capture groups they are a little faster.
+codepat_bytes = re.compile(_esc_pattern(1).encode())
+codegrabpat_bytes = re.compile(rb'\033\[[\d;]+m')
+# Matches the start of an escape code that may be finished in the next chunk
+# of a stream, for `iter_strip_codes()`.
+partialpat = re.compile(_esc_pattern(2) + r'\Z')
+partialpat_bytes = re.compile(partialpat.pattern.encode())
+# Longest partial code that is held back, anything longer is passed on as
+# text. Real codes are much shorter than this, but OSC strings (like
+# hyperlinks) can be long.
+partial_max = 4096
+
+# Token kinds for `tokenize()`.
+# Plain text.
+TOKEN_TEXT = 0
+# Color/style codes, with at least one parameter. These are the codes that
+# `get_codes()` returns.
+TOKEN_SGR = 1
+# Any other escape code that `strip_codes()` removes.
+TOKEN_CODE = 2
+
+
+def _byte_view(data: Any) -> Union[bytes, bytearray, memoryview]:
+    """ Return bytes/bytearrays as-is, and a flat, unsigned byte
+        memoryview for any other buffer (without copying).
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    view = memoryview(data)
+    if (view.ndim != 1) or (view.format != 'B'):
+        view = view.cast('B')
+    return view
 
 
 def get_codes(s: Union[str, 'ChainedBase']) -> List[str]:
     """ Grab all escape codes from a string.
         Returns a list of all escape codes.
     """
-    return codegrabpat.findall(str(s))
+    if isinstance(s, ChainedBase):
+        # Reuse the cached tokens.
+        return s.tokens().codes()
+    s = str(s)
+    if '\033' not in s:
+        # Fast path, no escape codes at all.
+        return []
+    return codegrabpat.findall(s)
 
 
 def is_escape_code(s: Union[str, 'ChainedBase']) -> bool:
     """ Returns True if `s` appears to be any kind of escape code. """
-    return codepat.match(str(s)) is not None
+    s = str(s)
+    if not s.startswith('\033'):
+        return False
+    return codepat.match(s) is not None
+
+
+def iter_codes_bytes(data: Any) -> Iterator[Tuple[int, int]]:
+    """ Like `get_codes()`, but for bytes, bytearrays, memoryviews or any
+        other object that supports the buffer protocol.
+        Yields (start, stop) offsets for each color code instead of the
+        codes themselves, so they can be sliced from `data` without
+        copying (`memoryview(data)[start:stop]`).
+        Memoryviews are not copied.
+    """
+    data = _byte_view(data)
+    if 27 not in data:
+        # Fast path, no escape codes at all.
+        return
+    for match in codegrabpat_bytes.finditer(data):
+        yield match.span()
+
+
+def iter_strip_codes(
+        chunks: Iterable[Union[str, bytes]]) -> Iterator[Union[str, bytes]]:
+    """ Strip escape codes from an iterable of str or bytes chunks, like a
+        file being read in pieces.
+        Codes that are split across chunks are still stripped, because a
+        partial code at the end of a chunk is carried over to the next one.
+        Only one chunk is held in memory at a time.
+        Yields stripped chunks (empty chunks are skipped).
+    """
+    carry = None
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            esc, pat, partial = '\033', codepat, partialpat
+        else:
+            if isinstance(chunk, memoryview):
+                chunk = bytes(chunk)
+            esc, pat, partial = b'\033', codepat_bytes, partialpat_bytes
+        if carry:
+            chunk = carry + chunk
+            carry = None
+        if esc not in chunk:
+            # Fast path, no codes at all.
+            if chunk:
+                yield chunk
+            continue
+        match = partial.search(chunk, max(len(chunk) - partial_max, 0))
+        if match is None:
+            stripped = pat.sub(esc[:0], chunk)
+        else:
+            # A code always ends before the next one starts, so it is safe
+            # to strip everything before the partial code by itself. The
+            # escape that starts the partial code is kept for that, because
+            # it ends any OSC/DCS string before it. It can't be a code by
+            # itself, so it is still the last character after stripping.
+            cut = match.start()
+            carry = chunk[cut:]
+            stripped = pat.sub(esc[:0], chunk[:cut + 1])[:-1]
+        if stripped:
+            yield stripped
+    if carry:
+        # The stream ended in the middle of a code, so it's not a code.
+        # Anything before it may still be.
+        stripped = pat.sub(esc[:0], carry)
+        if stripped:
+            yield stripped
 
 
 def strip_codes(s: Union[str, 'ChainedBase']) -> str:
     """ Strip all color codes from a string. """
-    return codepat.sub('', str(s or ''))
+    if isinstance(s, ChainedBase):
+        # Reuse the cached tokens.
+        return s.tokens().stripped()
+    s = str(s or '')
+    if '\033' not in s:
+        # Fast path, nothing to strip.
+        return s
+    return codepat.sub('', s)
+
+
+def strip_codes_bytes(data: Any) -> bytes:
+    """ Like `strip_codes()`, but for bytes, bytearrays, memoryviews or any
+        other object that supports the buffer protocol.
+        Returns bytes, without decoding/encoding.
+        Bytes without escape codes are returned as-is.
+    """
+    data = _byte_view(data)
+    if 27 not in data:
+        # Fast path, nothing to strip.
+        return bytes(data)
+    return codepat_bytes.sub(b'', data)
+
+
+def tokenize(s: Union[str, 'ChainedBase']) -> 'TokenTable':
+    """ Split a string into text and escape code tokens, in one pass.
+        Returns a TokenTable, which holds parallel arrays of start/stop
+        offsets and token kinds (TOKEN_TEXT, TOKEN_SGR, TOKEN_CODE) instead
+        of a part object for each token.
+        Empty text is never included as a token.
+    """
+    s = str(s)
+    starts = array('I')
+    stops = array('I')
+    kinds = bytearray()
+    pos = 0
+    if '\033' in s:
+        for match in codepat.finditer(s):
+            start, stop = match.span()
+            if start > pos:
+                starts.append(pos)
+                stops.append(start)
+                kinds.append(TOKEN_TEXT)
+            starts.append(start)
+            stops.append(stop)
+            # Only color codes set group 1. Bare '\033[m' codes are not
+            # returned by `get_codes()`.
+            if match.lastindex:
+                kinds.append(TOKEN_SGR)
+            else:
+                kinds.append(TOKEN_CODE)
+            pos = stop
+    if pos < len(s):
+        starts.append(pos)
+        stops.append(len(s))
+        kinds.append(TOKEN_TEXT)
+    return TokenTable(s, starts, stops, kinds)
+
+
+class StripStream(object):
+    """ A read-only file-like wrapper that strips escape codes from another
+        file object, reading it in chunks (see `iter_strip_codes()`).
+        Works with text and binary files, and memory use does not depend
+        on the size of the file.
+
+        Example:
+            with StripStream(open('terminal.log', 'rb')) as f:
+                for chunk in f:
+                    outfile.write(chunk)
+    """
+    def __init__(self, fileobj: Any, chunksize: int=65536) -> None:
+        self.fileobj = fileobj
+        self.chunksize = chunksize
+        # '' or b'', depending on the file type.
+        self._empty = fileobj.read(0)
+        self._buffer = self._empty
+        self._stripped = iter_strip_codes(self._iter_chunks())
+
+    def __enter__(self) -> 'StripStream':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Union[str, bytes]]:
+        """ Iterate over the stripped chunks. """
+        if self._buffer:
+            buf, self._buffer = self._buffer, self._empty
+            yield buf
+        yield from self._stripped
+
+    def _iter_chunks(self) -> Iterator[Union[str, bytes]]:
+        """ Read chunks from the file, until it is exhausted. """
+        while True:
+            chunk = self.fileobj.read(self.chunksize)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        """ Close the underlying file object. """
+        self.fileobj.close()
+
+    def read(self, size: int=-1) -> Union[str, bytes]:
+        """ Read and return up to `size` stripped characters/bytes, or
+            everything that is left if `size` is negative.
+        """
+        pieces = [self._buffer]
+        length = len(self._buffer)
+        while (size < 0) or (length < size):
+            chunk = next(self._stripped, None)
+            if chunk is None:
+                break
+            pieces.append(chunk)
+            length += len(chunk)
+        data = self._empty.join(pieces)
+        if size < 0:
+            self._buffer = self._empty
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+class TokenTable(object):
+    """ Text and escape code tokens for a string, from `tokenize()`.
+        Token `i` is `text[starts[i]:stops[i]]`, and its kind is
+        `kinds[i]`.
+    """
+    __slots__ = ('_index', 'kinds', 'starts', 'stops', 'text')
+
+    def __init__(
+            self,
+            text: str,
+            starts: array,
+            stops: array,
+            kinds: bytearray) -> None:
+        self.text = text
+        self.starts = starts
+        self.stops = stops
+        self.kinds = kinds
+        # Built on first use by `visible_index()`.
+        self._index = None
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        """ Iterate over (start, stop, kind) for each token. """
+        return zip(self.starts, self.stops, self.kinds)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __repr__(self) -> str:
+        return '{}({!r}, tokens={})'.format(
+            type(self).__name__,
+            self.text,
+            len(self.kinds),
+        )
+
+    def codes(self) -> List[str]:
+        """ Return a list of all color codes, like `get_codes()`. """
+        if TOKEN_SGR not in self.kinds:
+            return []
+        s = self.text
+        return [
+            s[start:stop]
+            for start, stop, kind in zip(self.starts, self.stops, self.kinds)
+            if kind == TOKEN_SGR
+        ]
+
+    def iter_strs(self) -> Iterator[Tuple[str, int]]:
+        """ Iterate over (token_str, kind) for each token. """
+        s = self.text
+        for start, stop, kind in zip(self.starts, self.stops, self.kinds):
+            yield s[start:stop], kind
+
+    def stripped(self) -> str:
+        """ Return the text without escape codes, like `strip_codes()`. """
+        s = self.text
+        if (TOKEN_SGR not in self.kinds) and (TOKEN_CODE not in self.kinds):
+            return s
+        return ''.join([
+            s[start:stop]
+            for start, stop, kind in zip(self.starts, self.stops, self.kinds)
+            if kind == TOKEN_TEXT
+        ])
+
+    def slice_visible(self, start: int, stop: int) -> str:
+        """ Return the raw string for visible characters `start` through
+            `stop - 1`, with any codes between them.
+            Every code before the first character is included, so the
+            slice starts with the same colors/styles that were active at
+            that point in the original string.
+            Expects `0 <= start < stop <= self.text_length()`.
+        """
+        tokenindexes, visstarts, codesbefore, codestr = self.visible_index()
+        first = bisect_right(visstarts, start) - 1
+        last = bisect_right(visstarts, stop - 1) - 1
+        starts = self.starts
+        rawstart = starts[tokenindexes[first]] + (start - visstarts[first])
+        rawstop = starts[tokenindexes[last]] + (stop - visstarts[last])
+        return ''.join((
+            codestr[:codesbefore[first]],
+            self.text[rawstart:rawstop],
+        ))
+
+    def text_length(self) -> int:
+        """ Return the length of the text, without escape codes. """
+        tokenindexes, visstarts, _, _ = self.visible_index()
+        if not tokenindexes:
+            return 0
+        last = tokenindexes[-1]
+        return visstarts[-1] + (self.stops[last] - self.starts[last])
+
+    def visible_index(self) -> Tuple[array, array, array, str]:
+        """ Return an index that maps visible (text) positions to tokens,
+            building it on first use. The index is a tuple of:
+                tokenindexes : Token index for each text token.
+                visstarts    : Visible position where each text token
+                               starts.
+                codesbefore  : For each text token, the length of
+                               `codestr` that comes before it.
+                codestr      : All of the codes, joined.
+            Visible positions can be found with `bisect` on `visstarts`.
+        """
+        if self._index is not None:
+            return self._index
+        s = self.text
+        tokenindexes = array('I')
+        visstarts = array('I')
+        codesbefore = array('I')
+        codes = []
+        vispos = codepos = 0
+        for i, (start, stop, kind) in enumerate(self):
+            if kind == TOKEN_TEXT:
+                tokenindexes.append(i)
+                visstarts.append(vispos)
+                codesbefore.append(codepos)
+                vispos += stop - start
+            else:
+                codes.append(s[start:stop])
+                codepos += stop - start
+        self._index = (tokenindexes, visstarts, codesbefore, ''.join(codes))
+        return self._index
 
 
 @total_ordering
@@ -89,10 +475,37 @@ class ChainedBase(object):
     """ Base object for Colr and Control. Handles basic string-manipulation
         methods.
     """
+    # Subclasses should define __slots__ too, or they will get a __dict__.
+    __slots__ = ('__weakref__', '_fragments', '_stripped', '_tokens')
+    # Number of times stripped text was needed, and how many of those
+    # were answered from the cache instead of stripping codes again.
+    # These are shared by all instances, and are only approximate when
+    # several threads are used.
+    strip_passes = 0
+    strip_passes_saved = 0
 
     def __init__(self, text):
         self.data = text
 
+    @property
+    def data(self):
+        """ The string data for this instance.
+            Appended fragments are kept in a list, and only joined when
+            the data is needed. This keeps chaining many small fragments
+            linear instead of quadratic.
+        """
+        fragments = self._fragments
+        if len(fragments) > 1:
+            joined = ''.join(fragments)
+            self._fragments = [joined]
+            return joined
+        return fragments[0]
+
+    @data.setter
+    def data(self, value):
+        self._fragments = [value]
+        self._stripped = self._tokens = None
+
     def __add__(self, other):
         """ Allow the old string concat methods through addition. """
         if hasattr(other, 'data') and isinstance(other.data, str):
@@ -119,12 +532,19 @@ class ChainedBase(object):
 
     def __call__(self, text):
         """ Append text to this ChainedBase object. """
-        self.data = ''.join((
-            self.data,
-            str(text),
-        ))
+        self._fragments.append(str(text))
+        self._stripped = self._tokens = None
         return self
 
+    def __copy__(self):
+        """ Copies need their own fragment list, because appending to a
+            shared list would modify both instances.
+        """
+        cls = self.__class__
+        newobj = cls.__new__(cls)
+        newobj.data = self.data
+        return newobj
+
     def __eq__(self, other):
         """ ChainedBases are equal if their .data is the same. """
         return isinstance(other, self.__class__) and other.data == self.data
@@ -158,7 +578,8 @@ class ChainedBase(object):
             because otherwise it would be just about useless.
             Returns another Colr instance.
         """
-        length = len(self.stripped())
+        tokens = self.tokens()
+        length = tokens.text_length()
         if isinstance(key, slice):
             start, stop, step = key.indices(length)
         elif isinstance(key, int):
@@ -176,23 +597,31 @@ class ChainedBase(object):
         else:
             raise TypeError('Indices must be integers.')
 
+        if (step == 1) and (0 <= start < stop) and (start < length):
+            # Answered with bisect on the cached visible index.
+            return self.__class__(tokens.slice_visible(start, stop))
+
+        # Steps and empty slices walk every character.
         pos = -1
         codeparts = []
         parts = []
         found_char = False
-        for part in self.iter_parts():
+        # An empty string is still one (empty) text part.
+        tokenstrs = (
+            tokens.iter_strs() if tokens.kinds else (('', TOKEN_TEXT), )
+        )
+        for partstr, kind in tokenstrs:
             if pos == stop:
                 if not found_char:
                     raise IndexError(
                         'Index out of bounds for non-escape code data.'
                     )
                 break
-            if part.is_code():
-                # print('PART: {!r}, POS: {}'.format(part, pos))
-                codeparts.append(part)
+            if kind != TOKEN_TEXT:
+                codeparts.append(partstr)
                 continue
             chars = []
-            for char in str(part)[::step]:
+            for char in partstr[::step]:
                 pos += step
                 if pos < start:
                     continue
@@ -207,7 +636,7 @@ class ChainedBase(object):
                 found_char = True
 
             parts.append(''.join(chars))
-        return self.__class__(''.join(str(x) for x in parts))
+        return self.__class__(''.join(parts))
 
     def __hash__(self):
         """ A Colr's hash value is based on self.data. """
@@ -269,6 +698,8 @@ class ChainedBase(object):
             **colorkwargs):
         """ Perform a str justify method on the text arg, or self.data, before
             applying color codes.
+            Padding is based on terminal columns (see `str_width()`), so
+            wide characters and combining marks line up.
             Arguments:
                 methodname  : Name of str method to apply.
                 methodargs  : Arguments for the str method.
@@ -289,12 +720,10 @@ class ChainedBase(object):
         strfunc = getattr(str, methodname)
         if newtext:
             # Operating on text argument, self.data is left alone.
-            strippedtxt = strip_codes(newtext)
-            codelen = len(newtext) - len(strippedtxt)
+            codelen = len(newtext) - str_width(strip_codes(newtext))
             width = width + codelen
             if squeeze:
-                realoldlen = len(self.stripped())
-                width -= realoldlen
+                width -= self._text_width()
             return self.__class__().join(
                 self,
                 self.__class__(
@@ -304,8 +733,7 @@ class ChainedBase(object):
             )
 
         # Operating on self.data.
-        strippedtxt = self.stripped()
-        codelen = len(self.data) - len(strippedtxt)
+        codelen = len(self.data) - self._text_width()
         width = width + codelen
         return self.__class__(
             strfunc(self.data, width, fillchar),
@@ -325,12 +753,15 @@ class ChainedBase(object):
             strip_code or
             any(is_escape_code(s) for s in chars)
         )
-        parts = self.parts()
+        tokens = self.tokens()
+        # An empty string is still one (empty) text part.
+        parts = [partstr for partstr, _ in tokens.iter_strs()] or ['']
+        kinds = tokens.kinds or bytearray((TOKEN_TEXT, ))
 
         def strip_parts(method, indexes):
             for i in indexes:
-                partstr = str(parts[i])
-                if is_escape_code(partstr):
+                partstr = parts[i]
+                if kinds[i] != TOKEN_TEXT:
                     if not stripping_codes:
                         continue
                     if strip_code:
@@ -353,7 +784,20 @@ class ChainedBase(object):
         if methodname in ('rstrip', 'strip'):
             strip_parts(str.rstrip, range(partslen - 1, -1, -1))
 
-        return ''.join(str(x) for x in parts)
+        return ''.join(parts)
+
+    def _text_length(self):
+        """ Return the length of `self.data`, without escape codes. """
+        if (self._stripped is None) and (self._tokens is not None):
+            # Answered from the token index, without stripping.
+            return self._tokens.text_length()
+        return len(self.stripped())
+
+    def _text_width(self):
+        """ Return the number of terminal columns for `self.data`, without
+            escape codes.
+        """
+        return str_width(self.stripped())
 
     def center(self, width, fillchar=' ', squeeze=False, **kwargs):
         """ s.center() doesn't work well on strings with color codes.
@@ -381,33 +825,25 @@ class ChainedBase(object):
             Arguments:
                 data  : str data to add to this ChainedBase.
         """
-        self.data = ''.join((
-            self.data,
-            str(data),
-        ))
+        self._fragments.append(str(data))
+        self._stripped = self._tokens = None
         return self
 
     def iter_parts(self, text=None):
         """ Iterate over CodeParts and TextParts, in the order
             they are discovered from `self.data`.
         """
-        s = str(self if text is None else text)
-        length = len(s)
-        scanner = codepat.scanner(s)
-        m = scanner.search()
-        pos = 0
-        while (m is not None):
-            start, stop = m.span()
-            if start > pos:
-                yield TextPart(s, start=pos, stop=start)
-            yield CodePart(s, start=start, stop=stop)
-            pos = stop
-            m = scanner.search()
-            if (m is None) and (stop < length):
-                yield TextPart(s, start=stop)
-        if pos == 0:
-            # No codes to separate. All text.
-            yield TextPart(s, start=0, stop=length)
+        tokens = self.tokens() if text is None else tokenize(text)
+        s = tokens.text
+        if not tokens.kinds:
+            # Empty string, still a text part.
+            yield TextPart(s, start=0, stop=0)
+            return
+        for start, stop, kind in tokens:
+            if kind == TOKEN_TEXT:
+                yield TextPart(s, start=start, stop=stop)
+            else:
+                yield CodePart(s, start=start, stop=stop)
 
     def join(self, *args, **colorkwargs):
         """ Like str.join, except it returns a Colr.
@@ -489,8 +925,32 @@ class ChainedBase(object):
         return self.__class__(self._str_strip('strip', chars))
 
     def stripped(self):
-        """ Return str(strip_codes(self.data)) """
-        return strip_codes(self.data)
+        """ Return str(strip_codes(self.data))
+            The result is cached until the data changes.
+        """
+        ChainedBase.strip_passes += 1
+        stripped = self._stripped
+        if stripped is not None:
+            ChainedBase.strip_passes_saved += 1
+            return stripped
+        tokens = self._tokens
+        if tokens is None:
+            # A single regex pass is faster than tokenizing for one use.
+            stripped = strip_codes(self.data)
+        else:
+            stripped = tokens.stripped()
+        self._stripped = stripped
+        return stripped
+
+    def tokens(self):
+        """ Return a TokenTable for `self.data` (see `tokenize()`).
+            The table is cached until the data changes, so several
+            operations can share one scan of the string.
+        """
+        tokens = self._tokens
+        if tokens is None:
+            tokens = self._tokens = tokenize(self.data)
+        return tokens
 
     def write(self, file=sys.stdout, end='', delay=None):
         """ Write this control code str to a file, clear self.data, and
@@ -522,12 +982,15 @@ class ChainedBase(object):
 
 class ChainedPart(object):
     """ Base for CodePart and TextPart. Holds shared methods.
+        Parts only hold a reference to the original string and the offsets
+        for their part of it. The substring is sliced when it is needed.
     """
+    __slots__ = ('_origin', 'start', 'stop')
+
     def __init__(self, originstr, start=None, stop=None):
-        s = str(originstr or '')
+        self._origin = str(originstr or '')
         self.start = start
         self.stop = stop
-        self.data = s[self.get_slice()]
 
     def __eq__(self, other):
         try:
@@ -552,7 +1015,12 @@ class ChainedPart(object):
         return '{}({!r})'.format(type(self).__name__, self.data)
 
     def __str__(self):
-        return str(self.data)
+        return self._origin[self.start:self.stop]
+
+    @property
+    def data(self):
+        """ The part of the original string that this part covers. """
+        return self._origin[self.start:self.stop]
 
     def get_slice(self):
         """ Return a `slice` object using thi ChainedPart's `start` and
@@ -571,6 +1039,8 @@ class CodePart(ChainedPart):
     """ Helper class for ChainedBase.parts().
         Marks a part of the string as an escape code.
     """
+    __slots__ = ()
+
     def is_code(self):
         return True
 
@@ -582,6 +1052,8 @@ class TextPart(ChainedPart):
     """ Helper class for ChainedBase.parts().
         Marks a part of the string as text.
     """
+    __slots__ = ()
+
     def is_code(self):
         return False
 
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" colr/cache.py
+
+    A small, thread-safe, size-bounded LRU cache used to memoize escape code
+    lookups and other conversions that are repeated many times.
+
+    The MIT License (MIT)
+
+    Copyright (c) 2015-2017 Christopher Welborn
+
+    Permission is hereby granted, free of charge, to any person obtaining a
+    copy of this software and associated documentation files (the "Software"),
+    to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense,
+    and/or sell copies of the Software, and to permit persons to whom the
+    Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in
+    all copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+    THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+    FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+"""
+from collections import namedtuple, OrderedDict
+from threading import Lock
+from typing import (  # noqa
+    Any,
+    Hashable,
+    Optional,
+)
+
+__all__ = [
+    'CacheInfo',
+    'LRUCache',
+]
+
+CacheInfo = namedtuple(
+    'CacheInfo',
+    ('hits', 'misses', 'evictions', 'maxsize', 'currsize')
+)
+
+
+class LRUCache(object):
+    """ A size-bounded, least-recently-used cache that is safe to share
+        between threads.
+        When more than `maxsize` items are stored, the least recently used
+        item is evicted.
+        A `maxsize` of None means the cache is unbounded, and a `maxsize`
+        of 0 disables caching altogether.
+    """
+    __slots__ = ('_data', '_lock', 'evictions', 'hits', 'maxsize', 'misses')
+
+    def __init__(self, maxsize: Optional[int]=1024) -> None:
+        self._data = OrderedDict()  # type: OrderedDict
+        self._lock = Lock()
+        self.maxsize = self._check_size(maxsize)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return '{}(maxsize={!r}, currsize={})'.format(
+            type(self).__name__,
+            self.maxsize,
+            len(self._data),
+        )
+
+    @staticmethod
+    def _check_size(maxsize: Optional[int]) -> Optional[int]:
+        """ Validate a `maxsize` argument, and return it. """
+        if maxsize is None:
+            return None
+        try:
+            size = int(maxsize)
+        except (TypeError, ValueError) as ex:
+            raise TypeError(
+                'Expecting an int or None for maxsize, got: ({}) {!r}'.format(
+                    type(maxsize).__name__,
+                    maxsize,
+                )
+            ) from ex
+        if size < 0:
+            raise ValueError(
+                'Expecting a maxsize of 0 or more, got: {}'.format(size)
+            )
+        return size
+
+    def _evict(self) -> None:
+        """ Evict least recently used items until the cache fits in
+            self.maxsize. The lock must be held when calling this.
+        """
+        if self.maxsize is None:
+            return
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self, stats: Optional[bool]=True) -> None:
+        """ Remove all items from the cache.
+            If `stats` is truthy, the hit/miss/eviction counters are also
+            reset.
+        """
+        with self._lock:
+            self._data.clear()
+            if stats:
+                self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: Hashable, default: Optional[Any]=None) -> Any:
+        """ Return a cached value, or `default` if it is not cached. """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def info(self) -> CacheInfo:
+        """ Return a CacheInfo of (hits, misses, evictions, maxsize, currsize).
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._data),
+            )
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """ Change the maximum size of the cache, evicting the least recently
+            used items if needed.
+        """
+        size = self._check_size(maxsize)
+        with self._lock:
+            self.maxsize = size
+            self._evict()
+
+    def set(self, key: Hashable, value: Any) -> Any:
+        """ Cache a value for `key`, and return the value. """
+        if self.maxsize == 0:
+            return value
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+        return value
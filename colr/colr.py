@@ -28,23 +28,28 @@
     FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
     DEALINGS IN THE SOFTWARE.
 """
-from contextlib import suppress  # type: ignore
+from contextlib import ContextDecorator, suppress  # type: ignore
+from enum import Enum
 from functools import partial
+from itertools import zip_longest
 import math
 import os
 import platform
+import re
 import struct
 import sys
 
 from types import GeneratorType
+from weakref import WeakKeyDictionary
 from typing import (  # noqa
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
-    Set,  # Set is used as a 'type: Set' comment in `get_known_codes()`.
     Tuple,
     Union,
     cast,
@@ -58,13 +63,24 @@ from .base import (
     strip_codes,
 )
 
+from .cache import LRUCache
+from .sgr import (
+    optimize,
+    truncate,
+    wrap,
+)
 from .trans import (
     ColorCode,
     hex2rgb,
-    hex2term,
+    hex2term_int,
     hex2termhex,
+    rgb2term_int,
+    term2rgb,
+)
+from .name_data import (
+    get_name_code,
+    names as name_data,
 )
-from .name_data import names as name_data
 
 # Types for the type checker.
 CodeFormatArg = Union[str, int]
@@ -77,13 +93,19 @@ FormatArg = Union[int, Tuple[int, int, int]]
 
 __all__ = [
     '_disabled',
+    'auto_color_mode',
     'auto_disable',
     'closing_code',
+    'code_cache',
+    'color_mode',
+    'ColorMode',
     'codeformat',
     'codes',
     'codes_reverse',
     'color',
+    'colorize_batch',
     'Colr',
+    'detect_color_mode',
     'disable',
     'enable',
     'extbackformat',
@@ -92,6 +114,7 @@ __all__ = [
     'format_fore',
     'get_code_num',
     'get_codes',
+    'get_color_mode',
     'get_known_codes',
     'get_known_name',
     'get_terminal_size',
@@ -101,14 +124,77 @@ __all__ = [
     'InvalidRgbEscapeCode',
     'InvalidStyle',
     'name_data',
+    'parse_color_mode',
     'parse_colr_arg',
+    'reset_color_mode',
     'rgbbackformat',
     'rgbforeformat',
+    'set_color_mode',
     'strip_codes',
+    'Style',
 ]
 # Set with the enable/disable functions, or on Windows without colorama.
+# This is the process-wide fallback when no color mode is set for the
+# current context (see `color_mode()`).
 _disabled = False
 
+
+class ColorMode(Enum):
+    """ Color modes for `color_mode()` and `set_color_mode()`.
+        Colors are downsampled to the nearest color the mode supports.
+        `detect_color_mode()` finds the mode that a terminal supports.
+    """
+    DISABLED = 0
+    TERM16 = 16
+    TERM256 = 256
+    TRUECOLOR = ENABLED = 16777216
+
+    # Members are singletons, and this is much faster than Enum.__hash__.
+    __hash__ = object.__hash__
+
+    def __str__(self):
+        return self.name.lower()
+
+
+# Enum attribute lookups are slow, and these are checked for every color
+# call.
+_mode_disabled = ColorMode.DISABLED
+_mode_truecolor = ColorMode.TRUECOLOR
+# The process-wide color mode when colors are enabled.
+# Set with `auto_color_mode()`.
+_default_mode = _mode_truecolor
+
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    # Python 3.6 and earlier. Thread-local only, no asyncio support.
+    from threading import local
+
+    class ContextVar(object):  # type: ignore
+        """ A thread-local stand-in for contextvars.ContextVar. """
+        def __init__(self, name, default=None):
+            self.name = name
+            self.default = default
+            self._local = local()
+
+        def get(self):
+            return getattr(self._local, 'value', self.default)
+
+        def reset(self, token):
+            self._local.value = token
+
+        def set(self, value):
+            token = self.get()
+            self._local.value = value
+            return token
+
+# Set with `color_mode()`/`set_color_mode()`. None means "use `_disabled`".
+_color_mode = ContextVar(
+    'colr_color_mode',
+    default=None,
+)  # type: ContextVar[Optional[ColorMode]]
+
 # Windows support relies on colorama (for now).
 if platform.system() == 'Windows':
     try:
@@ -153,6 +239,60 @@ extbackformat = '\033[48;5;{}m'.format  # type: CodeFormatFunc
 rgbforeformat = '\033[38;2;{};{};{}m'.format  # type: CodeFormatRgbFunc
 rgbbackformat = '\033[48;2;{};{};{}m'.format  # type: CodeFormatRgbFunc
 
+# Matches 256-color and RGB codes, for `_downsample_code()`.
+_downsample_pat = re.compile(
+    r'\033\[([34]8);(?:5;(\d+)|2;(\d+);(\d+);(\d+))m'
+)
+# Modes that don't need codes downsampled.
+_full_color_modes = (_mode_disabled, _mode_truecolor)
+# The 256-color cube number for an RGB value is the sum of one item from
+# each of these, by channel value (see `_downsample_arg()`).
+_cube_parts = tuple(rgb2term_int(0, 0, value) - 16 for value in range(256))
+_cube_red = tuple(16 + (36 * part) for part in _cube_parts)
+_cube_green = tuple(6 * part for part in _cube_parts)
+_cube_blue = _cube_parts
+# Prefixes for 256-color/name_data Colr methods, like `Colr.f_123`.
+_ext_attr_prefixes = (
+    ('b256_', 'back'),
+    ('b_', 'back'),
+    ('f256_', 'fore'),
+    ('f_', 'fore'),
+)
+# Nearest basic color for each 256-color number, built on first use.
+_term16_map = None  # type: Optional[Tuple[int, ...]]
+# (codetype, knownname) for every basic, light, 256-color, and style code,
+# built on first use by `get_known_name()`.
+_known_names = None  # type: Optional[Dict[str, Optional[Tuple[str, Any]]]]
+# RGB codes, for the fast path in `get_known_name()`. Anything else that
+# starts like an RGB code is checked (and rejected) by `get_code_num_rgb()`.
+_rgb_code_pat = re.compile(
+    '\033\\[([34])8;2;([0-9]{1,3});([0-9]{1,3});([0-9]{1,3})m\\Z'
+)
+# Explanations from `get_known_codes()`, by (code, rgb_mode, disabled).
+_explain_cache = LRUCache(maxsize=1024)
+
+# Modes found by `detect_color_mode()`, by stream.
+_detected_modes = WeakKeyDictionary()  # type: WeakKeyDictionary
+# Terminfo color counts, by (TERM, TERMINFO, TERMINFO_DIRS).
+_terminfo_colors_cache = {}  # type: Dict[Tuple[str, str, str], Optional[int]]
+# Where compiled terminfo entries are usually found, after $TERMINFO,
+# ~/.terminfo, and $TERMINFO_DIRS.
+_terminfo_dirs = (
+    '/etc/terminfo',
+    '/lib/terminfo',
+    '/usr/share/terminfo',
+    '/usr/lib/terminfo',
+    '/usr/share/lib/terminfo',
+)
+# Compiled terminfo magic numbers, and the (struct format, size) of the
+# entry's numbers. The extended format has 32-bit numbers.
+_terminfo_formats = {
+    0o432: ('<h', 2),
+    0o1036: ('<i', 4),
+}
+# Index of the `colors` capability in a compiled entry's numbers.
+_terminfo_colors_index = 13
+
 
 def _build_codes() -> Dict[str, Dict[str, str]]:
     """ Build code map, encapsulated to reduce module-level globals. """
@@ -206,6 +346,368 @@ def _build_codes_reverse(
     return built
 
 
+def _build_known_names() -> Dict[str, Optional[Tuple[str, Any]]]:
+    """ Build a map of every basic, light, 256-color, and style code to
+        its (codetype, knownname), for `get_known_name()`.
+        Codes that `_get_known_name()` would reject are left out, so they
+        are still rejected.
+    """
+    built = {}  # type: Dict[str, Optional[Tuple[str, Any]]]
+    for number in range(256):
+        for code in (
+                codeformat(number),
+                extforeformat(number),
+                extbackformat(number)):
+            with suppress(InvalidEscapeCode):
+                built[code] = _get_known_name(code)
+    return built
+
+
+def _cache_arg(value: Any) -> Any:
+    """ Normalize a fore/back/style argument into a hashable key for
+        `code_cache`. Raises TypeError if the value cannot be cached
+        (generators, unhashable values).
+        Strings are case-insensitive, and lists/tuples are interchangeable.
+        Other types keep their type in the key, because `300` and `'300'`
+        do not resolve to the same code.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, (list, tuple)):
+        key = (tuple, tuple(value))
+    elif isinstance(value, GeneratorType):
+        raise TypeError('Generators cannot be cached.')
+    else:
+        key = (type(value), value)
+    # Raises TypeError for unhashable values.
+    hash(key)
+    return key
+
+
+def _detect_color_mode(stream: Any) -> ColorMode:
+    """ Find the color mode that `stream` supports, without caching.
+        See `detect_color_mode()`.
+    """
+    env = os.environ
+    if env.get('NO_COLOR', ''):
+        # https://no-color.org
+        return _mode_disabled
+    if not getattr(stream, 'isatty', lambda: False)():
+        return _mode_disabled
+    if env.get('COLORTERM', '').lower() in ('truecolor', '24bit'):
+        return _mode_truecolor
+    term = env.get('TERM', '').lower()
+    if term == 'dumb':
+        return _mode_disabled
+    if ('direct' in term) or ('truecolor' in term):
+        return _mode_truecolor
+    if '256' in term:
+        return ColorMode.TERM256
+    if term:
+        colors = _terminfo_colors(term)
+        if colors is not None:
+            if colors >= 16777216:
+                return _mode_truecolor
+            if colors >= 256:
+                return ColorMode.TERM256
+            if colors >= 8:
+                return ColorMode.TERM16
+            return _mode_disabled
+    elif platform.system() == 'Windows':
+        # Windows Terminal supports RGB, the old console does not.
+        if env.get('WT_SESSION', ''):
+            return _mode_truecolor
+    return ColorMode.TERM16
+
+
+def _downsample_arg(value: Any) -> Any:
+    """ Convert an RGB fore/back argument into the nearest 256-color
+        number, for color modes that can't show RGB colors anyway.
+        The result is the same after downsampling, but the code cache
+        gets one entry per palette color instead of one per RGB value,
+        and the RGB code doesn't need to be built and parsed again.
+        Other values are returned as-is.
+    """
+    if (type(value) not in (tuple, list)) or (len(value) != 3):
+        return value
+    r, g, b = value
+    try:
+        if (r >= 0) and (g >= 0) and (b >= 0):
+            return _cube_red[r] + _cube_green[g] + _cube_blue[b]
+    except (IndexError, TypeError):
+        pass
+    # Let _color_code() raise the usual errors.
+    return value
+
+
+def _downsample_code(code: str, mode: ColorMode) -> str:
+    """ Convert any 256-color/RGB codes in `code` to the nearest code that
+        `mode` supports.
+    """
+    if (mode in _full_color_modes) or ('8;' not in code):
+        return code
+
+    def replace(match):
+        kind, ext, r, g, b = match.groups()
+        if ext is None:
+            num = rgb2term_int(int(r), int(g), int(b))
+        else:
+            num = int(ext)
+        if mode is ColorMode.TERM256:
+            return '\033[{};5;{}m'.format(kind, num)
+        return codeformat(_term16_code(num, backcolor=(kind == '48')))
+
+    return _downsample_pat.sub(replace, code)
+
+
+def _explain_code(
+        code: str,
+        rgb_mode: Optional[bool]=False,
+        disabled: Optional[bool]=False) -> str:
+    """ Return the explanation for a single code, for `get_known_codes()`,
+        or an empty string if it is not a known code.
+    """
+    codeinfo = get_known_name(code)
+    if codeinfo is None:
+        return ''
+    codetype, name = codeinfo
+
+    typedesc = '{:>13}: {!r:<23}'.format(codetype.title(), code)
+    if codetype.startswith(('extended', 'rgb')):
+        colorcode = ColorCode.from_value(name, rgb_mode=rgb_mode)
+        if disabled:
+            codedesc = str(colorcode)
+        else:
+            codedesc = colorcode.example()
+    else:
+        codedesc = ''.join((
+            code,
+            str(name).lstrip('(').rstrip(')'),
+            codes['style']['reset_all']
+        ))
+
+    return ' '.join((
+        typedesc,
+        codedesc
+    ))
+
+
+def _term16_code(number: int, backcolor: Optional[bool]=False) -> int:
+    """ Return the basic/light code number (30-37, 90-97, or 40-47,
+        100-107 for back colors) nearest to a 256-color number.
+    """
+    global _term16_map
+    if _term16_map is None:
+        basic = [term2rgb(i) for i in range(16)]
+
+        def nearest(num):
+            if num < 16:
+                return num
+            r, g, b = term2rgb(num)
+            return min(
+                range(16),
+                key=lambda i: (
+                    ((basic[i][0] - r) ** 2) +
+                    ((basic[i][1] - g) ** 2) +
+                    ((basic[i][2] - b) ** 2)
+                )
+            )
+        _term16_map = tuple(nearest(i) for i in range(256))
+    num = _term16_map[number]
+    if num < 8:
+        return num + (40 if backcolor else 30)
+    return (num - 8) + (100 if backcolor else 90)
+
+
+def _terminfo_colors(term: str) -> Optional[int]:
+    """ Return the `colors` capability from the compiled terminfo entry for
+        `term`, or None if there is no readable entry. An entry without
+        `colors` has 0 colors.
+        The entry is read directly instead of through curses, because
+        curses.setupterm() changes global state, and only works once per
+        process.
+    """
+    env = os.environ
+    key = (term, env.get('TERMINFO', ''), env.get('TERMINFO_DIRS', ''))
+    if key in _terminfo_colors_cache:
+        return _terminfo_colors_cache[key]
+    colors = None
+    for filepath in _terminfo_paths(term):
+        try:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except OSError:
+            continue
+        try:
+            magic, namesize, boolcount, numcount = struct.unpack_from(
+                '<4h',
+                data,
+            )
+            numformat, numsize = _terminfo_formats[magic]
+            if numcount <= _terminfo_colors_index:
+                colors = 0
+            else:
+                # Numbers start on an even byte, after the names and bools.
+                offset = 12 + namesize + boolcount
+                offset += (offset % 2) + (_terminfo_colors_index * numsize)
+                # -1 means no colors, -2 means the capability was cancelled.
+                colors = max(struct.unpack_from(numformat, data, offset)[0], 0)
+        except (KeyError, struct.error):
+            # Not a compiled terminfo entry.
+            colors = None
+        break
+    _terminfo_colors_cache[key] = colors
+    return colors
+
+
+def _terminfo_paths(term: str) -> Iterator[str]:
+    """ Yield the possible paths to the compiled terminfo entry for `term`.
+        Entries are in a sub directory named after the first character of
+        the name, or its hex value (macOS).
+    """
+    if (not term) or ('/' in term) or (os.sep in term) or (term[0] == '.'):
+        return
+    env = os.environ
+    dirs = []
+    if env.get('TERMINFO', ''):
+        dirs.append(env['TERMINFO'])
+    dirs.append(os.path.expanduser('~/.terminfo'))
+    if env.get('TERMINFO_DIRS', ''):
+        # Empty items mean "the default directories".
+        for dirpath in env['TERMINFO_DIRS'].split(os.pathsep):
+            if dirpath:
+                dirs.append(dirpath)
+            else:
+                dirs.extend(_terminfo_dirs)
+    dirs.extend(_terminfo_dirs)
+    subdirs = (term[0], '{:02x}'.format(ord(term[0])))
+    for dirpath in dirs:
+        for subdir in subdirs:
+            yield os.path.join(dirpath, subdir, term)
+
+
+def _attr_method(name: str, kwarg: str, value: Any) -> Callable:
+    """ Build a color method for Colr, like `Colr.red` or `Colr.f_123`.
+        It works like `partial(self.chained, **{kwarg: value})`.
+    """
+    def method(self, *args, **kwargs):
+        kwargs.setdefault(kwarg, value)
+        return self.chained(*args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = 'Colr.{}'.format(name)
+    method.__doc__ = 'Like self.chained(..., {}={!r}).'.format(kwarg, value)
+    return method
+
+
+def _batch_style(item: Any) -> 'Style':
+    """ Build a Style for one item of the `styles` arg to
+        Colr.color_many().
+        A tuple is (fore, back[, style]), None is no style, and anything
+        else is used as the fore color (a name, or a palette index).
+    """
+    if item is None:
+        return Style()
+    if isinstance(item, tuple):
+        return Style(*item)
+    return Style(fore=item)
+
+
+def _iter_color_many(
+        texts: Iterable[Any],
+        styles: Union['Style', Iterable[Any]],
+        mode: ColorMode) -> Iterator[str]:
+    """ Yield colorized strings for Colr.color_many().
+        `styles` is either one Style for all texts, or an iterable with a
+        style for each text. Each unique style is only resolved once.
+        Raises ValueError if `texts` and `styles` are not the same length.
+    """
+    if isinstance(styles, Style):
+        code = styles.mode_code(mode)
+        pairs = ((text, styles, code) for text in texts)
+    else:
+        pairs = _iter_style_pairs(texts, styles, mode)
+    for text, st, code in pairs:
+        if text.__class__ is not str:
+            text = str(text) if text is not None else ''
+        # This mimics Style.__call__, without the extra function call.
+        if not text:
+            yield code
+        elif '\033' in text:
+            yield ''.join((code, text, st._embedded_end(text)))
+        elif st.has_args:
+            yield ''.join((code, text, closing_code))
+        else:
+            yield text
+
+
+def _iter_style_pairs(
+        texts: Iterable[Any],
+        styles: Iterable[Any],
+        mode: ColorMode) -> Iterator[Tuple[Any, 'Style', str]]:
+    """ Yield (text, Style, code) for each text and its style arg, for
+        `_iter_color_many()`.
+        Raises ValueError if `texts` and `styles` are not the same length.
+        Unhashable style args are resolved for every text, so they raise
+        the same errors that Colr.color() would.
+    """
+    resolved = {}  # type: Dict[Any, Tuple[Style, str]]
+    missing = object()
+    for text, item in zip_longest(texts, styles, fillvalue=missing):
+        if (text is missing) or (item is missing):
+            raise ValueError(
+                'Expecting the same number of texts and styles.'
+            )
+        if isinstance(item, Style):
+            yield text, item, item.mode_code(mode)
+            continue
+        if isinstance(item, list):
+            # Rows from a 2D NumPy array, or lists of args.
+            item = tuple(item)
+        try:
+            pair = resolved.get(item, None)
+        except TypeError:
+            # Unhashable, it can't be memoized.
+            st = _batch_style(item)
+            yield text, st, st.mode_code(mode)
+            continue
+        if pair is None:
+            st = _batch_style(item)
+            pair = resolved[item] = (st, st.mode_code(mode))
+        yield text, pair[0], pair[1]
+
+
+def auto_color_mode(
+        enabled: Optional[bool]=True,
+        stream: Optional[IO]=None) -> ColorMode:
+    """ Automatically set the process-wide color mode to the mode that
+        `stream` supports (see `detect_color_mode()`). Colors are disabled
+        if the stream can't show them, and RGB/256-colors are downsampled
+        if it can only show 256/16 colors.
+        Returns the new mode.
+
+        Arguments:
+            enabled  : Whether to automatically set the color mode.
+                       When set to False, the mode is reset to
+                       TRUECOLOR and enable() is called.
+            stream   : The stream to check. Default: sys.stdout
+    """
+    global _default_mode
+    if not enabled:
+        _default_mode = _mode_truecolor
+        enable()
+        return get_color_mode()
+    mode = detect_color_mode(stream)
+    if mode is _mode_disabled:
+        disable()
+    else:
+        _default_mode = mode
+        enable()
+    return get_color_mode()
+
+
 def auto_disable(
         enabled: Optional[bool]=True,
         fds: Optional[Sequence[IO]]=(sys.stdout, sys.stderr)) -> None:
@@ -227,18 +729,84 @@ def auto_disable(
         enable()
 
 
+class color_mode(ContextDecorator):  # noqa
+    """ A context manager/decorator that sets the color mode for the
+        current thread or asyncio task, and restores it afterwards.
+        Other threads/tasks are not affected, and the global
+        enable()/disable() setting is only used when no mode is set.
+
+        Example:
+            with color_mode(False):
+                log.info(Colr('no codes in here', 'red'))
+
+            @color_mode(256)
+            def render():
+                return Colr('downsampled', (255, 0, 0))
+    """
+    def __init__(self, mode: Any) -> None:
+        self.mode = parse_color_mode(mode)
+        self._tokens = []  # type: List[Any]
+
+    def __enter__(self) -> ColorMode:
+        self._tokens.append(_color_mode.set(self.mode))
+        return get_color_mode()
+
+    def __exit__(self, *exc) -> None:
+        _color_mode.reset(self._tokens.pop())
+
+    def _recreate_cm(self) -> 'color_mode':
+        """ Decorated functions get a new instance for each call, so they
+            can be used from several threads at once.
+        """
+        return type(self)(self.mode)
+
+
+def detect_color_mode(
+        stream: Optional[IO]=None,
+        refresh: Optional[bool]=False) -> ColorMode:
+    """ Return the ColorMode that a stream supports. Results are cached
+        per stream, use `refresh=True` to check again.
+
+        The checks, in order:
+            NO_COLOR set                    : DISABLED
+            Not a tty                       : DISABLED
+            COLORTERM=truecolor|24bit       : TRUECOLOR
+            TERM=dumb                       : DISABLED
+            TERM=*direct*|*truecolor*       : TRUECOLOR
+            TERM=*256*                      : TERM256
+            Terminfo colors for TERM        : TRUECOLOR/TERM256/TERM16
+            Anything else                   : TERM16
+
+        Arguments:
+            stream   : The stream to check. Default: sys.stdout
+            refresh  : Whether to ignore the cached result.
+    """
+    if stream is None:
+        stream = sys.stdout
+    if not refresh:
+        with suppress(KeyError, TypeError):
+            return _detected_modes[stream]
+    mode = _detect_color_mode(stream)
+    with suppress(TypeError):
+        # Some streams can't be weakly referenced.
+        _detected_modes[stream] = mode
+    return mode
+
+
 def disable() -> None:
     """ Disable color codes for Colr and the convenience color() function.
         Created to be used by auto_disable(), for piping output to file or
         other commands.
+        This is process-wide. Use `color_mode()` to disable colors for
+        one thread or asyncio task.
     """
     global _disabled
     _disabled = True
 
 
 def disabled() -> bool:
-    """ Public access to _disabled. """
-    return _disabled
+    """ Returns True if colors are disabled for the current context. """
+    return get_color_mode() is _mode_disabled
 
 
 def enable() -> None:
@@ -250,8 +818,19 @@ def enable() -> None:
 
 
 def enabled() -> bool:
-    """ Public access to _disabled. """
-    return not _disabled
+    """ Returns True if colors are enabled for the current context. """
+    return get_color_mode() is not _mode_disabled
+
+
+def get_color_mode() -> ColorMode:
+    """ Return the ColorMode for the current thread/task. When no mode has
+        been set with `color_mode()` or `set_color_mode()`, the global
+        enable()/disable() setting is used.
+    """
+    mode = _color_mode.get()
+    if mode is None:
+        return _mode_disabled if _disabled else _default_mode
+    return mode
 
 
 def _format_code(
@@ -341,6 +920,68 @@ def _format_code(
     return formatters['rgb'](r, g, b)
 
 
+def _get_known_name(s: str) -> Optional[Tuple[str, ColorArg]]:
+    """ Reverse translate a terminal code to a known color name, by
+        parsing it. This is the validating path for `get_known_name()`,
+        for codes that are not in the index.
+        Raises InvalidEscapeCode/InvalidRgbEscapeCode for bad numbers.
+    """
+
+    if not s.endswith('m'):
+        # All codes end with 'm', so...
+        return None
+    if s.startswith('\033[38;5;'):
+        # Extended fore.
+        name = codes_reverse['fore'].get(s, None)
+        if name is None:
+            num = get_code_num(s)
+            return ('extended fore', num)
+        else:
+            return ('extended fore', name)
+    elif s.startswith('\033[48;5;'):
+        # Extended back.
+        name = codes_reverse['back'].get(s, None)
+        if name is None:
+            num = get_code_num(s)
+            return ('extended back', num)
+        else:
+            return ('extended back', name)
+    elif s.startswith('\033[38;2'):
+        # RGB fore.
+        vals = get_code_num_rgb(s)
+        if vals is not None:
+            return ('rgb fore', vals)
+    elif s.startswith('\033[48;2'):
+        # RGB back.
+        vals = get_code_num_rgb(s)
+        if vals is not None:
+            return ('rgb back', vals)
+    elif s.startswith('\033['):
+        # Fore, back, style.
+        number = get_code_num(s)
+        # Get code type based on number.
+        if (number <= 7) or (number == 22):
+            codetype = 'style'
+        elif (((number >= 30) and (number < 40)) or
+                ((number >= 90) and (number < 100))):
+            codetype = 'fore'
+        elif (((number >= 40) and (number < 50)) or
+                ((number >= 100) and (number < 110))):
+            codetype = 'back'
+        else:
+            raise InvalidEscapeCode(
+                number,
+                'Expecting 0-7, 22, 30-39, or 40-49 for escape code',
+            )
+
+        name = codes_reverse[codetype].get(s, None)
+        if name is not None:
+            return (codetype, name)
+
+    # Not a known escape code.
+    return None
+
+
 def format_back(
         number: FormatArg,
         light: Optional[bool]=False,
@@ -433,102 +1074,46 @@ def get_known_codes(
         unique: Optional[bool]=True,
         rgb_mode: Optional[bool]=False):
     """ Get all known escape codes from a string, and yield the explanations.
+        Explanations are built once for each code, and cached.
     """
 
     isdisabled = disabled()
-    orderedcodes = tuple((c, get_known_name(c)) for c in get_codes(s))
-    codesdone = set()  # type: Set[str]
-
-    for code, codeinfo in orderedcodes:
+    found = get_codes(s)
+    if unique:
         # Do the codes in order, but don't do the same code twice.
-
-        if unique:
-            if code in codesdone:
-                continue
-            codesdone.add(code)
-
-        if codeinfo is None:
-            continue
-        codetype, name = codeinfo
-
-        typedesc = '{:>13}: {!r:<23}'.format(codetype.title(), code)
-        if codetype.startswith(('extended', 'rgb')):
-            if isdisabled:
-                codedesc = str(ColorCode(name, rgb_mode=rgb_mode))
-            else:
-                codedesc = ColorCode(name, rgb_mode=rgb_mode).example()
-        else:
-            codedesc = ''.join((
-                code,
-                str(name).lstrip('(').rstrip(')'),
-                codes['style']['reset_all']
-            ))
-
-        yield ' '.join((
-            typedesc,
-            codedesc
-        ))
+        found = list(dict.fromkeys(found))
+
+    for code in found:
+        cachekey = (code, bool(rgb_mode), isdisabled)
+        codedesc = _explain_cache.get(cachekey)
+        if codedesc is None:
+            codedesc = _explain_cache.set(
+                cachekey,
+                _explain_code(code, rgb_mode=rgb_mode, disabled=isdisabled),
+            )
+        if codedesc:
+            yield codedesc
 
 
 def get_known_name(s: str) -> Optional[Tuple[str, ColorArg]]:
     """ Reverse translate a terminal code to a known color name, if possible.
         Returns a tuple of (codetype, knownname) on success.
         Returns None on failure.
+        Basic, light, 256-color, and style codes are looked up in an index
+        that is built once, and RGB codes are parsed with a single regex.
     """
-
-    if not s.endswith('m'):
-        # All codes end with 'm', so...
-        return None
-    if s.startswith('\033[38;5;'):
-        # Extended fore.
-        name = codes_reverse['fore'].get(s, None)
-        if name is None:
-            num = get_code_num(s)
-            return ('extended fore', num)
-        else:
-            return ('extended fore', name)
-    elif s.startswith('\033[48;5;'):
-        # Extended back.
-        name = codes_reverse['back'].get(s, None)
-        if name is None:
-            num = get_code_num(s)
-            return ('extended back', num)
-        else:
-            return ('extended back', name)
-    elif s.startswith('\033[38;2'):
-        # RGB fore.
-        vals = get_code_num_rgb(s)
-        if vals is not None:
-            return ('rgb fore', vals)
-    elif s.startswith('\033[48;2'):
-        # RGB back.
-        vals = get_code_num_rgb(s)
-        if vals is not None:
-            return ('rgb back', vals)
-    elif s.startswith('\033['):
-        # Fore, back, style.
-        number = get_code_num(s)
-        # Get code type based on number.
-        if (number <= 7) or (number == 22):
-            codetype = 'style'
-        elif (((number >= 30) and (number < 40)) or
-                ((number >= 90) and (number < 100))):
-            codetype = 'fore'
-        elif (((number >= 40) and (number < 50)) or
-                ((number >= 100) and (number < 110))):
-            codetype = 'back'
-        else:
-            raise InvalidEscapeCode(
-                number,
-                'Expecting 0-7, 22, 30-39, or 40-49 for escape code',
-            )
-
-        name = codes_reverse[codetype].get(s, None)
-        if name is not None:
-            return (codetype, name)
-
-    # Not a known escape code.
-    return None
+    global _known_names
+    if _known_names is None:
+        _known_names = _build_known_names()
+    if s in _known_names:
+        return _known_names[s]
+    match = _rgb_code_pat.match(s)
+    if match is not None:
+        fore, r, g, b = match.groups()
+        rgb = (int(r), int(g), int(b))
+        if max(rgb) < 256:
+            return ('rgb fore' if fore == '3' else 'rgb back', rgb)
+    return _get_known_name(s)
 
 
 def get_terminal_size(default=(80, 35)):
@@ -565,6 +1150,37 @@ def in_range(x: int, minimum: int, maximum: int) -> bool:
     return (x >= minimum and x <= maximum)
 
 
+def parse_color_mode(mode: Any) -> Optional[ColorMode]:
+    """ Convert a user's color mode argument into a ColorMode.
+        Accepts a ColorMode, True/False (enabled/disabled), 0/16/256, or a
+        mode name ('disabled', 'enabled', '16', '256', 'truecolor').
+        The name 'auto' uses `detect_color_mode()` for sys.stdout.
+        None is returned as-is, and means "use the global setting".
+        Raises ValueError for unknown modes.
+    """
+    if (mode is None) or isinstance(mode, ColorMode):
+        return mode
+    if isinstance(mode, bool):
+        return ColorMode.ENABLED if mode else ColorMode.DISABLED
+    if isinstance(mode, str):
+        name = mode.strip().upper()
+        if name == 'AUTO':
+            return detect_color_mode()
+        with suppress(KeyError):
+            return ColorMode[name]
+        with suppress(KeyError):
+            return ColorMode['TERM{}'.format(name)]
+    else:
+        with suppress(ValueError, TypeError):
+            return ColorMode(mode)
+    raise ValueError(
+        'Expecting a ColorMode, bool, or one of {}, got: {!r}'.format(
+            ', '.join(repr(str(m)) for m in ColorMode),
+            mode,
+        )
+    )
+
+
 def parse_colr_arg(
         s: str,
         default: Optional[Any]=None,
@@ -605,8 +1221,7 @@ def parse_colr_arg(
                 return val
 
             # Not a basic code, try known names.
-            named_data = name_data.get(val, None)
-            if named_data is not None:
+            if val in name_data:
                 # A known named color.
                 return val
 
@@ -639,6 +1254,22 @@ def parse_colr_arg(
         return intval
 
 
+def reset_color_mode(token: Any) -> None:
+    """ Restore the color mode that was active before `set_color_mode()`
+        returned `token`.
+    """
+    _color_mode.reset(token)
+
+
+def set_color_mode(mode: Any) -> Any:
+    """ Set the color mode for the current thread/task, and return a token
+        for `reset_color_mode()`. A mode of None means "use the global
+        enable()/disable() setting".
+        Most code should use the `color_mode()` context manager instead.
+    """
+    return _color_mode.set(parse_color_mode(mode))
+
+
 def try_parse_int(
         s: str,
         default: Optional[Any]=None,
@@ -664,6 +1295,8 @@ def try_parse_int(
 class Colr(ChainedBase):
 
     """ This class colorizes text for an ansi terminal. """
+    __slots__ = ()
+
     # Known offsets for `Colr.rainbow` that will start with a certain color.
     gradient_names = {
         'green': 0,
@@ -675,6 +1308,9 @@ class Colr(ChainedBase):
         'blue': 34,
         'cyan': 48,
     }
+    # Fake method names for `__getattr__`, built by `_get_attr_table()`.
+    _attr_table = None  # type: Optional[Dict[str, Tuple[str, Any]]]
+    _attr_names = None  # type: Optional[Tuple[str, ...]]
 
     def __init__(
             self,
@@ -695,55 +1331,44 @@ class Colr(ChainedBase):
 
     def __call__(self, text=None, fore=None, back=None, style=None):
         """ Append text to this Colr object. """
-        self.data = ''.join((
-            self.data,
+        self._fragments.append(
             self.color(text=text, fore=fore, back=back, style=style)
-        ))
+        )
+        self._stripped = self._tokens = None
         return self
 
     def __dir__(self):
-        """ Compute the fake method names, and include them in a listing
-            of attributes for autocompletion/inspection.
+        """ Include the fake method names in a listing of attributes for
+            autocompletion/inspection.
         """
-
-        def fmtcode(s):
-            try:
-                int(s)
-                return 'f_{}'.format(s)
-            except ValueError:
-                return s
-
-        def fmtbgcode(s):
-            try:
-                int(s)
-                return 'b_{}'.format(s)
-            except ValueError:
-                return 'bg{}'.format(s)
-
-        attrs = [fmtcode(k) for k in codes['fore']]
-        attrs.extend(fmtbgcode(k) for k in codes['back'])
-        attrs.extend(k for k in codes['style'])
-        attrs.extend((
-            'center',
-            'chained',
-            'color_code',
-            'color',
-            'data',
-            'format',
-            'gradient',
-            'join',
-            'ljust',
-            'print',
-            'rjust',
-            'str'
-        ))
-        return attrs
+        attrs = set(super().__dir__())
+        attrs.update(self._get_attr_table()[1])
+        return sorted(attrs)
 
     def __getattr__(self, attr):
         """ If the attribute matches a fore, back, or style name,
-            return the color() function. Otherwise, return known
+            return a color method. Otherwise, return known
             attributes and raise AttributeError for others.
+            Color methods are added to the class on first use, so
+            `__getattr__` is only used once for each name.
         """
+        if attr.startswith('__') or (attr in ChainedBase.__slots__):
+            # Special names (copy/pickle probe for these), or data that
+            # hasn't been set yet. Looking them up would recurse.
+            raise AttributeError(
+                '{!r} object has no attribute {!r}'.format(
+                    type(self).__name__,
+                    attr,
+                )
+            )
+        table = self._get_attr_table()[0]
+        kwinfo = table.get(attr, None)
+        if kwinfo is not None:
+            method = _attr_method(attr, *kwinfo)
+            setattr(Colr, attr, method)
+            return method.__get__(self, type(self))
+
+        # Names that aren't in the table, like 'f_01' or 'bg__red'.
         knownmethod = self._attr_to_method(attr)
         if knownmethod is not None:
             return knownmethod
@@ -786,6 +1411,74 @@ class Colr(ChainedBase):
 
         return None
 
+    @classmethod
+    def _get_attr_table(cls):
+        """ Return the fake method table, and the names to use for
+            `__dir__`, building them on first use.
+            The table maps fake method names to (kwarg, value) for
+            `chained()`, for every name in `codes` and `name_data`.
+            Names that are already attributes of the class are skipped.
+        """
+        if Colr._attr_table is not None:
+            return Colr._attr_table, Colr._attr_names
+        table = {}  # type: Dict[str, Tuple[str, Any]]
+        # Later entries win, to match the lookup order of
+        # `_attr_to_method()`.
+        for name in name_data:
+            namecode = get_name_code(name)
+            for prefix, kwarg in _ext_attr_prefixes:
+                table[prefix + name] = (kwarg, namecode)
+        for num in range(256):
+            for prefix, kwarg in _ext_attr_prefixes:
+                table['{}{}'.format(prefix, num)] = (kwarg, num)
+        for name in codes['back']:
+            table['bg{}'.format(name)] = ('back', name)
+            table['bg_{}'.format(name)] = ('back', name)
+        for name in codes['style']:
+            table[name] = ('style', name)
+        for name in codes['fore']:
+            table[name] = ('fore', name)
+
+        Colr._attr_table = {
+            name: kwinfo
+            for name, kwinfo in table.items()
+            if not hasattr(Colr, name)
+        }
+        # Aliases are left out of the listing.
+        Colr._attr_names = tuple(
+            name
+            for name in Colr._attr_table
+            if (
+                name.isidentifier() and
+                not name.startswith(('bg_', 'b256_', 'f256_'))
+            )
+        )
+        return Colr._attr_table, Colr._attr_names
+
+    def _color_code(self, fore=None, back=None, style=None):
+        """ Build the codes for this style/colors, without using the cache.
+        """
+        # Map from style type to raw code formatter function.
+        colorcodes = []
+        resetcodes = []
+        userstyles = {'style': style, 'back': back, 'fore': fore}
+        for stype in userstyles:
+            stylearg = userstyles.get(stype, None)
+            if not stylearg:
+                # No value for this style name, don't use it.
+                continue
+            # Get escape code for this style.
+            code = self.get_escape_code(stype, stylearg)
+            stylename = str(stylearg).lower()
+            if (stype == 'style') and (stylename in ('0', )):
+                resetcodes.append(code)
+            elif stylename.startswith('reset'):
+                resetcodes.append(code)
+            else:
+                colorcodes.append(code)
+        # Reset codes come first, to not override colors.
+        return ''.join((''.join(resetcodes), ''.join(colorcodes)))
+
     def _ext_attr_to_partial(self, name, kwarg_key):
         """ Convert a string like '233' or 'aliceblue' into partial for
             self.chained.
@@ -794,16 +1487,71 @@ class Colr(ChainedBase):
             intval = int(name)
         except ValueError:
             # Try as an extended name_data name.
-            info = name_data.get(name, None)
-            if info is None:
+            namecode = get_name_code(name)
+            if namecode is None:
                 # Not an int value or name_data name.
                 return None
-            kws = {kwarg_key: info['code']}
+            kws = {kwarg_key: namecode}
             return partial(self.chained, **kws)
         # Integer str passed, use the int value.
         kws = {kwarg_key: intval}
         return partial(self.chained, **kws)
 
+    def _get_escape_code(self, codetype, value, rgb_mode=False):
+        """ Convert user arg to escape code, without using the cache. """
+        valuefmt = str(value).lower()
+        code = codes[codetype].get(valuefmt, None)
+        if code:
+            # Basic code from fore, back, or style.
+            return code
+
+        named_funcs = {
+            'fore': format_fore,
+            'back': format_back,
+            'style': format_style,
+        }
+
+        # Not a basic code, try known names.
+        converter = named_funcs.get(codetype, None)
+        if converter is None:
+            raise ValueError(
+                'Invalid code type. Expecting {}, got: {!r}'.format(
+                    ', '.join(named_funcs),
+                    codetype
+                )
+            )
+        # Try as hex.
+        with suppress(ValueError):
+            if rgb_mode:
+                return converter(hex2rgb(value, allow_short=True))
+            value = hex2term_int(value, allow_short=True)
+            return converter(value, extended=True)
+
+        namecode = get_name_code(valuefmt)
+        if namecode is not None:
+            # A known named color.
+            try:
+                return converter(namecode, extended=True)
+            except TypeError:
+                # Passing a known name as a style?
+                if codetype == 'style':
+                    raise InvalidStyle(value)
+                raise
+        # Not a known color name/value, try rgb.
+        try:
+            r, g, b = (int(x) for x in value)
+            # This does not mean we have a 3 int tuple. It could '111'.
+            # The converter should catch it though.
+        except (TypeError, ValueError):
+            # Not an rgb value.
+            if codetype == 'style':
+                raise InvalidStyle(value)
+        try:
+            escapecode = converter(value)
+        except ValueError as ex:
+            raise InvalidColr(value) from ex
+        return escapecode
+
     def _gradient_black_line(
             self, text, start, step=1,
             fore=None, back=None, style=None, reverse=False, rgb_mode=False):
@@ -989,7 +1737,9 @@ class Colr(ChainedBase):
                 style=style
             )
             if lastchar >= end:
-                numbergen.send(True)
+                # Sending the stop signal would raise StopIteration in here,
+                # which is a RuntimeError since PEP 479.
+                break
             pos = lastchar
 
     @staticmethod
@@ -1076,33 +1826,6 @@ class Colr(ChainedBase):
                         pos1[x] = pos2[x]
         yield tuple(pos1)
 
-    def _rainbow_color(self, freq, i):
-        """ Calculate a single hexcode value for a piece of a rainbow.
-            Arguments:
-                freq  : "Tightness" of colors (see self.rainbow())
-                i     : Index of character in string to colorize.
-        """
-        return '{:02x}{:02x}{:02x}'.format(*self._rainbow_rgb(freq, i))
-
-    def _rainbow_hex_chars(self, s, freq=0.1, spread=3.0, offset=0):
-        """ Iterate over characters in a string to build data needed for a
-            rainbow effect.
-            Yields tuples of (char, hexcode).
-            Arguments:
-                s      : String to colorize.
-                freq   : Frequency/"tightness" of colors in the rainbow.
-                         Best results when in the range 0.0-1.0.
-                         Default: 0.1
-                spread : Spread/width of colors.
-                         Default: 3.0
-                offset : Offset for start of rainbow.
-                         Default: 0
-        """
-        return (
-            (c, self._rainbow_color(freq, offset + i / spread))
-            for i, c in enumerate(s)
-        )
-
     def _rainbow_line(
             self, text, freq=0.1, spread=3.0, offset=0,
             rgb_mode=False, **colorargs):
@@ -1129,24 +1852,20 @@ class Colr(ChainedBase):
         style = colorargs.get('style', None)
         if fore:
             color_args = (lambda value: {
-                'back': value if rgb_mode else hex2term(value),
+                'back': value if rgb_mode else rgb2term_int(*value),
                 'style': style,
                 'fore': fore
             })
         else:
             color_args = (lambda value: {
-                'fore': value if rgb_mode else hex2term(value),
+                'fore': value if rgb_mode else rgb2term_int(*value),
                 'style': style,
                 'back': back
             })
 
-        if rgb_mode:
-            method = self._rainbow_rgb_chars
-        else:
-            method = self._rainbow_hex_chars
         return ''.join(
-            self.color(c, **color_args(hval))
-            for c, hval in method(
+            self.color(c, **color_args(rgb))
+            for c, rgb in self._rainbow_rgb_chars(
                 text,
                 freq=freq,
                 spread=spread,
@@ -1222,15 +1941,19 @@ class Colr(ChainedBase):
             for i, c in enumerate(s)
         )
 
-    def b_hex(self, value, text=None, fore=None, style=None, rgb_mode=False):
+    def b_hex(self, value, text=None, fore=None, style=None, rgb_mode=False,
+            perceptual=False):
         """ A chained method that sets the back color to an hex value.
             Arguments:
-                value    : Hex value to convert.
-                text     : Text to style if not building up color codes.
-                fore     : Fore color for the text.
-                style    : Style for the text.
-                rgb_mode : If False, the closest extended code is used,
-                           otherwise true color (rgb) mode is used.
+                value      : Hex value to convert.
+                text       : Text to style if not building up color codes.
+                fore       : Fore color for the text.
+                style      : Style for the text.
+                rgb_mode   : If False, the closest extended code is used,
+                             otherwise true color (rgb) mode is used.
+                perceptual : If truthy (and not rgb_mode), the extended
+                             code that looks closest is used, searching
+                             the whole palette (see `rgb2term_nearest()`).
 
         """
         if rgb_mode:
@@ -1240,7 +1963,11 @@ class Colr(ChainedBase):
                 raise InvalidColr(value)
         else:
             try:
-                colrval = hex2term(value, allow_short=True)
+                colrval = hex2term_int(
+                    value,
+                    allow_short=True,
+                    perceptual=perceptual,
+                )
             except ValueError:
                 raise InvalidColr(value)
         return self.chained(text=text, fore=fore, back=colrval, style=style)
@@ -1268,10 +1995,10 @@ class Colr(ChainedBase):
                 back  : Name of back color to use.
                 style : Name of style to use.
         """
-        self.data = ''.join((
-            self.data,
-            self.color(text=text, fore=fore, back=back, style=style),
-        ))
+        self._fragments.append(
+            self.color(text=text, fore=fore, back=back, style=style)
+        )
+        self._stripped = self._tokens = None
         return self
 
     def color(
@@ -1280,9 +2007,13 @@ class Colr(ChainedBase):
         """ A method that colorizes strings, not Colr objects.
             Raises InvalidColr for invalid color names.
             The 'reset_all' code is appended if text is given.
+            A precompiled `Style` can be passed as the `style` argument.
         """
+        if isinstance(style, Style) and (fore is None) and (back is None):
+            if not no_closing:
+                return style(text)
         text = str(text) if text is not None else ''
-        if _disabled:
+        if get_color_mode() is _mode_disabled:
             return text
         has_args = (
             (fore is not None) or
@@ -1291,7 +2022,8 @@ class Colr(ChainedBase):
         )
         # Considered to have unclosed codes if embedded codes exist and
         # the last code was not a color code.
-        embedded_codes = get_codes(text)
+        # Most text has no escape codes, so the regex is skipped for it.
+        embedded_codes = get_codes(text) if '\033' in text else []
         has_end_code = embedded_codes and embedded_codes[-1] == closing_code
         # Add closing code if not already added, there is text, and
         # some kind of color/style was used (whether from args, or
@@ -1316,27 +2048,91 @@ class Colr(ChainedBase):
         ))
 
     def color_code(self, fore=None, back=None, style=None):
-        """ Return the codes for this style/colors. """
-        # Map from style type to raw code formatter function.
-        colorcodes = []
-        resetcodes = []
-        userstyles = {'style': style, 'back': back, 'fore': fore}
-        for stype in userstyles:
-            stylearg = userstyles.get(stype, None)
-            if not stylearg:
-                # No value for this style name, don't use it.
-                continue
-            # Get escape code for this style.
-            code = self.get_escape_code(stype, stylearg)
-            stylename = str(stylearg).lower()
-            if (stype == 'style') and (stylename in ('0', )):
-                resetcodes.append(code)
-            elif stylename.startswith('reset'):
-                resetcodes.append(code)
-            else:
-                colorcodes.append(code)
-        # Reset codes come first, to not override colors.
-        return ''.join((''.join(resetcodes), ''.join(colorcodes)))
+        """ Return the codes for this style/colors.
+            Colors are downsampled for the current color mode
+            (see `color_mode()` and `auto_color_mode()`).
+            Results are cached in `code_cache`.
+        """
+        if (fore is None) and (back is None) and (style is None):
+            return ''
+        mode = get_color_mode()
+        if mode not in _full_color_modes:
+            fore = _downsample_arg(fore)
+            back = _downsample_arg(back)
+        try:
+            cachekey = (
+                'prefix',
+                _cache_arg(fore),
+                _cache_arg(back),
+                _cache_arg(style),
+                mode,
+            )
+        except TypeError:
+            # At least one of the args can't be cached.
+            return _downsample_code(
+                self._color_code(fore=fore, back=back, style=style),
+                mode,
+            )
+        code = code_cache.get(cachekey)
+        if code is None:
+            code = code_cache.set(
+                cachekey,
+                _downsample_code(
+                    self._color_code(fore=fore, back=back, style=style),
+                    mode,
+                ),
+            )
+        return code
+
+    def color_many(
+            self, texts, styles=None, fore=None, back=None, style=None,
+            lazy=False):
+        """ Colorize many strings at once, returning a list of str.
+            This is much faster than creating a Colr for each string,
+            because each unique style is only resolved once.
+            Raises InvalidColr/InvalidStyle for invalid colors or styles,
+            and ValueError if `texts` and `styles` have different lengths.
+
+            Arguments:
+                texts   : An iterable of strings (or anything str() works
+                          on), or a NumPy array.
+                styles  : An optional iterable with a style for each text.
+                          Each item can be a Style, a fore color
+                          (name or palette index), a tuple of
+                          (fore, back[, style]), or None.
+                          A NumPy array of palette indexes (1D), or of
+                          (fore, back) rows (2D), can also be used.
+                fore    : Fore color for all texts, when `styles` is None.
+                back    : Back color for all texts, when `styles` is None.
+                style   : Style for all texts, when `styles` is None.
+                          This may also be a precompiled Style.
+                lazy    : Return a generator instead of a list.
+        """
+        if hasattr(texts, 'tolist'):
+            # NumPy arrays. Plain python objects are faster to iterate.
+            texts = texts.tolist()
+        # The color mode is read once, even if the results are lazy.
+        mode = get_color_mode()
+        if mode is _mode_disabled:
+            results = (
+                str(text) if text is not None else ''
+                for text in texts
+            )  # type: Iterable[str]
+        else:
+            if styles is None:
+                if (
+                        isinstance(style, Style) and
+                        (fore is None) and
+                        (back is None)):
+                    styles = style
+                else:
+                    styles = Style(fore=fore, back=back, style=style)
+            elif hasattr(styles, 'tolist'):
+                styles = styles.tolist()
+            results = _iter_color_many(texts, styles, mode)
+        if lazy:
+            return results
+        return list(results)
 
     def color_dummy(self, text=None, **kwargs):
         """ A wrapper for str() that matches self.color().
@@ -1344,62 +2140,40 @@ class Colr(ChainedBase):
         """
         return str(text) if text is not None else ''
 
+    def fill(self, width):
+        """ Like `textwrap.fill()`, but keeps the colors (see `wrap()`).
+            Returns a Colr with the wrapped lines joined by newlines.
+        """
+        return self.__class__('\n'.join(wrap(self, width)), no_closing=True)
+
     def format(self, *args, **kwargs):
         """ Like str.format, except it returns a Colr. """
         return self.__class__(self.data.format(*args, **kwargs))
 
-    def get_escape_code(self, codetype, value):
-        """ Convert user arg to escape code. """
-        valuefmt = str(value).lower()
-        code = codes[codetype].get(valuefmt, None)
-        if code:
-            # Basic code from fore, back, or style.
-            return code
-
-        named_funcs = {
-            'fore': format_fore,
-            'back': format_back,
-            'style': format_style,
-        }
-
-        # Not a basic code, try known names.
-        converter = named_funcs.get(codetype, None)
-        if converter is None:
-            raise ValueError(
-                'Invalid code type. Expecting {}, got: {!r}'.format(
-                    ', '.join(named_funcs),
-                    codetype
-                )
-            )
-        # Try as hex.
-        with suppress(ValueError):
-            value = int(hex2term(value, allow_short=True))
-            return converter(value, extended=True)
-
-        named_data = name_data.get(valuefmt, None)
-        if named_data is not None:
-            # A known named color.
-            try:
-                return converter(named_data['code'], extended=True)
-            except TypeError:
-                # Passing a known name as a style?
-                if codetype == 'style':
-                    raise InvalidStyle(value)
-                raise
-        # Not a known color name/value, try rgb.
-        try:
-            r, g, b = (int(x) for x in value)
-            # This does not mean we have a 3 int tuple. It could '111'.
-            # The converter should catch it though.
-        except (TypeError, ValueError):
-            # Not an rgb value.
-            if codetype == 'style':
-                raise InvalidStyle(value)
+    def get_escape_code(self, codetype, value, rgb_mode=False):
+        """ Convert user arg to escape code.
+            Results are cached in `code_cache`.
+            Arguments:
+                codetype : Type of code, one of 'fore', 'back', or 'style'.
+                value    : User arg (name, number, hex, or rgb).
+                rgb_mode : If truthy, hex values are converted to true color
+                           (rgb) codes instead of the closest extended code.
+        """
+        if isinstance(value, Style):
+            # Already resolved.
+            return value.code
         try:
-            escapecode = converter(value)
-        except ValueError as ex:
-            raise InvalidColr(value) from ex
-        return escapecode
+            cachekey = ('code', codetype, _cache_arg(value), bool(rgb_mode))
+        except TypeError:
+            # Can't be cached.
+            return self._get_escape_code(codetype, value, rgb_mode=rgb_mode)
+        code = code_cache.get(cachekey)
+        if code is None:
+            code = code_cache.set(
+                cachekey,
+                self._get_escape_code(codetype, value, rgb_mode=rgb_mode)
+            )
+        return code
 
     def gradient(
             self, text=None, name=None, fore=None, back=None, style=None,
@@ -1599,15 +2373,19 @@ class Colr(ChainedBase):
             )
         )
 
-    def hex(self, value, text=None, back=None, style=None, rgb_mode=False):
+    def hex(self, value, text=None, back=None, style=None, rgb_mode=False,
+            perceptual=False):
         """ A chained method that sets the fore color to an hex value.
             Arguments:
-                value    : Hex value to convert.
-                text     : Text to style if not building up color codes.
-                back     : Back color for the text.
-                style    : Style for the text.
-                rgb_mode : If False, the closest extended code is used,
-                           otherwise true color (rgb) mode is used.
+                value      : Hex value to convert.
+                text       : Text to style if not building up color codes.
+                back       : Back color for the text.
+                style      : Style for the text.
+                rgb_mode   : If False, the closest extended code is used,
+                             otherwise true color (rgb) mode is used.
+                perceptual : If truthy (and not rgb_mode), the extended
+                             code that looks closest is used, searching
+                             the whole palette (see `rgb2term_nearest()`).
 
         """
         if rgb_mode:
@@ -1617,7 +2395,11 @@ class Colr(ChainedBase):
                 raise InvalidColr(value)
         else:
             try:
-                colrval = hex2term(value, allow_short=True)
+                colrval = hex2term_int(
+                    value,
+                    allow_short=True,
+                    perceptual=perceptual,
+                )
             except ValueError:
                 raise InvalidColr(value)
         return self.chained(text=text, fore=colrval, back=back, style=style)
@@ -1656,6 +2438,12 @@ class Colr(ChainedBase):
             no_closing=chars and (closing_code in chars),
         )
 
+    def optimized(self):
+        """ Return a new Colr with the fewest codes that display the same
+            colors and styles (see `colr.sgr.optimize()`).
+        """
+        return self.__class__(optimize(self), no_closing=True)
+
     def print(self, *args, **kwargs):
         """ Chainable print method. Prints self.data and then clears it. """
         print(self, *args, **kwargs)
@@ -1752,6 +2540,164 @@ class Colr(ChainedBase):
             no_closing=chars and (closing_code in chars),
         )
 
+    def truncate(self, width, ellipsis='\u2026'):
+        """ Truncate to `width` terminal columns, ending with `ellipsis`
+            if anything was cut off. The colors at the cut are kept, and
+            closed at the end.
+            Returns a Colr.
+        """
+        return self.__class__(
+            truncate(self, width, ellipsis=ellipsis),
+            no_closing=True,
+        )
+
+    def wrap(self, width):
+        """ Like `textwrap.wrap()`, but wraps by terminal columns and
+            keeps the colors. Each line re-opens the colors/styles that
+            were active where it starts, and closes them at the end.
+            Existing newlines are kept as line breaks.
+            Returns a list of Colrs, one for each line.
+        """
+        return [
+            self.__class__(line, no_closing=True)
+            for line in wrap(self, width)
+        ]
+
+
+class Style(object):
+    """ A precompiled fore/back/style combination.
+        The escape codes are resolved and validated once, when the Style is
+        created, so calling it only needs to join some strings.
+        Raises InvalidColr/InvalidStyle for invalid color or style names.
+
+        Example:
+            error = Style('red', style='bright')
+            print(error('Something went wrong.'))
+            # Styles can also be used with Colr methods, as the style arg.
+            print(Colr('Error', 'blue').chained(': bad value', style=error))
+    """
+    __slots__ = ('back', 'code', 'code_bytes', 'fore', 'has_args', 'style')
+
+    def __init__(
+            self,
+            fore: Optional[ColorArg]=None,
+            back: Optional[ColorArg]=None,
+            style: Optional[str]=None) -> None:
+        self.fore = fore
+        self.back = back
+        self.style = style
+        self.has_args = (
+            (fore is not None) or
+            (back is not None) or
+            (style is not None)
+        )
+        # Always resolved in full color. Other color modes are handled when
+        # the Style is called.
+        self.code = Colr()._color_code(fore=fore, back=back, style=style)
+        self.code_bytes = self.code.encode()
+
+    def __bool__(self):
+        """ A Style is truthy if it produces any escape codes. """
+        return bool(self.code)
+
+    def __call__(self, text: Optional[str]=None) -> str:
+        """ Colorize `text` with this style, returning a str.
+            The 'reset_all' code is appended if text is given, just like
+            Colr.color().
+        """
+        text = str(text) if text is not None else ''
+        mode = get_color_mode()
+        if mode is _mode_disabled:
+            return text
+        if mode is _mode_truecolor:
+            code = self.code
+        else:
+            code = self.mode_code(mode)
+        if not text:
+            return code
+        if '\033' in text:
+            return ''.join((code, text, self._embedded_end(text)))
+        if self.has_args:
+            return ''.join((code, text, closing_code))
+        return text
+
+    def __eq__(self, other):
+        """ Styles are equal if they produce the same escape codes. """
+        if not isinstance(other, Style):
+            return NotImplemented
+        return (
+            (self.code == other.code) and
+            (self.has_args == other.has_args)
+        )
+
+    def __hash__(self):
+        return hash((self.code, self.has_args))
+
+    def __repr__(self):
+        return '{}(fore={!r}, back={!r}, style={!r})'.format(
+            type(self).__name__,
+            self.fore,
+            self.back,
+            self.style,
+        )
+
+    def _embedded_end(self, text: str) -> str:
+        """ Return the closing code needed for text that already contains
+            escape codes. Mimics the closing code rules of Colr.color().
+        """
+        embedded_codes = get_codes(text)
+        if embedded_codes and (embedded_codes[-1] == closing_code):
+            return ''
+        if self.has_args or embedded_codes:
+            return closing_code
+        return ''
+
+    def bytes(
+            self,
+            text: Optional[Union[str, bytes]]=None,
+            encoding: Optional[str]='utf-8') -> bytes:
+        """ Like calling the Style, except the result is encoded bytes.
+            The escape codes are pre-encoded, so only `text` is encoded.
+            `text` may already be bytes, which are used as-is.
+        """
+        mode = get_color_mode()
+        if isinstance(text, (bytes, bytearray)):
+            data = bytes(text)
+            if mode is _mode_disabled:
+                return data
+            if (
+                    (not data) or
+                    (b'\033' in data) or
+                    (mode is not _mode_truecolor)):
+                return self(data.decode(encoding)).encode(encoding)
+        else:
+            text = str(text) if text is not None else ''
+            if mode is _mode_disabled:
+                return text.encode(encoding)
+            if (
+                    (not text) or
+                    ('\033' in text) or
+                    (mode is not _mode_truecolor)):
+                return self(text).encode(encoding)
+            data = text.encode(encoding)
+        if self.has_args:
+            return b''.join((self.code_bytes, data, closing_code_bytes))
+        return data
+
+    def mode_code(self, mode: Optional[ColorMode]=None) -> str:
+        """ Return the escape codes for this Style, downsampled for a color
+            mode. If no mode is given, the current color mode is used.
+        """
+        if mode is None:
+            mode = get_color_mode()
+        if mode in _full_color_modes:
+            return self.code
+        cachekey = ('downsample', self.code, mode)
+        code = code_cache.get(cachekey)
+        if code is None:
+            code = code_cache.set(cachekey, _downsample_code(self.code, mode))
+        return code
+
 
 class InvalidArg(ValueError):
     """ A ValueError for when the user uses invalid arguments. """
@@ -1872,9 +2818,16 @@ class InvalidStyle(InvalidColr):
 # Raw code map, available to users.
 codes = _build_codes()
 codes_reverse = _build_codes_reverse(codes)
+closing_code_bytes = closing_code.encode()
+# Cache for escape codes built from user args, used by `Colr.color_code()`
+# and `Colr.get_escape_code()`.
+# It can be cleared with `code_cache.clear()`, or resized at runtime with
+# `code_cache.resize(maxsize)`.
+code_cache = LRUCache(maxsize=1024)
 
 # Shortcuts.
 color = Colr().color
+colorize_batch = Colr().color_many
 
 if __name__ == '__main__':
     if ('--auto-disable' in sys.argv) or ('-a' in sys.argv):
@@ -330,6 +330,7 @@ class Control(ChainedBase):
     """ Like Colr, but for control codes. It allows method chaining to build
         up control sequences.
     """
+    __slots__ = ()
 
     def __init__(self, data=None):
         """ Initialize a new Control str. """
@@ -385,9 +386,11 @@ class Control(ChainedBase):
         """ Return the last escape code in `self.data`.
             If no escape codes are found, '' is returned.
         """
-        codes = self.data.split(escape_sequence)
-        if not codes:
+        data = self.data
+        if escape_sequence not in data:
+            # Fast path, no escape codes at all.
             return ''
+        codes = data.split(escape_sequence)
         return ''.join((escape_sequence, codes[-1]))
 
     def move_back(self, columns=1):
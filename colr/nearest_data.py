@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+
+"""
+    Colr - Nearest Palette Color Data
+    Built by tools/gen_nearest_data.py, don't edit it by hand.
+
+    The MIT License (MIT)
+
+    Copyright (c) 2015-2017 Christopher Welborn
+
+    Permission is hereby granted, free of charge, to any person obtaining a
+    copy of this software and associated documentation files (the "Software"),
+    to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense,
+    and/or sell copies of the Software, and to permit persons to whom the
+    Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in
+    all copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+    THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+    FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+"""
+
+# Candidate terminal codes for `rgb2term_nearest()`, for each 8x8x8 cell of
+# RGB values. Cells are in (r >> 3, g >> 3, b >> 3) order, and each one is a
+# count byte followed by that many codes, in ascending order. Every color in a
+# cell is nearest (in OKLab) to one of the cell's codes. This was built by
+# checking all 16777216 RGB values against every color in the palette, and is
+# stored zlib compressed, and base64 encoded.
+cells_packed = (
+    'eNrt3Ge4ldW1PvxrjjHX5uvfjkZFRbDHGAUVgQgovVpQ0FAMiIUiKhELaASRpiKoSKyAESyI'
+    'haIgsWuOLbbYFU07J4nYe33vMcvzzKettjdq8ubMMeZe5Lq8x7O258NvzrWQ/t//0f/7P2UW'
+    '/d8/eJP/+4faJF6kN1FaadKbKizadDPlFm22uXKLNt9CyZJ/PlGb1BsVRSgs+sc/eRPbqTBE'
+    'mbQgKzftH/9MlfonbSJV+3vcQv3TLvrnv6LiTfBjE1M6+WQV48IYlDKL/vUOijdB603eIf1O'
+    '3sMV5Jl/NLcUFr2zgfU7G7Te9J0N/ldX+IRx6JbmH1Y+IlVqA2/a3DRt2pw33aw5bdacN2u+'
+    'NW3mijfbfGvafGsbuw1vvsU2Kk5G8ZZ4LNcmzy7a8K4tbr7hXdXcLmq+tXILkbz51tsgUmHR'
+    'FtvwFtv8hLaQUlvaRVsidMO7esutkJJq2spW85xohG9tUk3yNj9RsraMF225lQpWMiR8xEop'
+    'ZYOqS8nm1JeituQtt9ouSGnYihu2ak4NVQSRLKIto2LacjupraQQsx3SUKpBNSDQVfMW3Hzr'
+    'FmSKt26xA2+9zQ7ki7fZYUfe5ic7kik7wS+i7ZRb1CAluW61sIta7KCiRTvsqLCIts0W07ZR'
+    'mInjhu22p4agtm+RE+oi1bbJlQxD0HbbK7NqTUkHqXQOUqIg//623SlVvO1OLWlbKd52u5bk'
+    'i7druTNttzNvt/3OZIq337kVbd+Kt2/Rikxxi1atqUVrbrFDazLFO7TehXfYcRcypXaKF2HE'
+    'Ti1VtKjlzsot2rmVcotatVZuUetdlF07VZWDlPJBO2WCEim5QdXEdOWdWnat+o0hxiTRTrum'
+    'infadTfeabeu0oQfLfGj5W74sbs0tdxdt9x592608+4o3nn3PWjnPXjnVnuQKW61x57Uak9u'
+    '1XpPMsWt99yLWu/FrXfZi3bZS+0aL9p1N5SKFu22u3KLdt9DuUV77Kncoj33UnbtWlUOUqIg'
+    'xOQk7VouCTlFUWVzaNfeKN51t960W28f1Yd3270P7d7HhvXl3ffo69P68R579vN5/XnPvfqr'
+    'vWjXn4ald/3p3r3Nxrvu3ZtM8W5R/0yjMeFnfQg/dseP3X+md//ZPhizT1/Cjz3wY4999B77'
+    '/BzD0Hv+vB/t+XOU3vPn+2Ikeq99+9Ne+6qfxot+ujdKRYv2/plyi362j3KL9vm5cot+vq+y'
+    '66dV5SAlCkJMlIQcHxVTr3HaS1lPifYS4KtFVf9QXnq28q2XzaloPWWpJ0Cr03opoDWR9lRC'
+    'epWxl/tei7WnMthjvemGKrVXjnpOZ9VYDyxz2CPvvWLqVYU9m1iz9bzz8Ifm7/5orIeY7xd7'
+    'QFmx9pz1mtZ7FmTfO/eAoe/LezlO+y/46gRfEdQaK77qU0R736v42KrPkU+DfN0T5tMwX48f'
+    'Bn1lqPb9qM+ar0nZx7v+tHfsPqqGfeh9qnAffvT//uGHlJrk1/TXc+6GrvL1XEX+pdwmaeH9'
+    'XDEBVTkBRld1zmw1CzCrP+83pMVmq+XNbhHwLwCgY2DTEDDkW3zfV6MAc/UXma0yAS3XkgYE'
+    '10IBSucQsFiBwX3fj0mB6gdAoKrPgCkGCgLJO7AuBQYOLEagYSA3NG8BBFLTGpAaWjQ1Arlh'
+    '+xaNU6CqB4EQ28HSTcdA3rblwRoOPDhW4I9VglXd2H0/EnQXf0kKcsudu/n3xju36l4tBkWC'
+    'Gu0pmNUgt4QEW1oNCgVt79E95UFutWePLAg1QNjzRyNCBBWTUG10EcKDAQkBwsCEEGEWhSLC'
+    'Cio0Ikyz0JDQbBSxEN3PuJAsC11bF9KPloV593iNsJwTYUy6JrvKc7VJjS6MXROS0N/rxXd5'
+    'TQFD1SgXFqIwdmHRRWN1MEyxrg4YFpEwYUPoTQOH7zodJmjodOgYl+KhhRwAF1WeDB0OySsu'
+    'nyjK09DLybnQdB4L/yvDNA6bnIYiGlHhf2VYmwxpW8NCypUhBQ9UmYbiQtstDzZdxoYCw//i'
+    'UKXeU1enQzLlo7rFPKSdu8c+pFY9uFXrHjaPW+/SUzppRACxqwFisRI12hCRYiVqdHdhIkdK'
+    '1FBijxQTNZiIoXv1/HeBYgJ39VAxYqKrKA5SzMciiRcradFTMeIilcUilbWicaLHIv2bWTGt'
+    'u8hjtX0rL3PnV4/uyn7uW/+1X/Yrfk36LT9PxXKf/FbEYoVv+iW/5lcrGAs+AZZPkaFFe/fX'
+    'aC/GshPQ2e8QVu/F+OovLcaUFl01r46MsagiLm7pM1Q1XERiOaNBVe9KRzH/EWqM4KiBxnZm'
+    'c3S03/urx45ej2k6xh/+OjnGnyr/l447puCYZ0f4rlM9eNSA48FmEzpSnh55u507afCxU+BH'
+    '3r5VZw1Adv63F2TNHxBncqwf8xQJQzpGkkgSigwg6RjpKUmte+ZYUiAZYRKMco6MKWkYmbak'
+    'cWQCk9KGkpEn2XISP3pGnuSNyknVJJpM3xWq3UR/0jYvwp+s+MNjtaeFn41Le3LX3ipCpSWl'
+    '1O62+rraw1Y/V5JsSSkl2SEnpQk/Uqgk48neoSdDUnIkSkCyr9UkR6KEJPv1F1JyLEr0gGJQ'
+    '/kCk3CiXfKkPgBvHwAQFm/bCMPwkuaQ3afOvOj5LLvw4uem+Tpjzl0fq+j5h/l8eMaBsu6G0'
+    'afO2cnO4WfO2tFnzsv9atij/0XTintDcFTZKlUWgNB6MVFn4XcCEuGjLd0NWKrfo3fd4K9sa'
+    'qnyvPL7KqNKn+KatpCDV95pYl7V89dE8XrvG+tJKsB0qZUwrzPhvq9RmTEUavmxntu9bmULC'
+    'jcrM0HRFQqzuU+dy1LTMdBVYk7brJNT03KTtO/P2LUzbvC4woGmbeQgQeEjMTt52p4N9W3Tu'
+    'ZNCZcKeGOTsJOk1vb1sDnZ3NJvRkK0/86KJBTwxsjRc7tO5i6XmIBj+x7bjLIbkAVY32Z45i'
+    'KwLUf5icuX3M/2Ca/OVj+Ml0fPEYMDQEaFQqcqhVaAxRy1ApyQVDnURJosFQJ1GS6uUBmujQ'
+    'oY6i6ARDySi0W/eYomQK/uzeI5YoWYiKQiOJkoUoulexQ39gicYfWlf+KiNFH10LRym6jPQg'
+    'zWLUeNSLlHfr3Sc0Ke/ex4lUSTTv0deJVEl2LFKDUtprABmIRlWdSKHRPuEFpxcpZ0FKkUc1'
+    'PDpg44A056a0TpA6Pbb5579gM3FfG1uQFbpNW9Jt4aC2tGnbmikZhTLUV5SK4k03a1sPK6mN'
+    'SXbpPlpy686OhMlwqsEq0iHMKDlOheLa7k+bSZX/tDufm22kkPpONpmjYBQQt399H323eWdD'
+    'g960Tdt3DD1tvHnoRL5G/gGMps1dQYmma/iepKBWZEvNkw/v86NsVAkIPeBA3uKAA2kLXwW5'
+    '2a9LcvO2MkQ33xpTto5Lb771/gdg2wZPHrcftc2BGuTFC9vBx+TF6lVWvjWx11YA3qgY4CUP'
+    '1CrFiygAEFreMhe8xeatcDsLXYpVKeRqPey1UC1Iq4G+It6wUaodQ76m7efo+PGBdAn8PQiv'
+    'mn9gxdqemrcHWtvT1u1lQAcUyNrBzuiIglc7Jj+sb4digqtNZf+2jaRqWBi5LdpbBneQ1uAw'
+    'tm126GAp3FFag8TYfrJjR4iYf7LjLwpMXL2KVQGKNUR8sNmCS06gOPk3e6p1cWTZ1MWp46yH'
+    'cQRZWV6xsmLGHpwt5YRsqpMtSSU4eftOnRHrkkmqiy3j5B26HAIj25IRvOMhh9KOh4ZMlqad'
+    'AijHXEZ3irBMpiDkTjGTyUo5YrLZCD8h5UPEyaZBZYKWgeVDecddDq0OuTVpOfeOtWYv13HP'
+    'mhKuu2d1wFXmi51ZNytrZ27ZtVtEZyXJvHM3J2clydyqew+brQDYHj1tsr/H3aVnL/CZdu0a'
+    'VlrOEHPXbkJnqNGp2cOZIzJ7NbPc3CbNTGCzFbOGmHuVJ3No3ZrM7JlbyObwL+zsGf6FnRjO'
+    'WeE6ONf4QX5w7Sp+JvthfobOjs9i59jPKuCzSuhZYfGecrnaz9lZ9ee9+g9I8VnsnONnBp85'
+    'cZ8LPHNoZ87QmRNyZsCZyrk59G5NcMbjHiadiMLDHm6T8JRHSNswPN6R0jYPzzZQ2gh6v39G'
+    'xftBuPtZ7kqrNn5Rm7bKrUCLBS7SmydIFOS6dqKGelE5I7i2Calo/3l9m8SA+uNz7mvF1NKA'
+    'byqb2u6vqv/VFF7fWlSb+HS4XVxFcP5FrmjadtsNmWBC6v4HKLcq0Dbvq6QIfVcQTW3fNbFh'
+    'so8lpB5woLJrgyr4O0WBYIuszKAykHQA+WIgmbY5EFQ6kExVqWPP2nfLmtHngnteyLxlOwvl'
+    'kMh1W9lfmLYTKsu2VTvrZOUWb/Xe+xpUfp/RVcVGtI0KCG+HoHYmLNvN36fm79tg41FpHx+J'
+    'tOwAJYQ2hbiDEo1nx9b8oPYfkAFvZN4OUcGlHTpa8dqCSTv+gn4ilfa1ckt4XUIfJKre7qAP'
+    'dMNWya252doLt9sH1uat21c3OBR3BXRTAyaA2y3ag9mIbyEFEnbgHToYaJMpFm0D278QalOh'
+    'tm16NMDdGFf2NguIgzbcTupYg9t2i2+jgwtfq+RYyokb3zJONtkJKVsl+/vkFp27FEtZ72CZ'
+    'LJWI9wsDeLuDXb7CEobHFFfJfEpDfEeBsJ1g7B1VGuHA98GdROGgpwM4ikFw4FP07asLyyW1'
+    'xTfD3tRaysmbAW9KubtYy1XCOyFlp+XEF1v9l1udlAu+lRB+wbVIyxXvmU1+hGU/oUjMgcJV'
+    'nsYVlkjcaVxhSbgboBIYV1g5Euf0lynkEhsSpxTEOe1wdgwnq/A9e4jAY4QzDE5NTPCEl/Mu'
+    'm/1XH5yXg78pJV4OvvwqXi6+c44vnOPL5tR9s/0SRHzhbL8FEZvZXjk7N6ve6RXfZSuzJFha'
+    'mSWx0irCuFG42kgSpxDiovCNKHH66WG2PMbJe5z2Plws7j1OPzMYJ+tx2sdgnKzH6ecDQ5Cr'
+    '/fzi/dr8SzpmeJEG83FlQmi/f9mSJGrzr9qiLNKijKj0fk7A9cfxfkgIOsvqWjJTSfElcpt3'
+    'PHhrCyxzWyxh1MZW1e+50hcguI3Ts5Fzxs65j1jm+7ORbhGnwef3ivxMW0tkqGfzuIBusZcD'
+    '7gpxdfP2kh9fX1otVqR5u3d9G+1yuzxD2wJ9m7c3bdWItxLQLXNXGlyXhixt954ti2l67/2o'
+    '8Bbw05vUpCdwKPFc7EM/wS5MgNwtqKMJCkvk+35Cvpx+G2UM2i65MCKGNZnig97/oCQzPvDG'
+    'VljxDIWVmKA6cvweDG2TMyyqGaQmX9zwwYe6ob3blJlA7U206kAdEGkXdfyFworMnINn3q4d'
+    '4rZz/cGHvqkBP9q7NpTmjKQphDTD0WQYTXRwqjj8jgMmdZKmhk7u7rqztG6Iv+XgWOrI69RL'
+    'Fr5pVbshmSviWNeiUzekKgDLsCSCVWIl/GsInAfgeIYy8fEI5S+iUerg9JJoaeUWIbYTMmVR'
+    'Z4TZRV2QI4sQdcih6tC0pDNX2sA0lbU0t8ITV4np9G1x9gsW8V/vCgGc+vtdwV1xnn+pZXX8'
+    'Jakeie9aJPBrv2yRy996rqJDAYt/nYFV1/SSZGnlFiG2mzE1cpHZ3YBa9aAextKyqGcvtRE1'
+    'LZTO43QSwTGps9/+LfjPRwXfAN6r/G10pN96rqMFqqjETXRSv9nL6ILvcqRvowtljfTeDtWI'
+    'RaRHNSHPk5r6OU6r/tR/gBpQ4UshltJ1c5ryNA1IV7iPhqfj62h7Ie1RHcl338jTCVhT5Gqo'
+    '2sGaJBeqDmENVoeyhqsdrUnyad+jYlqLi9uoNrmyriyvamNyQJgbAprH5nUhFXJiBEYP8o6t'
+    'VFgNUVGEDwJ19wsvjK2ha2O5y9gv997YIXpDTTDfUHBnLIK23dYjuvBmO37PxXpOXA9D0KXm'
+    'bdsLeNu2L8HR7Tto7B3KXm5TuwjM2S9SOD8Lndu/pwTODmpQuWkNnXcowdByb3hA1BqQxosD'
+    'O5ZAabk/PNA0ZtniQko79ra3A/NgWAU/I0SHfI6KwejIhBEL82AYMpMFy+1CKXvPtndpgTEr'
+    'hdnAkMRxw8TtP6gjj9odhEgv4INAVFMMAVP7yghmandwXmsg+GAL4U4a/YHertMHH5YaZNcN'
+    'nSINOxBD3J0/bICIO3f5ECLuoqFiWM92CTDuAjt26AjuxV0Cjw85VAPIh/KOtvONnGClMzKK'
+    'G0SwnfEInVG6IaFLEWyCl8kvO2SM6X0ZX99iQoRk60yXbqXpkq02Xao6tEa2RnKN3GrkqnKS'
+    'AGw8Xe0A5p0O7hq2BoAhsIO7phXMLTt102Bwt8jBGg6W/3hU5+6xhLlVF/mvAnSB+Lr0cBbm'
+    '1of0lNbQcE/HYd7l0F5NwNZIrvnXtmld1spWap24t6Xi5Fy1SrKKLoNDt0Z0BVyNXbMKJjxn'
+    'oYFVWQLzrl17S2sAuDflIlgDwX0SCtZQcN8EgzUY3C/hYA0D909COO3V9G1wvlgth6MbWwvi'
+    '6MLW/ecQArRGbs37+nFjboRz6Bp8P0MFt8JFN8LS8ZWwtBqQa+HGcLjM1TLtXROHrYVzPJym'
+    'a+JOuOhW2LvY4dXTOParofG+R4XhCsu6mPc+7HDrYlfI/9nhR1gbS2HAPkccaXEshQk/P3Kg'
+    'TZfadyDvO/Aoya9WyJWMthFCUjn1Yd1Kuwatpy/TJSAGrd4vugiuPs9TewMqoeP9rGbbbPCO'
+    'dbFVHwTK3wXbRFtVPmPlC2Bu8+572qi4LVTZtr0WFzNYTKaS/0pSMjY4puIrXwNWj9VQk3RA'
+    'B4aJ6QBXDA8TSAwM04FS4rWIwQkKq8TVbwKrORjMcNDCN5ZqutrXYV9q9z7Ki5cOahx9EaXb'
+    'Jcj7fqTWevEr8jUduTej38S/nrL8jQreFbW1M63bCXZdU6cPlVn04Uca4v2oJOD9iNp3YXiX'
+    'TDGsy6Au+WIol4FcMlVehxB2J8TqBr8xmjp/lBReBnlpLiapaLCoylixEJ1lyVkrXqt+nOju'
+    'FkgNiltG3U1aA612E7oy5AqwCso6mTZ6BVm7azQU2Rlu7Qy3ArAEw4KvoGQXoLWL1SsBsPBr'
+    'L+i1F14c2ksIWx6Xud8J8LbM+0qAvxLtVZ6WhoOqsgazrCyLyiKgqqbzqZdp1LvZDnnaR4Oo'
+    'EFi3PgFSIdS+GkrtGzBVw6j93AapstWqBlWBsp79LVbR8k1kYBU26zUg+VXcOiipUpLcM5Bk'
+    'BpMFlMz9qm9s1MQXDLKYrJqSkSZhSaqDpapApfzT3odJa4A02HLvavscroHTw+O/wwedHqHB'
+    '0yPiv8MHnx6pAdQjQ6H2H6gh1IExUXnfAUflX6+aihXp7lgjRbpL1kiR7pY1VqSBpEWkOPKw'
+    'cCWUqrBioyqsWKgKK/apwop1qv79cFpDSuZh6r2OBiYTIq3VpFHxfkCj74ik79aW6QOK/oMM'
+    'BqSiyBpcqspfqhqTtrEeRUGmgUhRvP8BprPvv9zdaezH+P40ybyESaWSJM18/SD5BQSxqIut'
+    'haPJm9Pgywbix9CjqnqOxpenFN6iavleQR0klbj48jT+HgE8ytlvEFQHUkCxXRKjsUcNScuD'
+    'NHSo0yhDowSMtuv0oTR18gwFQm1xe+FoIyCadB53Qlwnh88IoHjV5aN8OlZh0NCOtSNUNYFB'
+    'qzFxytYqi1AUyNnVAJTgUOiTTLHQE03Qp8ATTfgBelLnHvjVCTpRDHZSl57cxYATxSAnHdKL'
+    'AU5KetNgsy4U9qoHhf8OvCRI0penJTQpCOsadUl4eRKBl9BlX7OJLk0DmAxfApVyzdfd6pK7'
+    'W1xClnLd16O/ISaZAizl0q/nACNM6jVAlfurXikAqtB/qoh/A8qRzaCtvP6c2poIkirXkdy7'
+    'zynSeWHct9+pRZQksNEUtBi1+w9A7N378FPMVoIk5SUcydaS+AFE9jlifEk4OZ4tJ/EDjux7'
+    '5KklEeWpbEWJHwNLIOXA0wSVkKTvo0pQ5VGniysz3kvcTKrkxaRK3ksK/OJbSYFfcCeZ0qSP'
+    'Vm4RMg83kEToEUdKqLKSPHKgZCoLyYFHSaTaSI7cqASs5VHUfqzqiyHzT6dKI2wDq9CTXKpE'
+    '0/imL8zZ8G7eVlJtBgkuB5mmNoPwwCUzg0rVaNCE4C2jN5gm5coujdT34g3Bg1y4qwooLntB'
+    '6cSJ3FKpTftBsgOeXAI70RrdAVuAT+dPGRDcXjor591YBpeWBoyBE8vwU5XRZ+H1ZXwdWrVA'
+    'Ex/dq8qf3Neqz/CTe+n6+PlBgp/uGlO02Ah/UrbaV6lPhjUL2hPU8lOISMkShHL7LjUblDgu'
+    'hqekvdA+kjmglBNozQ6NUysLsrIhcwRZ9iP4QorieUZINxajLBA13W2EtIZGR+Ry1FFUWnfu'
+    '8cmnJYD0k09rJil9ryINHVmOpKrmb5Jmn+ck7trNNHU7yWedDC6e7MNGQ4mj/TvkHj3HJD/f'
+    'D2WKKglKT7I7dw3aypTFpKb7niyt4dKTWUxqut9oDZKOJrBURGq6/xgNlI6xKmVBac8BYzVM'
+    'OjaJUmO+fECWvfSrBNGa7iEH1OLHqjFKvU+JSsLI5lGf8Sju03c89R0vcaeiBKUkLqV+p6G4'
+    'X//TbObpKO4/4PTQpr0PE4MedrjbY5majfdG97ENjx5+xHhDU7OxNIQKkR5x5KkGp2ZjaRgV'
+    'MD1y4Gl214DqadpAFQ2cDjzqdLtrYPV0LVil0Kpek6EolYGqcisGpTWqciviZPq2E+ot1CkF'
+    'OKXApmSzsgATzQnCBhkaOdFFQKrGSIWuk8gotWkzfXIi1QQ3QSwZwqUYV6oyWbn/I0BWVQ4V'
+    'vh1D+x9TKMTE/0GdrCLJxqn4NUSJkOH+PtUWRHgsHXBs+ppTRZK1xQo2RGs1yJpTmga9pxAv'
+    'pUrxIw+mIF/vf8AxMiAqmPOXZEr83M7Gpjt56TlISpdgXMZGpfYovOrQILwdjLfQIdENQG7H'
+    'YzCoY6JLwO6xMpcP/IXp+Nuk+deiVX6l9MCOGtj9pVD3F5XvRlV8M1qDdPNvRuu3rm530JD3'
+    'S7KlPqlPf1hfpU6p3RBbEvyB2cp8Yl9FaBQYJA8J0pRb1qTSw9Adhkm7M0mHjsPTV6/czha0'
+    'O8S3hnndhvb0LeCvbt9lmN86dBkG/A6X1kAwto6HDLcAPk5aA8LYfnHocZbCIYNRiok7oSIJ'
+    'Gww7/370sW8NC39cFsOp3FjEUbhc+HaWC9+PPqbOrmDsj3MhmjEtokb41oJaHcqWOo1E+Ejq'
+    'PNLiFs97/CfloEwHj8iWJJIpk2hLcrnzyE+osxQe+BOEf/IpdxkF145CAbSm6ZATbAG0J5DU'
+    'iUDziHRrQHqElzThR6eoR2pIGgNt4zfVfWQJLYzuDkYbUduti91GfVoCqkfJy554hp6jSsD1'
+    'KDxAT9MawMaLXifoQ3udcCIf2uvEssSuT9ketKrW+9qUkGFjW0VC9kp2RibLZOoxJlTyWO7Z'
+    'a6wyUD6psLrZOjkqE9/95NGItiUDuMfoMUi3BRSPGYt4WzIEJh47jnqN4669Twpbi8W1Bzn5'
+    'EpFrNAzex2JcmmBykBwO79tvtIBcmuBysBwz+/W3m7AcFpceK63h8rEG5nD5OO41YFzZe936'
+    'ZJ62dEbT8YUsorx80zoPMe08XYepScJjVJN19Sm5pSQcxX1OGW/zpfrCz+NPtQOk+sHNp55m'
+    'J8iQ/qedLm1nyJgBp0+gARPE7ImG26UpWRpmH6/F7ORLg+unauE6+dKQOmQOo5MvDaKD5MA5'
+    'owk8h84n8ICjJhRpOulpI2oVg1rFns7CHA/+a+lEFB9+xBlO+UccOVHaOf/IgWdKO+kPPOos'
+    'aROZAl+eTFXJWywQZDHH9AEHHus9lk5XueEh9RqTHecnkkHUwSVRZGhUaG7/hCGP/WXgyPxs'
+    'lYxWpcYmJ7NLUS6VBnOpvlBSR6NYHR3mumjESg0+RmG5WJUMJZ9pc8JC5nvSGtnv8dGDLNaD'
+    'J0/EY4CEKztAopVLLql2Rw+RlCHv+ciwyRZGDAJ40RpKB3EHOanjx2DbHQYzrE4dXHEH8246'
+    'uuKOMhJDQfN2GBX2kDJ3xg7T3H7wMIhs8LCSbMOpA1h2zHA7qSSHAYjMdjwONPvlrzBPyiNT'
+    '5gGaeBuyyWR7scwHDTWtD2o/9P0StmGYPCwqjDZDo4IFh2NUorjjLzDOVFK2GIpw30MTrdEf'
+    'mIEflB3IHYYflxmKd3hc/kipg4bog4YM/cBsGJVoeZ8f6IpTa5iosAhHAwz7kHO6JMPA+WGm'
+    '65gnlk9MsxOjk4JD/DBBvN+iU0M4p9wQxcL2IWExdxqCKjo1KCzClC6mh1MXKY3jAtQ6nA45'
+    'zhbgehwfiimHSsmUePljAnca+ZFvjf6YgmKcEgiiNy52NBZ0Z2AslTiFxCMieKNKsPdHH9vd'
+    'HxiOl8PI8R+XsI1KTsL7GXVCNAylMe9EOy08PvgmdoVfHvg9YmQ4GvoeiUkjZdzxH39iNgz/'
+    'xMz9BPr/JJpdbm54vFDRkmHxQIUlkz4xmwyhTz4lAf6o8JxBOGaEg/hQMb0d1HWELe46Avbs'
+    '5jYyBwxbOFrIzG4jYd2R5EvL6ULL4YLlnr6HFONYoeVUAVePIpwrcKKgnlJg7wmEEwUOE9Tr'
+    'xJSq0+eArNoxZ/SnZvPngXy65+HdHQjMmSDJdnSS7eZs4Ngu+dK5cpfKDFJYmMLdTjo5PCFQ'
+    '6oBAeecDDs8IZgq7SWG6XzIiHqOwZIKborBkgBuisOJ0heWTe58UFcuZo3dw5pBjB04cts1h'
+    'wxbjxAFky0HDFuO0AWaPIVPcH4Nw0JAzBprwA6cMsoeMJOOT5wNxvHT8fY3wiHBaeERwd+Nq'
+    'QJ7j3QHBnBEiwVc+JNiDwunxMcEeFYTxeacElT0kVD4n4CCSOSa4o4I6JbskXlqZJcnSyizJ'
+    'lVZmuVRllkukw06xVXDqQDHOHRweOxinDg4PHYwzB4dHDsaJwx02UIzjBsWnDX9ESB4T5IxQ'
+    '3TmBBsbHhKPosF+nykeTTafDz0BJMkk4HTERJdEk6XTkmSjJJolHtEsnGUBHnV3I4gDGFpgi'
+    'Y5U2JuBnuVd9DlUbk/J0bUFZR+fFufvuwcWBiKuUmIf+bCYSw1BVnJn/oC5P5UA/CFRHJxfh'
+    '8Y7254WakujoIbYkRI4G+uih0HS0lY4eJC9l40FD5QUkPWgYlwYN06VBg/Fi8DAZMZwHHzO8'
+    'zAOL7Y4ewnI0QSN2iJ/ArmmoK8YINUwWIR+nA2k1nI5xVcJJBOA71pUcEjSOB9h+CZD98leM'
+    'Y4KKRMlDkDhkaBzvaxhKuUUywC4afpxyy5wBjvuVkjUkXgLw982GHDXUrsKwMC+bJeIdilJD'
+    'KwaVTTHv80NKFn6RputMMz0USE61HjrMuhxMNrFRck5uWt8oDX2PLMn2YUk2wXGob1k8DERG'
+    'l7oMG/XRxxoQh1tta1AcPh6OPi7qEjx+wokaIgf0bKdRPhJ2tbfUIz8iqBxQ5hTKjcs9lVXS'
+    'kCqhSEH5iNzSTqvKLBqJIcd/TEExMK5G2UWjkGsXnXCikhXY15MbeSNcnhopcXqkEBtNx0sh'
+    '8RMa9Uk1kS44lWgMHRXD0jTq01QcwkyeuNk34Ue3RJ/sW8PQeDFSvkiBDQ2vjRxdQgujsXF3'
+    '6NYs7vHpZ6Ueo8Z8+llDz1Fjxn76GRwNFI46AUy0XQKnhYgnjNMQNV6cOC5UouVuGqI5V9VA'
+    'NZSIDbPijXuM+SwBUm9SJ99e41QZjhqRJtCrkuZVMHUBSdPJcbZyixB6sjEuUpE42gAXkYgb'
+    'Y7LUWBo7Tsk6Kb0Iz1gYpeIkFQZx75NO8a1hZLtBxqeEVB6vQWWA7WS86Hvy+EjLp2qIGVu/'
+    '0adGYD5NA83yPYsxsNsYwHCMhpthzrHyFQu8QIPOGnSGEMdNyAeuqfFp5Eb8dMqN+dkvyU8U'
+    'hlksDsgi1PMzyldJ4Kqkb1WSt0ru2TlKL7KtiZVF5XUrHfD29Akqh8yEPM9lk0g+kPCUPo58'
+    'Eh5RcviwU34trWHkYMuxcunwI04Zf4aGmM+Ib+pB5okaZp4Y39QDzWdqqPnM+KYebD5Lw81n'
+    'xXDmoyacXcBbI1zr25i4Frj5xrWGtsiNnHu2Kz9AmWXj+fBfnxENkILRjzhjYjQD+XzkxDPt'
+    'BCnMGHjmWdEEKJqPOstPqJaceQRrlGGbMDAwoqoiLmXNMAcSHFxlUI5aa8mJjV5PUC7Mc4Io'
+    'oXwJU5mgYkU7SA+NCiwfSqbA52GQs+AZbiZXxs3WtcVy9nYeKo3QXC3GUvZW1gknC5WhZLZI'
+    'ptDIOQatyNBcOlaH2coATYTUa+Jy76omDCNFD8mBsO1h4uA6Kcw8ZCQNGYldSIoyt8+RRQFg'
+    'Lf6lYaMYAiZTDP7S8BPoOFcM+DLcS6Yy6vUOzYJXfUyjpPLc6OiYK1wBqbQqMK4GcD8xW3XM'
+    'zRMpUDvyeMfbOoWrKgHXGTcjXDKwjYpHyDcRRpxkWEvQrcAWTfghqkXTSPwY/SmZUp/Sp5/Z'
+    '4lEQ5iiAlkaNZXCWTDEoSyeMY0CWThyXxl8ANkM26zUejaTRYlXXNEaKx4z9TKUUOK4GA+Zy'
+    'shCUtUc1rUwJBPUlHgVB5asEJwmuToobLiWwFCo91WyiUtMCU7j0NLNFLuXRlqUwqchrzOkG'
+    'p2QKJJVLy7ETjE1pXMAwdyMamzG+uDRc9LIzWCy6tlQZ2VWtugh25IU4oW4hZrNq06YqwCYB'
+    'luDm4Zk+I2x9uHcm257o23CTjzR9pm8DToY3wcwzgb/TzjLe5IFokFOjz8aLs/FiwtnCTpWx'
+    'YMKDKslBldSgwootqLBiCaoo2i4frdyiMyZKrjKLJp4pqcoskgc/08Sps0ie9yxJO7saaala'
+    'ofWji8lwTdUek3oeqjMEPJtEgyYFMTSoTE5wTXz0Obmljx50ziSz0aC4ggcsD1IA75xsD020'
+    'XMmeMwmcNC03snhhW25kJ02GAidrSHBygpdFIEwwE9OGDDVd7K+0neLAja9L1Whc1vM0G/Xi'
+    '1uoS+huaKAfL9O88m5evyqQsM/bz96s8bFS9uoQtI16KsZA7EqZUFa85K9lS5ciS3YWnQFC6'
+    'WlkmXWll6UkZWVC6Xqjin07p0srS4BJx1eiSRrhyrHSydKo0PdqTMmFLHjW2OlpabuXRkkZ/'
+    'FtnSmrJKWWYiq/RgLglrCasJqQGh82npnyhhSxElmk5ypUHKi50rGaKkk10JKVkwiabRhpIE'
+    'TQok0TTm9BIo+cWXFpMMS9LYCZyRpKFVga7K+iqNvrJJ35MfVS4f+ZTxl0n7MB5/6uVRGp96'
+    '2hXlCWkLUPz1GWYTNhL0eMoZl0lrAPIyAiLhx4k0XorHT7xcQ4+Xg4sTjRsJdIQcr7Cb2NFs'
+    'BD+Cj/MJfBQ5ogl4hB2vpAkB8AhkjGlncEfedkZ3KradimWn7Pp1Ooh+nZuEHAqQSIERKY+I'
+    'Kb/UCyEXk5RQzTmeP5QM40GDJ1eVVQyq+Pl8sISSKYmFcs6tMTfzsLb0oMEAVBSOkmwyJel8'
+    'zLHnNSKeB6XS9eBjJrt4WzKATMkIAO035WYQJpwzSSUHmPdQzQSUPvaX5/1GppAMgv9sKbNo'
+    'qCsGOGmoFFgyiUxxKE0ePHxyCdScjPThUZfEm+dCncedx0GXoM7zfqNBxd/wL21HgwOB2tEe'
+    'V36yBdFklqFor6JzGZNiPZpwUeivyvHxh2Uo3uP5jXQoDTkfJUGZsBqSbEpUotHzGS05cOgU'
+    '0xr9cWnosCkWjubGedjwqdLlZQqJnh+2hknP901m0keloSORq2WLiKqHTZVRU+UKdKpAdaqG'
+    'UqcCqBdIa0AVL064oICq1duy2k/mExY0l6AjRk5X2Q/mC28ty+mSRkxHSWIyFYnVfDqfSrRp'
+    'UflYkmQaOQOlR87wicp/DD/Kq3IW+oRZ0jZ5NkA5m06c7fUKtE6X1sCr3XhE3BqKnQ7AYtzJ'
+    'Go6dAcFi3ugZhrEFlNWjxs7y2wljZwGys6U1QIsX4/DiRLw4cdxFZaUXo9a41kn2s899a6j2'
+    '80qsBfQuVrkSlURI+bPPaYwrMPnzsrqlky5GSaQ0+WQ6+RLY0bR94DnInuN1ise89Isc59qw'
+    'sBLBCLUlsSQ1x5Zk85g5X9AYVxjwxZc8di5kOhcFkpqmcfPg3ot9axg42PikVAPFGn0JtlMx'
+    '07YGiS/R6DnYTsNo2/i1YUN/UYKMv/hSj4m2sXab+2UJQJ4rLyfgaSbM1YDyXB43YV4hb4tR'
+    'Wq2VVaOpTKdchvK+JU9cGn+5GFfaJl4hyiULXTptPp92Osg536ZeyadPuFIZ7V5WVC6dx18G'
+    'OLsyE069/Aqk25IZfNoV8zHAlozh0+dfiRm2ZBJNWMCn/PoyaQ1MB5sHtTSZYshao4HpMyZe'
+    'LqqOGrguwdaXY+qZpgmuhq3nYzsLk13D1hp9Jbaz7canywsAW6MXFLq4WMbVIlvVaexcavHR'
+    'Gc15L1I50IE/58be8uQiI67CQep7m6MyPq17ijonXGTT4wmSrUJXl0vmYyOWZpIT2UiXWGWj'
+    'JVSF1G1kJEIlUNlQiVNBGh1bHBa+ffxOJ6XjEChhsiRKYeUFhfa2aeJum8XgNuSbTjvOpUHW'
+    'Q845P2zIzm0U85qHTpoiDdtNmgLPTTKtMQUvbANekwGuyecCXHFriHuaPu7c86ZhZNQljJ92'
+    'oQa/L2TXKV8KVUlqSlgatJxqNhoWFyZPvYCGx4WhF0yj4+Li46ZdCPVdSLayo/B+z8cbPH9K'
+    '3sCys3j4BdNwrEiMwxublj/LQzxnGo4uU+p4a2VnKfkd5g0zgzgc1phJyiw3Kv0bxJCPk1M4'
+    'nFRuDPP509OteeT5QOP5tvCHKTxyCuQ4ZcbHZqMpUnrK1Jkf6+P9Vjp+FHYeNXWWHjX1AqDV'
+    'dgmng1mQ4wWQ4wXT8MJ2A84I02ZfVDruxGkXXsQnXniR/hU2YH56unUOmlE8Uh7m+Bk4LMyM'
+    'WqM/aTh+1MxZ0P+oWVGBsrNmg89RQbGzMXb2RXSiqSTTndQxkEdOnxGNNFOPn1FCz8SZIm6N'
+    'iZ9oTI2HitnzpxZNVH5eemZpJMZ9qmXjoEsyD2eFWabLvc/cicqt7MQZn6JU9PUJniWHAr9F'
+    'Z5JwUPjbxClkOlQat8apBESdDhpPjwrHken4f6iTZwhTZwDIMzSOJZ/lnUsUFmHoWNOzCeeR'
+    'sbPFpLPB5Nk8DlPHXZRH8cD5scYt9Hn0nM98a/TnFBSPtW1J7lSuxsHkUrnyJ1eXJOSPt3bJ'
+    'nMj+Jdj/s8/t7s8sl8pB6NLPS9jmJufh/c2dVzRSykzkky++JD2Vw6HQ/hzMmCODLv38C7Nh'
+    '7Bdm4hc4eHwRTTUT2U0NJqlouYHxUGWGuYEKSyaZfNtffElyopgbHnHUXD/jlItRLIcatLD6'
+    'YspUCScaTMSxhnyxnGhwoIHh56AYJxmN/lLLaYZ9Nzv9S91MjjLN5CjDzSbMJZxhJmDyhHlp'
+    'zSfOC0UnBn83Dstj0vwvzUanf2mODeHJYcKCwjODqdSpQe7fE6cGczoJTg0yKHlsANmvXCBz'
+    '8kZJRQeUxCGFUmcUSh1RzKDEGcUMYjfMp6vECqYorHiGwpJ4N0JhcZyvsHwwDkBy4nFNeaXP'
+    'mIgxOPeQL554+RVazjx0pivGgYdx3iFfjLMO45RDphgnHDob035rC7OipjN+G59QMOYqaXtG'
+    '4YlnXi1tTynIv0banlMQfq20PfVEyQX5dMZVtvwAmni1LcknqWtsyQSSutaWn0NnX4cqo+V8'
+    'LwckhZmtSX/EIRX9XzmlikNEPSFlzw7IKI4pOCblx6iClCl8zqQpNGlKbTmEM0ZQGmcOSPUc'
+    '08hUkohiHDlokhTjvEGmeDIcibMG+eJz4XAcM8iXliMG/caVOt8vshpW0SKkT5mq3KKpFyi3'
+    '6IJpyi1C1LQLlazzE1GUSsqPSSalY2oIKpticvLfV60p+U+DlCgoG0NwebI0qA7AnW8af5gy'
+    'g0yxYH3KDLh4ykxLdZo6E8VTZ86iqbMYRCdTDJ7TBbMZOCdTDJczVE6m1HSVZ0XlFmMCzfxY'
+    'zZRFM2cpt2jWbOUWQWizL1KypoeLEDQ9ClKA50w1s0JQNiWdgxQ806fki2fOMl1tWjoP7oZJ'
+    'U61nzrIwBkwTsf69ErgblPBXo2Gn6VHjf4B8Z8BQUDAaQpwx59PP7B7bVxbPAknRpbGz5n72'
+    'uQaD5wqCCQ4Gg6G22fPw4iK8uGheGa8ZssVoE/0SEAyQcsrAhsGGpCoQ27h5KoiXFeQrtyRZ'
+    'mUVzkHvp5xQUw7lqrl00V+JSgXhqpF0cpRFs6fMkTM8RwaLpUinkfUFzv4gCbebF1Wcizyg1'
+    'KoZWae6XwSPyKaLTiy8j/Bgft0aDPhdHjf/hkstL4lUY6JLLNRqau8Q0/jDnCqNWWFVQNGd+'
+    'CS1qxcangZLN4tLN5l4JuU6YK/qau0CDrXgxb4FHVxHwIuMFzkvfQzebLyaef6UQ+cpEx6ic'
+    'sCAfeYXQi6eI8yi66lYh9FQqFe8DcaaUzUTe5SYPiUi7wqQhD1nzXRYh6sqcqDiuYpaKo9QC'
+    'DXL+Nt44aHfvfsZlV/kuCUOvAkYvv8oS9GppDYpiO/OKq61Cr5HW0Ci2s+Zfw7avldYgKbaz'
+    'r7yWbV+nwdLr+OwF1yXgSL74jN9eFcHR23HiVVdLx3jkM6++JqFHPuuaa5N8PPva6ywfRZC/'
+    'jZeb4dtOUXh74RglPI2HKNFpPEIBpsGA/2ifbiRZNj6kAgcLQwqv8Gv5xU6Jcep8GjvS3I9b'
+    'RNo4AWSazCmkMoxKjqfKEjX2qQp0SpPrw2mCXlVQMJdxTSlT9Z8HU4ZL6XwpjlBqXTqTpszk'
+    'KUajjQRpPYSswqKIaTKMRkGIiZKaiKFwrQi0WoSKP9E03RU7f4Ke0jQDP4wIzZVr5EC4Uws7'
+    'adZcnmXQiWKwk2bPY6CTLppXbC2jLYvBLDTV5zRXKunBedXaLe1LDVx+YbbGEPMLabq0AJiq'
+    'Rl/ynFxeOmGaQDK0jIqFlWi62BUDlARTCifRdIkUw5MskkTTHPyY/6XQTjolyS+/wrbgK5q7'
+    'gMFImreg0F/OTSpmkzNTs/m62fwrv+Jmqb5ywVdqgcpoLJlZk+oWlDNdY4VYdVZCiAQJ+tJg'
+    '4VVm8yQkUwwWSoOCV11tNrpcikWGgOE1ZhMXEngoMgQKrzWboSFUKE3AIVx4HV15HX6319GC'
+    'gGrkgPZb6Mwvugo0s0t0ptwSmim36NrrlF2/TbAvkYScKIqgPB9FIN41cZDP+u/dYRPfHW5s'
+    '4mnYbGF+TPytikxOyLHr6RwpPmeKacjMZLJrDZ0tTF8fCs4mJy4Qkz5T5/F5cJnMEnfYOdIa'
+    '/Ls+wp8s0V9kIks/w5AIfkYiOfD7T1dfE15qitIayz4xX577BH1NCD9Lo6aQX05MLtgqk61C'
+    'Ur2CNDesn1FQDn2puDzzFYHPmQ/ei8mXcJm/buRZc6tTX475AgFZ9SnhXuElYA4hy9wCOvax'
+    'uwsUpEmnrgFzIVkGfl58EdSk65SfuC9jv2Zzo87VX4Z+Sf1Z+QX4c/DTzeaE8uNmX34V99xK'
+    '/FO5Ior4B/wh+qsEAMlUPv8ypvwB/Kdq55+qpD8W9Lmmy+IS9hH0F5nPsY8BPoq8Z1q0h6b5'
+    'HnsM63Gu96zP0tjLRZphWlnuZcJ+DN7jcyYtbDyzJIXioHpirGzAmesliaI8ZMEyi2jyIneF'
+    'tZjOXVxspetzKxnra5ELNtku2YVDSDfQeTfUHc6TFgbpKD353EUu35ab4IaAYL+j3/yueAif'
+    'c/3CzCCZoidNXhiP4cmLFsfvBKXPPW+xm2PLTUJ558WuDGhpegrGBbLkSbZLsCXe3uSpri/A'
+    'u7tg0WK8xQvwtmxraHBxCc5cjInTEg0XXvg7dk2YHRQLOU15/yxkMa0pUdAiFKiyiC5YJBBa'
+    'jAJUFtO0xYW0akJyFofUhsXGipPOvxG/KdP1BiEiLA0k2k2ClkSlp0xdspSmxoVf/k10wU0u'
+    'Gr/7mxPhYOeN6dagKF7ETfgxZcYSaflsHC9sl4DSJZgw07QGTPFi1tISaLr0JrDUtAZP8WI2'
+    'XkybfTO71jDqzcVIVT8eo9L0WwFA041gKlKi8nFkE2nGMhS8uoxnLrNUve0zjf68NHPWbZaU'
+    'Er0coDRdQFeY9VYNt9qNp8etAdhbYVdMvESDsBhmW6M/K83E9nmOZJfLBeZy4exyDcsuB2Nv'
+    'l9bgLF5IJ0CbkWL5e8fqSavKf65deOuYw0+6+E7Q0HScChjeVctH2yp4y3dG5XPJRtMlyLzL'
+    'REutQOk5K6Lc4LZRYEvN5uLHKmDTtAeuBmvvjDe+ONkayr0Txr1Tw7lmw0DbGth1G8i7AuBd'
+    'UQJ4V0T3nd661CyuEsy76ittt3kLVvG8BavL33rmuFLcG9nXgPerr31r4PfrIv2qimAFAL/S'
+    '6K/pSlcA4Nc5dKXL7oYwTdPld/tYAPMeaRu7BrpcQ/PXRNFrPWHxlPd+E0ciLKwg2NQ9tiSY'
+    'pNbYcuk0f60tGUBXfhMVhnzzLS34FjK+W0PH6Y0vy7aGmu/WMLPZMDJuDTzfU4Ke78Hka0xr'
+    '6HmNRq/Fdi0ewDZ+gdjQ35SA6G++1Vf6rQRN4+WC69Z9myJwVaQOHZxr6jqzYlMXUitjxYVJ'
+    'Z+WJLkMtQOcGZ63CQep7m6MydGzaKep6So2RGSpp02onqOuTy0W7eBusglwVwrqeVOTaTJMr'
+    'gcqGSpzC8noukxU+JH67C9NpyLNZykep3KRI3j6Np/oshrOlU3EIlDD1Oz7/+hvDTpDa10Kn'
+    'asQudb3IylpD1rDVIthq0WK8WAzqLYazFsNXi2+ArxJ9S2nahTf87ha+0HbISZkNTV5/Y0m2'
+    'JaEoC1yJ0UsFllFh7E03iy/JF0+7+RYQ7xaylQSsNeyNcOSN1c1ykLXFF9Q4S+hd3TyeuvSm'
+    '/DdHwTw97cKbC4d57ueMq/L3WN0o5VYd76ncFJ5+463ZNscAW3rGjUuWmY1nyIuZeDFzyW3S'
+    'GgcCvPCNA8GspdDj0psgV9ug5E2Q401g5E0344Vtcx4oTbvo5lvu4Itsh2R2agZk8Sgzbl1m'
+    'zRwVHmHZbTQzLg05LweZoyph6vLbaXZcevZFt98Bwd5BtpLT4oG3LksPFKonJ+KNZkfijeZM'
+    'LJomNcO8t/Q4M4rDcWYUh+NqmKXcyoxScv4IBuEYggPAbcvNScCOMSeQcJL9JdpROHbcCpXa'
+    'hkzdxmjC0cNXCeeQZXfhGLJMeLoMNF6G4jnLVjTMWXbbCpx65shOt0mxjF++8nN9qWxzsREO'
+    'I3OX3w4l24ZT8WLe7av1vNvvWM3z7lhdYHLDcoty53LTc+5aYXHOc1bIcWIFDiUrE91w6dyV'
+    'q3DKmLsqKgxdtZrm+QoGJsfyJXfeJZ0Yi3ftZ5qxl64ooVfi9BK3xswvNObGY+VYEM7NDJUy'
+    'bzN3KodDS3Mw70stGwddkoE476wyHbxVdmMzA5VZmZnKjAt+t83k3LEicepB4bixynzPYtVX'
+    '0eHHTsJp507Rbrgxmi6/M1UNcvK5S/h7F+x9ly19xV0rhL8rwO8VOIes+BJb9rjjCtMXmF5N'
+    'C1ZnmB9T355MvPXtQSK2vrQcI9Z+5Vujv6ageIFtWrBOKv9Y4ebx5Xffkzhb8BUi+3uC0wXe'
+    '4Jq10fmihPPFV1/b3Z+N7pUD171fw/X3rsuf6ioamTs2cabhcCjOEmsxY+29bti9X3+DF9+Y'
+    'gd/wgnXfZCcqtzIDlRyf3DiFJYPcMIUlU0y4bZyd5Kiyzm0sJybXVFAa56Z7zEZXu+Kr71lT'
+    'kjPT/XTNGlss5yUclx6ga9eiGOckjf5Wy1mJXdN1+LHuW/rt71GYmWi66vf+cHMfiq+62rQ9'
+    '4tzPV19j2p5yHuBrrjVtDzoPYsqD35oNI3Dgue4hOyOq1CC+6vf32TFuEmHY1ffdj0HBLMyx'
+    'JZPw5h54EKNsMWbJvIdk1HUPlQF3PrnzVLtxQirqv3JKFUeIHyyk7PmjMKXoYWoM4esXLqGF'
+    'S/JiqPj0QjiwpGsJCschABSRPMXEmlqK4oWLlpIpXgSM4uyCYwuZ4sUQPc4s5ItvgOhxXCFT'
+    'KsIuprAcUa5foqJFS5Yqt2jpTcotuulm5RbdfIuy68YgCSk31pjig25sbFA2xeQ0PqQoBiFR'
+    'TjaFbrw1VZKzDMXCfDSZ4iXgIagP5ZMpXgqGLl3OED6ZYnE2hA/ckym+GUSE68mUujVefCMI'
+    'ilbRomW3KbfotuXKLVp+u3KLbr9D2XVruAiOrSvn1nI5SImCEBMlVc6pkJR5IMSYJIKVgxI7'
+    'azRodWvc4DOZ0uDzCpEzLVvBsDPfBsLetgJsvQ1avg1aFjvT8pX4sYqWr2K4mUzx7cDO7asZ'
+    'ZKY7Vqs74xVATrnlLafMYuTTys/VSlm0cpVyi1atVnbdGS5C1J1RlLqLfI5aQStWqpWFOXeW'
+    'y0FKFIQYPNOX5Es3W7nKbmUDy0XqZgjkZrYRJUg12ypB5CohY5RMUKkpdkbV6HvMhj9Fjf/h'
+    'rntYpAqorjEbX3GXbWCVYVWNXluCVtd+ZfcUVNVXvAqARJcWrFr31dcaYl3HC1avU8WoCl2V'
+    'YythKkGrMCOnsGq8atSoggGyogl3I9suE32Pibbhyixai9h7v6agGBJVmUjz7InEKI0gQJ8n'
+    'YXqtIBNN90oh7xta901eYDKSgicMM5FnLBkVg5O07lu+6u7fp1uj7zMb/pTokrDyPn31Pffd'
+    'bzbA0jT+sOZ+fY3Z1twPf60xjT+sfQC0fAC0fAAGW/tgCS3IxMZoZRZ9+536vSy6ypV4L2E+'
+    'KUu+mH0E9V0jw+537CMYM0QfwZggHwxrW6PdJL/8IGnllp+izHLxyiwXr8xiy0n1o9Xkf54D'
+    'i34tTYXJMgrMZixxnIxE6dxnswz6bJgDXzlUOuvZUi6VFy5ZKt1EpEyRaaN7shLiflSeLHyY'
+    'FCijpEJRCvViU9JGIWXdEPz3A6Wqw5NCSTTd6spZksWRaIooSUaTK+m2lQxHkqkaFFm3+lbX'
+    'oL4oCTmNBGRuVJ1whBCTLRYVMuaqUeAoVHRNd7oSKhLEKE5E011SRopAojStWItpsFuztRaH'
+    'MdsgRC1ApFXrGESkhBANiQJoBdQyMLJuy5JQfU3rpLJ4y8At11lpC2pA8Buz5XGwukyWK8G1'
+    '9zoKltdgtYm5GKS7fx8VC//QdHdcDPyZBv3oHlcM9bGgD01rpFjUJ+BD01r8ePBbMmWoZysm'
+    'GGGGKe8vQrjXl7qf7nf2Ug/QA15eD377nQbsvmPX9FDKdcWJyIsiERhlEjD3oGDuof+fSeyH'
+    '5VxTUMxe7FX4zkTxtV7kOXetd318m5e50IO8EviKcEeOeDG8CoXngJHwnUrqTgW2o8WijUh2'
+    'dEP2rjBll7rv+MqLLJdBxbZTPyLaicTKB1Wmnb/G27i2s/6pGWW5nqpOZVX6TlV9y1elEuvS'
+    'XS7tAt7FtHM3hSvr912O7uoDng363oWn6gcew3cUFK+MXJe5D8xjXVJ2VnUB7IA6FK+IbuUS'
+    'qLO9Lsd1+aorEI6FnRLRJa/k1mW9VB3CvOzYXc0Jw6SLrFgl7bzpIolJ12y7GHZp3AnsvO28'
+    '6tKy87iTO7083AWwc7hzsPO4865L6i5ju2KL5fEOrLOVpV0T6e4/z1TgyyNkKvqe5sJFj8as'
+    'WvxY+SS6/uGw9PULH3Z5caokkim1CBZ6TNoFg0N/oBv+kJLWw7llsuPntcULH3k0zjfl8225'
+    'CeTmAFz/Q7/7n3JTljz8SAmow6yFS5KD9MJFj8STeNGjyVF68Q2PxbNQbhgKnHs4bDuLMStq'
+    'N1BaQ3l4YbsETeI9Llrq+qZHNfoxDVTizdnWgB+2mx/DyJsTXQIw//A//LtbTBMm+5LH0FCm'
+    'mU5LHvbYeYRlOJqWPiLieRSl4cxH6aZHBT6PkZtHNz9m+fMHDWj+ATz5Q9JTdUAzV2U5zsy9'
+    'b6usuyZxJiz3uHR9OXTj46nSsKHdAMMnaElcesnSJ56kpa7UUg0gPkU3SZl4+PBpuvlpL/Rb'
+    '/qhuATkfT7cGQ/EibiUEfUJag6J24yW3PVGCSJ94Eho1raFSvFj+pBnLrjVoihe348XNtz/N'
+    'rjV8ike5g2+54485QFWN92mOBuv0Kfz3jHQjiEq3PhOVjyObSMueRYGTz5LUc7bgyed86POw'
+    '5PN5ZoVUn9HQarDxrXFruPUZtv2shl4xxbYGXp/V6Ofkg24Ms10CYp/DtJXPayDWbrx81fMl'
+    'WPb5F+BY0xqexQvpO1bzHav/VOjQRptW1XrTmGtRUPFF6cK0aj4/pztftOXTyAbSXS+hIM+X'
+    'aMVLkvYyCr592cv2FdOllatesfSU7FcBT9MGuiFxNRrx2dbw7osa2jUbBtrWIK/bAF8Mtq3R'
+    'mInt6xz/vioXm68Kgl/VEPCrvHrdaylYVoXgch9MV7wsLf/RdM5dZPrz87vveV06DgUm34g/'
+    'Pl+z9s2Kn04nn/J1Wz5YmiSf7kHsGyZ9zRvyvAh+0+RLrUfptet9snKL1337Xahh2/e9ntca'
+    'NH5dw8Vmw6S4NYD8RglCfgMTHzCtIeQ3QeQ3NZi8HkDG+AfXfyuqlc6hckTahJSrkS09+B2K'
+    'H3woz8o16Du0sqS5RPVQLqn4+qzbUElNoUCaR2NN5YFK3/C7PzhR/cCT8qzrlNjkg+RdqbJj'
+    'hKJ1TlFmkUxQ0RTJV8l4FZI6zVyfrR5OrihWlg1VNthGqiBRYcV5Ki8uEUj4FUSBNswE2iQV'
+    'B6nsY1luw7ookwXxLvVhDF1L2zwGqkFcl2nzQka7WuIqznWSdtHW0QxGIxp2evSxpyylWeSO'
+    'GWCUbQxDlaDp//kj32LbQpFvfDhqePHhx0uyQW4Pm47YyEseEco9IpR7xOGRlz76ZAnTn3xK'
+    '5ltD8k2PPVXC+KeehuUeE0mi5BE0+o8aTwDLmcqY1Rh4yeMJrXqw4l3HaIUdMXLpTW6kmfrU'
+    '0w6ufuLTf8ThoXCWJbK8z/x5lB6XGIW39lQ8C4X39XS5Wf6tpcdVmIWqbZQyC/au8K54qfw7'
+    'S72rgil86+PP+KZbH0dBpo+TKV72OKD4+BN242Xy4rYnQNQn+LYnAMcnngQafQP+y5+EGJ98'
+    'CmL0Dfff/hS8+NTTsKLvO54u3XzH03/8E99hO0njx0WtfkM/K09hiWyU/MSzJXmI5+QRvJSf'
+    'FLg+KXB98nlo2YD5KUHrU4LWp16g26VkegnTX/iTxv4nusNUMDzWOabL4GfiwU7o+AU8+1zC'
+    '6BrthtrSsLqbaAvTXiic5o8DOfPMLA7nmVkczqttmDIrbxanR3HZd2Wm+FF85zMv+gZS3cZo'
+    'uusZW/gDjPrMsxDrs4JVvLD9srTGMQTbyudeZtuvaJxCXuGVtiHn518Blp+HVZ9/AS9sl3AI'
+    'efU1Xv3Ca3r1C3/Ciz+9FhE9qXRTL0UlVMczvITZL70ccx0P8PIrtDIuDbG/CqpHBSq/+hqt'
+    '9hUMS47ku158STo70U7LHciYlpwox4NwZGaeG0kFEzkcaIZxONAM43Bg2WHKrMwsZcbEo9TL'
+    'nBiEow/OGq+8ag4d8ftiO6kkh53X7a6jjdF0z4th4X96o0HOPi8JiF+Cw19C8ZqXgOGXXhYR'
+    'vwyJv4zitS+vb1j78ivrv/q6tFZ2xrGLXsEPPMOrb32t75VtHTbC4Wfdq6+9zeteezsLf4f/'
+    'wP/uCGB6zRtvxqcAexJYb4vXrpcDzHochN5KdMO96956G+eadW+78seN5GwM5Htef0M6OXaN'
+    'HADCsXjTb64P5t67voR+CwemuDWGfqMx+JvcofHo6sdyOLW0FgO/1bJx0CWZiBPQ26azE5VZ'
+    'mZlKzlfxNGVmBfPWf4tS0bc8+O1vv9PI/66Eo9Xrf7Y73fd6UZVwvnrjL4yN7nfF97/x15Kc'
+    'rf5KD7xpSz/w5vq/aRys/kY4WOFc9V3ewUp9x7+/78/pJl9yEPoLiu+73zTd/xc5D/0Vxfc/'
+    'YFrORH9D8QMPmpZz0d+/C1uZRb//c1TZWXzfn/9iR/lp9//lr9LxMI3+m53lxuHd/e3v9KAr'
+    '/eBDf/+uhO1/v+OHbJcxuWG0KqPoyLyZkEROfSmph/nPCyl7QClMKXoYhEQ59acED5MNoYcf'
+    'D8umPIHSONeYgwW5ehLFjzz6JLl6CsVyqnH1NONMQ3H9kXGeIVPi3nAK4xBjpyizkM84vGCA'
+    'wkI649iCeIWFbMaBBfkKC8mMo4qy6/Fw0eMuzSQ+YaJM3JMmx2Q9ZUJMEAT9dH5KzUHZlDqe'
+    'Ji+kKAYhUU42hXAUCMrGPItiOQagydVzKMYpgExJ7PMM/5MpSX6BIX8ypZ5mmJ9MqWf8QjyL'
+    '8dHIV24xfK/MQiwD9soshDJEr8xCJIPyyq5nwkUIeyYKU8+ST0Oez0KaT0LWCzkp6RykREGI'
+    'iZIq51RIyjwQYkwSQdDJgqEFX8+8RKYYoiZT/CwA9qwUw9IERT8HgT33CsPRZIphaHr+VYag'
+    'yRRDz/TCaww7059eUy/GywtPRYuQ/hJsJ4tefkW5Ra+8qtyiV19Tdr0YLoITU0GqqpwX83Ki'
+    'qNTzRFEIirIKkmrJSjwUAaW+RKga/YbZBKe+CT8EqTDqm2YTo9JLbzKUSoAqnLpeiEovr2cg'
+    'lV+BFl9ZDyG+ApW+ApWKUenVt0Sob9OrbzOASq+9rV5XuWhSbnmmKbM8m5RZjHh662v1lix6'
+    '621l1+vhIqSZ8oEEhPk48kkKBHtLvZVMej29MkFRShSEGDzVt+SL33rbdF5cMjD1XFEiCAqk'
+    'pVoj0iiRAcN0a/RfzIY/JVoLE0uywU5vCKfesA0m6gfM9uZfAak3bYOLDC2Cin/7e+nB9X+H'
+    'R83uoejWn+2K2RbTTWFRgm4KHv0rPyBTjN0UFlu0iQzJF3j4v1I+3c1w4X82ySYdqX9BqiyJ'
+    'VG5JpjILYfz3//Vx/6Xb9xdSSLfv23/gFD/sveZu4K3X3DU3sOauuOX2GW3jxGk5FEw4TcpH'
+    'O6rFFnRaizHowBZhUMiW1KDTjR2h8qkksd5KkpjG0h8ruK2IS5GY/i0MWPgwZd5VjgKd1GII'
+    'egQarSUgKGJLUFDUlsCgyC2Pg8rOqIy32IGxuv79FKhqRyALANGUMqAAsAkRmDJSTXQrS8Ai'
+    'bVWPQNV0BqyRtwkBivvQ9GJcAj/Twj40RfJjUR+aIviRsd9b9MpbDPWRKS4iXzmcVeLZ2xVw'
+    'VuSzKApBBdRrRFaB8RrBPHr7O3r9z7ZYUOeaXo+L5fpPGqijN1yJ6lg8h6Y3pYzogDlpWo8f'
+    'jlppyhloUaGzYLgYWvQ3r6wEtPLoVhCHsCgPaRTD7X9RCuv/A2FmHI0='
+)
@@ -0,0 +1,687 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" colr/sgr.py
+
+    Tracks the state that SGR (Select Graphic Rendition) codes set, the
+    codes that change colors and styles, and rewrites colored strings to
+    use as few codes as possible.
+
+    The MIT License (MIT)
+
+    Copyright (c) 2015-2017 Christopher Welborn
+
+    Permission is hereby granted, free of charge, to any person obtaining a
+    copy of this software and associated documentation files (the "Software"),
+    to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense,
+    and/or sell copies of the Software, and to permit persons to whom the
+    Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in
+    all copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+    THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+    FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+from typing import (  # noqa
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .base import (
+    ChainedBase,
+    closing_code,
+    codepat,
+    TOKEN_CODE,
+    TOKEN_TEXT,
+    TokenTable,
+    tokenize,
+)
+from .cache import LRUCache
+from .width import (
+    _is_ascii,
+    column_offsets,
+    str_fit,
+    str_width,
+)
+
+__all__ = [
+    'iter_sgr_states',
+    'optimize',
+    'sgr_cache',
+    'sgr_state_at',
+    'SgrState',
+    'truncate',
+    'wrap',
+]
+
+# Parsed codes and state transitions. Colored text uses the same few codes
+# over and over, so these are nearly always cache hits.
+sgr_cache = LRUCache(maxsize=1024)
+
+
+class SgrState(namedtuple(
+        'SgrState',
+        (
+            'fore',
+            'back',
+            'bold',
+            'dim',
+            'italic',
+            'underline',
+            'flash',
+            'reverse',
+            'conceal',
+            'strike',
+        ))):
+    """ The colors and styles that are active at some point in a string.
+        `fore` and `back` are None for the terminal's default colors, or
+        the tuple of parameters that set them, like (31, ) or (38, 5, 196).
+        The other fields are True when that style is on.
+        States are immutable and hashable, so they can be compared and
+        cached cheaply. SgrState() is the terminal's default state.
+    """
+    __slots__ = ()
+
+    def __new__(
+            cls, fore=None, back=None, bold=False, dim=False, italic=False,
+            underline=False, flash=False, reverse=False, conceal=False,
+            strike=False):
+        return super().__new__(
+            cls, fore, back, bold, dim, italic, underline, flash, reverse,
+            conceal, strike,
+        )
+
+    @staticmethod
+    def _color_name(params: Optional[Tuple[int, ...]]) -> Any:
+        """ Return a known name, number, or rgb tuple for fore/back
+            parameters (see `colr.get_known_name()`).
+        """
+        if params is None:
+            return None
+        # colr.colr imports this module.
+        from .colr import get_known_name
+        known = get_known_name(_codeformat(params))
+        return None if known is None else known[1]
+
+    def apply(self, code: str) -> 'SgrState':
+        """ Return the state after an SGR code, like '\\033[1;31m'.
+            Parameters that aren't understood are ignored, like a terminal
+            would do, and other escape codes change nothing.
+            Each code is only parsed once (see `sgr_cache`).
+        """
+        return _apply_delta(self, _code_delta(code, strict=False))
+
+    @property
+    def back_name(self) -> Any:
+        """ The back color's known name or rgb tuple (see
+            `colr.get_known_name()`), or None for the default color.
+        """
+        return self._color_name(self.back)
+
+    def code(self) -> str:
+        """ Return the SGR code that sets this state after a reset, or ''
+            for the default state.
+        """
+        params = _state_params(self)
+        return _codeformat(params) if params else ''
+
+    @property
+    def fore_name(self) -> Any:
+        """ The fore color's known name or rgb tuple (see
+            `colr.get_known_name()`), or None for the default color.
+        """
+        return self._color_name(self.fore)
+
+
+# The state at the start of a string, and after a reset.
+_default_state = SgrState()
+_fore, _back, _bold, _dim = range(4)
+# Marks the fields that a code doesn't change, in `_param_delta()`.
+_unset = object()
+# Style fields after bold/dim, with the parameters that turn them on/off.
+_style_params = tuple(
+    (SgrState._fields.index(name), on, off)
+    for name, on, off in (
+        ('italic', 3, 23),
+        ('underline', 4, 24),
+        ('flash', 5, 25),
+        ('reverse', 7, 27),
+        ('conceal', 8, 28),
+        ('strike', 9, 29),
+    )
+)
+# Parameters that turn a style on, and the field they set.
+_style_on = {1: _bold, 2: _dim}
+_style_on.update((on, field) for field, on, _ in _style_params)
+# Parameters that turn styles off, and the fields they clear.
+# Bold and dim are both cleared by 22 ("normal intensity").
+_style_off = {22: (_bold, _dim)}
+_style_off.update((off, (field, )) for field, _, off in _style_params)
+
+
+def _apply_delta(
+        state: SgrState, delta: Tuple[Tuple[int, Any], ...]) -> SgrState:
+    """ Return the state after the changes from `_code_delta()`. """
+    if not delta:
+        return state
+    values = list(state)
+    for field, value in delta:
+        values[field] = value
+    # Skips the argument handling in SgrState.__new__.
+    return tuple.__new__(SgrState, values)
+
+
+def _code_delta(
+        code: str,
+        strict: bool=True) -> Optional[Tuple[Tuple[int, Any], ...]]:
+    """ Return the changes that an escape code makes to any state, as
+        (field index, value) pairs. A reset changes every field.
+        If `strict` is truthy, None is returned when the code is not
+        understood. Otherwise anything that is not understood is ignored.
+        Results are cached in `sgr_cache`, so each code is parsed once.
+    """
+    key = ('delta', code, strict)
+    delta = sgr_cache.get(key)
+    if delta is not None:
+        # Codes that are not understood are cached as False.
+        return delta if delta is not False else None
+    if not (code.startswith('\033[') and code.endswith('m')):
+        # Not an SGR code.
+        delta = ()
+    else:
+        try:
+            params = _code_params(code)
+        except ValueError:
+            # Sub-parameters, or a private code that looks like SGR.
+            delta = None if strict else ()
+        else:
+            delta = _param_delta(params, strict=strict)
+    sgr_cache.set(key, False if delta is None else delta)
+    return delta
+
+
+def _code_params(code: str) -> Tuple[int, ...]:
+    """ Return the parameters for an SGR code, like (1, 31) for
+        '\\033[1;31m'. Empty parameters are 0.
+    """
+    return tuple(int(p) if p else 0 for p in code[2:-1].split(';'))
+
+
+def _codeformat(params: List[int]) -> str:
+    """ Return an SGR code for a list of parameters. """
+    return '\033[{}m'.format(';'.join([str(n) for n in params]))
+
+
+def _iter_visible_slices(
+        tokens: TokenTable,
+        spans: Iterable[Tuple[int, int]]
+        ) -> Iterator[Tuple[str, Optional[SgrState]]]:
+    """ Yield (raw string, state at the end) for each (start, stop) span
+        of visible characters, in one pass over the tokens.
+        Each string starts with the code for the state at the start of the
+        span, and includes any codes between its characters.
+        The state is None when the string has SGR codes that are not
+        understood.
+        Spans must be in order, and must not overlap.
+    """
+    text = tokens.text
+    # States are numbered, so each (state, code) step is only done once.
+    states = [_default_state]
+    stateids = {_default_state: 0}
+    nextids = {}
+    stateid = 0
+    state = _default_state
+    unknowns = set()
+    unknown = False
+    spans = iter(spans)
+    span = next(spans, None)
+    pieces = None  # type: Optional[List[str]]
+    vpos = 0
+    for start, stop, kind in tokens:
+        while (span is not None) and (span[0] == span[1]) and (pieces is None):
+            # Empty lines have no state.
+            yield '', _default_state
+            span = next(spans, None)
+        if span is None:
+            return
+        if kind != TOKEN_TEXT:
+            code = text[start:stop]
+            key = (stateid, code)
+            nextid = nextids.get(key)
+            if nextid is None:
+                if code.endswith('m') and code.startswith('\033[') and (
+                        _code_delta(code) is None):
+                    unknowns.add(code)
+                newstate = _apply_delta(state, _code_delta(code, strict=False))
+                nextid = stateids.get(newstate)
+                if nextid is None:
+                    nextid = stateids[newstate] = len(states)
+                    states.append(newstate)
+                nextids[key] = nextid
+            stateid = nextid
+            state = states[stateid]
+            if pieces is not None:
+                pieces.append(code)
+                unknown = unknown or (code in unknowns)
+            continue
+        vstop = vpos + (stop - start)
+        while (span is not None) and (span[0] < vstop):
+            spanstart, spanstop = span
+            if pieces is None:
+                pieces = [state.code()]
+            pieces.append(text[
+                start + max(spanstart - vpos, 0):
+                start + min(spanstop, vstop) - vpos
+            ])
+            if spanstop > vstop:
+                # The span continues in the next text token.
+                break
+            yield ''.join(pieces), None if unknown else state
+            pieces = None
+            unknown = False
+            span = next(spans, None)
+            while (span is not None) and (span[0] == span[1]):
+                yield '', _default_state
+                span = next(spans, None)
+        vpos = vstop
+    if pieces is not None:
+        yield ''.join(pieces), None if unknown else state
+        span = next(spans, None)
+    while span is not None:
+        yield '', _default_state
+        span = next(spans, None)
+
+
+def _next_state(state: Optional[SgrState], code: str) -> Optional[SgrState]:
+    """ Return the state after an SGR code, or None if it can't be known.
+        When `state` is None (unknown), only a reset in the code makes the
+        new state known.
+    """
+    delta = _code_delta(code)
+    if delta is None:
+        return None
+    if state is None:
+        if len(delta) < len(_default_state):
+            # No reset, so the rest of the state is still unknown.
+            return None
+        state = _default_state
+    return _apply_delta(state, delta)
+
+
+def _param_delta(
+        params: Tuple[int, ...],
+        strict: bool=True) -> Optional[Tuple[Tuple[int, Any], ...]]:
+    """ Return the (field index, value) changes for SGR parameters.
+        If `strict` is truthy, None is returned when any of them are not
+        understood. Otherwise they are skipped.
+    """
+    values = [_unset] * len(_default_state)
+    i = 0
+    count = len(params)
+    while i < count:
+        param = params[i]
+        if param == 0:
+            values = list(_default_state)
+        elif param in _style_on:
+            values[_style_on[param]] = True
+        elif param in _style_off:
+            for field in _style_off[param]:
+                values[field] = False
+        elif (30 <= param <= 37) or (90 <= param <= 97):
+            values[_fore] = (param, )
+        elif (40 <= param <= 47) or (100 <= param <= 107):
+            values[_back] = (param, )
+        elif param == 39:
+            values[_fore] = None
+        elif param == 49:
+            values[_back] = None
+        elif param in (38, 48):
+            kind = params[i + 1] if i + 1 < count else None
+            length = 3 if kind == 5 else (5 if kind == 2 else 0)
+            extended = params[i:i + length]
+            if (
+                    length and
+                    (len(extended) == length) and
+                    all(n <= 255 for n in extended[2:])):
+                values[_fore if param == 38 else _back] = extended
+                i += length - 1
+            elif strict:
+                return None
+            else:
+                # The parameters after a broken color can't be trusted.
+                break
+        elif strict:
+            return None
+        i += 1
+    return tuple(
+        (field, value)
+        for field, value in enumerate(values)
+        if value is not _unset
+    )
+
+
+def _state_params(state: SgrState) -> List[int]:
+    """ Return the parameters that set `state`, after a reset. """
+    params = []
+    if state.bold:
+        params.append(1)
+    if state.dim:
+        params.append(2)
+    for field, on, _ in _style_params:
+        if state[field]:
+            params.append(on)
+    if state.fore:
+        params.extend(state.fore)
+    if state.back:
+        params.extend(state.back)
+    return params
+
+
+def _transition(old: Optional[SgrState], new: SgrState) -> str:
+    """ Return the shortest SGR code that changes the `old` state into the
+        `new` one. An `old` state of None is unknown, and always needs
+        a reset.
+    """
+    key = ('transition', old, new)
+    code = sgr_cache.get(key)
+    if code is not None:
+        return code
+    if (new == _default_state) or (old is None):
+        params = [0]
+        params.extend(_state_params(new))
+        code = _codeformat(params)
+        sgr_cache.set(key, code)
+        return code
+    diff = []
+    if (old.bold and not new.bold) or (old.dim and not new.dim):
+        diff.append(22)
+        if new.bold:
+            diff.append(1)
+        if new.dim:
+            diff.append(2)
+    else:
+        if new.bold and not old.bold:
+            diff.append(1)
+        if new.dim and not old.dim:
+            diff.append(2)
+    for field, on, off in _style_params:
+        if old[field] != new[field]:
+            diff.append(on if new[field] else off)
+    if old.fore != new.fore:
+        diff.extend(new.fore or (39, ))
+    if old.back != new.back:
+        diff.extend(new.back or (49, ))
+    # Turning a few things off can take more than a reset and starting
+    # over.
+    full = [0]
+    full.extend(_state_params(new))
+    code = min(_codeformat(diff), _codeformat(full), key=len)
+    sgr_cache.set(key, code)
+    return code
+
+
+def _wrap_spans(visible: str, width: int) -> List[Tuple[int, int]]:
+    """ Return (start, stop) spans for the lines of `visible` text,
+        wrapped to `width` terminal columns. Lines are broken at spaces/tabs
+        when possible, and the spaces at each break are dropped. Newlines
+        always start a new line, like `str.splitlines()`.
+    """
+    spans = []
+    parastart = 0
+    length = len(visible)
+    # Column for each character, when it isn't the same as the index.
+    cols = None if _is_ascii(visible) else column_offsets(visible)
+    while parastart < length:
+        paraend = visible.find('\n', parastart)
+        if paraend == -1:
+            paraend = length
+        pos = parastart
+        while True:
+            if cols is None:
+                if paraend - pos <= width:
+                    spans.append((pos, paraend))
+                    break
+                cut = pos + width
+            else:
+                if cols[paraend] - cols[pos] <= width:
+                    spans.append((pos, paraend))
+                    break
+                # At least one character, even if it is too wide.
+                cut = max(
+                    bisect_right(cols, cols[pos] + width, pos, paraend) - 1,
+                    pos + 1,
+                )
+            brk = max(
+                visible.rfind(' ', pos + 1, cut + 1),
+                visible.rfind('\t', pos + 1, cut + 1),
+            )
+            end = brk
+            while (end > pos) and (visible[end - 1] in ' \t'):
+                end -= 1
+            if end <= pos:
+                # No place to break, or only leading whitespace before it.
+                end = brk = cut
+            spans.append((pos, end))
+            pos = brk
+            while (pos < paraend) and (visible[pos] in ' \t'):
+                pos += 1
+            if pos == paraend:
+                break
+        parastart = paraend + 1
+    return spans
+
+
+def iter_sgr_states(
+        s: Union[str, ChainedBase]) -> Iterator[Tuple[str, SgrState]]:
+    """ Yield (text, state) pairs for a colored string, where `text` is a
+        run of visible text (without codes) that is displayed with the
+        colors/styles in `state`.
+        Runs with the same state are joined, even when other escape codes
+        are between them. Each distinct code is only parsed once.
+    """
+    tokens = s.tokens() if isinstance(s, ChainedBase) else tokenize(s)
+    text = tokens.text
+    state = runstate = _default_state
+    run = []  # type: List[str]
+    deltas = {}
+    for start, stop, kind in tokens:
+        if kind == TOKEN_TEXT:
+            if run and (state is not runstate) and (state != runstate):
+                yield ''.join(run), runstate
+                run = []
+            runstate = state
+            run.append(text[start:stop])
+            continue
+        code = text[start:stop]
+        delta = deltas.get(code)
+        if delta is None:
+            delta = deltas[code] = _code_delta(code, strict=False)
+        state = _apply_delta(state, delta)
+    if run:
+        yield ''.join(run), runstate
+
+
+def optimize(s: Union[str, ChainedBase]) -> str:
+    """ Rewrite a colored string with the fewest SGR codes that display
+        the same colors and styles.
+        Codes that don't change anything before the next text are dropped,
+        resets are only kept where they are needed, and the codes between
+        two pieces of text are merged into one code, like '\\033[1;31m'.
+        Other escape codes are kept in place, and any colors/styles
+        that were set before them are written out first, because some of
+        them (like erasing a line) use the current colors.
+        Codes that can't be understood (like sub-parameters) are also kept
+        as-is.
+        The string is expected to start with the terminal's default colors,
+        and it ends with the same colors/styles that the original did.
+    """
+    tokens = s.tokens() if isinstance(s, ChainedBase) else tokenize(s)
+    text = tokens.text
+    if len(tokens.kinds) < 2:
+        # Fast path, nothing to optimize.
+        return text
+    out = []
+    append = out.append
+    # State written so far, and the state that the next text should have.
+    # None means that the state is not known.
+    emitted = current = _default_state
+    # Local lookups for this string, in front of `sgr_cache`.
+    nextstates = {}
+    transitions = {}
+
+    def transition(old, new):
+        key = (old, new)
+        code = transitions.get(key)
+        if code is None:
+            code = transitions[key] = _transition(old, new)
+        return code
+
+    for start, stop, kind in tokens:
+        if kind == TOKEN_TEXT:
+            if (current is not emitted) and (current != emitted):
+                append(transition(emitted, current))
+                emitted = current
+            append(text[start:stop])
+            continue
+        code = text[start:stop]
+        if (kind == TOKEN_CODE) and (
+                (not code.startswith('\033[')) or (not code.endswith('m'))):
+            # Not a color/style code, but it may depend on the colors.
+            if (current is not None) and (current != emitted):
+                append(transition(emitted, current))
+                emitted = current
+            append(code)
+            continue
+        key = (current, code)
+        newstate = nextstates.get(key, key)
+        if newstate is key:
+            newstate = nextstates[key] = _next_state(current, code)
+        if newstate is None:
+            # The state can't be known after this code, so it is written
+            # as-is, after anything that came before it.
+            if (current is not None) and (current != emitted):
+                append(transition(emitted, current))
+            append(code)
+            emitted = None
+        current = newstate
+    if (current is not None) and (current != emitted):
+        append(transition(emitted, current))
+    return ''.join(out)
+
+
+def sgr_state_at(s: Union[str, ChainedBase], index: int) -> SgrState:
+    """ Return the state for the visible character at `index` in a colored
+        string. Negative indexes count from the end.
+        Raises IndexError if there is no character at `index`.
+    """
+    tokens = s.tokens() if isinstance(s, ChainedBase) else tokenize(s)
+    length = tokens.text_length()
+    if index < 0:
+        index += length
+    if not (0 <= index < length):
+        raise IndexError('index out of range: {}'.format(index))
+    for text, state in iter_sgr_states(s):
+        if index < len(text):
+            return state
+        index -= len(text)
+    # Not reached, the index was checked against the visible length.
+    raise IndexError('index out of range: {}'.format(index))
+
+
+def truncate(
+        s: Union[str, ChainedBase],
+        width: int,
+        ellipsis: str='\u2026') -> str:
+    """ Truncate a colored string to `width` terminal columns.
+        If anything is cut off, the `ellipsis` is added in the colors at
+        the cut, and the colors are closed.
+        Strings that fit are returned as they are.
+        Scanning stops at the first character past `width`, so the rest of
+        a long string is never parsed.
+    """
+    s = str(s)
+    if _is_ascii(s) and (len(s) <= width):
+        # Escape codes only make the string longer than what is visible.
+        return s
+    ellipsis = ellipsis[:str_fit(ellipsis, width)]
+    keep = max(width - str_width(ellipsis), 0)
+    state = _default_state
+    cut = cutstate = None
+    pos = length = 0
+    # The last visible characters, because joiners and variation
+    # selectors can change the width of the text after a code.
+    context = ''
+    for match in codepat.finditer(s):
+        start, stop = match.span()
+        text = context + s[pos:start]
+        textlen = str_width(text) - str_width(context)
+        if (cut is None) and (length + textlen >= keep):
+            cut = pos - len(context) + str_fit(
+                text,
+                keep - length + str_width(context),
+            )
+            cutstate = state
+        length += textlen
+        context = text[-2:]
+        if length > width:
+            break
+        code = match.group()
+        if (cut is None) and code.endswith('m') and code.startswith('\033['):
+            # Unknown states (None) are closed, to be safe.
+            state = _next_state(state, code)
+        pos = stop
+    else:
+        text = context + s[pos:]
+        textlen = str_width(text) - str_width(context)
+        if length + textlen <= width:
+            return s
+        if cut is None:
+            cut = pos - len(context) + str_fit(
+                text,
+                keep - length + str_width(context),
+            )
+            cutstate = state
+    if not keep:
+        return ellipsis
+    return ''.join((
+        s[:cut],
+        ellipsis,
+        closing_code if cutstate != _default_state else '',
+    ))
+
+
+def wrap(s: Union[str, ChainedBase], width: int) -> List[str]:
+    """ Wrap a colored string into lines of at most `width` terminal
+        columns, like `textwrap.wrap()`.
+        Lines are broken at spaces/tabs when possible, and existing
+        newlines are kept as line breaks (like `str.splitlines()`).
+        Each line starts with the colors and styles that were active at
+        that point, and closes them at the end, so the lines can be
+        printed on their own.
+        This is one pass over the string, no matter how many lines there
+        are.
+    """
+    if width < 1:
+        raise ValueError('Expecting a width of 1 or more, got: {}'.format(
+            width,
+        ))
+    tokens = s.tokens() if isinstance(s, ChainedBase) else tokenize(s)
+    spans = _wrap_spans(tokens.stripped(), width)
+    return [
+        line + closing_code if state != _default_state else line
+        for line, state in _iter_visible_slices(tokens, spans)
+    ]
@@ -39,13 +39,33 @@ Resources:
     FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
     DEALINGS IN THE SOFTWARE.
 """
+import base64
 import re
+import zlib
+from array import array
 from types import GeneratorType
-from typing import cast, Any, Optional, Tuple, Union
+from typing import (
+    cast,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .cache import LRUCache
+
+# NumPy is slow to import, so the `*_array()` functions import it on first
+# use (see `_import_numpy()`). False means it hasn't been tried yet, and None
+# means it is not installed.
+np = False  # type: Any
 
 # Custom types.
 Numeric = Union[int, str]
 RGB = Tuple[int, int, int]
+Lab = Tuple[float, float, float]
 
 # Original lookup table provided by Micah Elliott (colortrans.py).
 # Modified to dict by Christopher Welborn.
@@ -325,6 +345,275 @@ term2hex_map = {
 # Sorting it means that the last duplicated value will always be used.
 hex2term_map = {term2hex_map[k]: k for k in sorted(term2hex_map)}
 
+# Channel values for the 6x6x6 xterm color cube (codes 16-231).
+_cube_steps = (0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff)
+_cube_hex = tuple('{:02x}'.format(step) for step in _cube_steps)
+# Plain 6-digit hex strings, for the fast path in `hex2term_int()`.
+_hex6_pat = re.compile('[0-9a-fA-F]{6}')
+
+
+def _nearest_step(part: Union[int, float]) -> int:
+    """ Return the index of the cube step nearest to a channel value.
+        Ties go to the bigger step.
+    """
+    for i, bigger in enumerate(_cube_steps[1:]):
+        if part <= bigger:
+            smaller = _cube_steps[i]
+            return i if (part - smaller) < (bigger - part) else i + 1
+    return len(_cube_steps) - 1
+
+
+# Nearest cube step (0-5) for every channel value, so finding a cube color
+# is three lookups instead of a search for each channel.
+_cube_index = bytes(_nearest_step(part) for part in range(256))
+
+
+def _cube_indexes(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    """ Return the nearest cube step index for each channel.
+        Raises ValueError for values outside of 0-255.
+    """
+    if not ((0 <= r <= 255) and (0 <= g <= 255) and (0 <= b <= 255)):
+        raise ValueError(
+            'Expecting 0-255 for RGB code, got: {!r}'.format((r, g, b))
+        )
+    index = _cube_index
+    try:
+        return index[r], index[g], index[b]
+    except TypeError:
+        # Not ints, so they can't be looked up.
+        return _nearest_step(r), _nearest_step(g), _nearest_step(b)
+
+
+# Linear light for each sRGB channel value, for `_oklab()`.
+_srgb_linear = tuple(
+    (value / 12.92) if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+    for value in (part / 255 for part in range(256))
+)
+# Nearest palette colors for `rgb2term_nearest()`, by 8x8x8 RGB cell (see
+# `nearest_data`). A cell is either the code for every color in it, or the
+# candidate codes as bytes. Unpacked on first use, with `_nearest_labs`.
+_nearest_cells = None  # type: Optional[List[Any]]
+# OKLab value for each terminal code, for the candidates in `_nearest_cells`.
+_nearest_labs = []  # type: List[Lab]
+
+
+def _load_nearest_cells() -> List[Any]:
+    """ Unpack the candidate codes for `rgb2term_nearest()`, the first time
+        they are needed.
+    """
+    global _nearest_cells, _nearest_labs
+    if _nearest_cells is None:
+        from .nearest_data import cells_packed
+        data = zlib.decompress(base64.b64decode(cells_packed))
+        cells = []  # type: List[Any]
+        append = cells.append
+        i = 0
+        end = len(data)
+        while i < end:
+            count = data[i]
+            if count == 1:
+                append(data[i + 1])
+            else:
+                append(data[i + 1:i + 1 + count])
+            i += count + 1
+        _nearest_labs = [_oklab(*term2rgb(code)) for code in range(256)]
+        _nearest_cells = cells
+    return _nearest_cells
+
+
+def _oklab(r: int, g: int, b: int) -> Lab:
+    """ Convert an sRGB value (0-255 channels) to OKLab. Distances in OKLab
+        follow how different two colors look, unlike distances in RGB.
+    """
+    lr, lg, lb = _srgb_linear[r], _srgb_linear[g], _srgb_linear[b]
+    lms_l = (0.4122214708 * lr + 0.5363325363 * lg + 0.0514459929 * lb)
+    lms_m = (0.2119034982 * lr + 0.6806995451 * lg + 0.1073969566 * lb)
+    lms_s = (0.0883024619 * lr + 0.2817188376 * lg + 0.6299787005 * lb)
+    lms_l, lms_m, lms_s = lms_l ** (1 / 3), lms_m ** (1 / 3), lms_s ** (1 / 3)
+    return (
+        0.2104542553 * lms_l + 0.7936177850 * lms_m - 0.0040720468 * lms_s,
+        1.9779984951 * lms_l - 2.4285922050 * lms_m + 0.4505937099 * lms_s,
+        0.0259040371 * lms_l + 0.7827717662 * lms_m - 0.8086757660 * lms_s,
+    )
+
+
+# NumPy lookup tables for the `*_array()` functions, built on first use.
+_batch_table_cache = None  # type: Optional[dict]
+
+
+def _batch_tables() -> dict:
+    """ Return the NumPy lookup tables for the `*_array()` functions,
+        building them on the first call.
+    """
+    global _batch_table_cache
+    if _batch_table_cache is not None:
+        return _batch_table_cache
+    palette = [
+        (hex2rgb(hexval), int(code))
+        for hexval, code in hex2term_map.items()
+    ]
+    # Value of each hex digit by code point, with -1 for anything else.
+    hex_values = np.full(129, -1, dtype=np.int16)
+    for i, char in enumerate('0123456789abcdef'):
+        hex_values[ord(char)] = hex_values[ord(char.upper())] = i
+    _batch_table_cache = {
+        'cube_index': np.frombuffer(_cube_index, dtype=np.uint8),
+        'cube_mids': np.array([
+            (smaller + bigger) / 2
+            for smaller, bigger in zip(_cube_steps, _cube_steps[1:])
+        ]),
+        'cube_steps': np.array(_cube_steps, dtype=np.uint8),
+        'hex_digits': np.array(list('0123456789abcdef')).view(np.uint32),
+        'hex_values': hex_values,
+        'palette_codes': np.array(
+            [code for _, code in palette],
+            dtype=np.uint8,
+        ),
+        'palette_lab': np.array([_oklab(*rgb) for rgb, _ in palette]),
+        'srgb_linear': np.array(_srgb_linear),
+        'term_hex': np.array(
+            [term2hex_map['{:02}'.format(code)] for code in range(256)]
+        ),
+        'term_rgb': np.array(
+            [term2rgb(code) for code in range(256)],
+            dtype=np.uint8,
+        ),
+    }
+    return _batch_table_cache
+
+
+def _code_array(codes: Any) -> Any:
+    """ Return an (N,) int array from terminal codes (ints or number
+        strings). Raises ValueError for anything else, or codes outside of
+        0-255.
+    """
+    values = np.asarray(codes)
+    if values.size == 0:
+        return np.zeros(0, dtype=np.intp)
+    if values.ndim != 1:
+        raise ValueError(
+            'Expecting an (N,) array of terminal codes, got shape: {}'.format(
+                values.shape
+            )
+        )
+    if values.dtype.kind in 'SU':
+        try:
+            values = values.astype(np.intp)
+        except ValueError:
+            raise ValueError(
+                'Expecting ints or number strings, got: {!r}'.format(codes)
+            )
+    elif values.dtype.kind not in 'iu':
+        raise ValueError(
+            'Expecting ints or number strings, got: {}'.format(values.dtype)
+        )
+    if (values.min() < 0) or (values.max() > 255):
+        raise ValueError('Expecting 0-255 for terminal codes.')
+    return values
+
+
+def _cube_index_array(values: Any) -> Any:
+    """ Return the nearest cube step index for each value in an array of
+        channel values (from `_rgb_array()`). Ties go to the bigger step,
+        like `_nearest_step()`.
+    """
+    tables = _batch_tables()
+    if values.dtype.kind in 'iu':
+        return tables['cube_index'][values]
+    return np.searchsorted(
+        tables['cube_mids'],
+        values,
+        side='right',
+    ).astype(np.uint8)
+
+
+def _hex_array(values: Any) -> Any:
+    """ Return an (N,) array of hex strings from an (N, 3) uint8 array,
+        without formatting each value.
+    """
+    digits = _batch_tables()['hex_digits']
+    chars = np.empty((len(values), 6), dtype=np.uint32)
+    chars[:, 0::2] = digits[values >> 4]
+    chars[:, 1::2] = digits[values & 0xf]
+    return chars.view('U6').ravel()
+
+
+def _import_numpy() -> Any:
+    """ Import NumPy for the `*_array()` functions, the first time they
+        are used. Returns None if NumPy is not installed, and the functions
+        fall back to `array` and lists.
+    """
+    global np
+    if np is False:
+        try:
+            import numpy
+        except ImportError:
+            np = None
+        else:
+            np = numpy
+    return np
+
+
+def _palette_nearest_array(values: Any) -> Any:
+    """ Return the code for the palette color nearest to each rgb value in
+        an (N, 3) array, like `rgb2term_nearest()`. Each unique color is
+        only searched once.
+    """
+    tables = _batch_tables()
+    ints = values.astype(np.intp)
+    packed = (ints[:, 0] << 16) | (ints[:, 1] << 8) | ints[:, 2]
+    unique, inverse = np.unique(packed, return_inverse=True)
+    linear = tables['srgb_linear']
+    lr = linear[unique >> 16]
+    lg = linear[(unique >> 8) & 0xff]
+    lb = linear[unique & 0xff]
+    lms_l = np.cbrt(0.4122214708 * lr + 0.5363325363 * lg + 0.0514459929 * lb)
+    lms_m = np.cbrt(0.2119034982 * lr + 0.6806995451 * lg + 0.1073969566 * lb)
+    lms_s = np.cbrt(0.0883024619 * lr + 0.2817188376 * lg + 0.6299787005 * lb)
+    labs = np.stack(
+        (
+            0.2104542553 * lms_l + 0.7936177850 * lms_m - 0.0040720468 * lms_s,
+            1.9779984951 * lms_l - 2.4285922050 * lms_m + 0.4505937099 * lms_s,
+            0.0259040371 * lms_l + 0.7827717662 * lms_m - 0.8086757660 * lms_s,
+        ),
+        axis=1,
+    )
+    palette = tables['palette_lab']
+    # |lab - p|^2 is |lab|^2 - 2(lab . p) + |p|^2, and |lab|^2 doesn't
+    # change which palette color is nearest.
+    palette_sq = (palette * palette).sum(axis=1)
+    best = np.empty(len(unique), dtype=np.intp)
+    # Compare against the whole palette in chunks, to bound memory use.
+    chunksize = 4096
+    for start in range(0, len(unique), chunksize):
+        dists = palette_sq - 2 * (labs[start:start + chunksize] @ palette.T)
+        best[start:start + chunksize] = dists.argmin(axis=1)
+    return tables['palette_codes'][best][inverse.ravel()]
+
+
+def _rgb_array(rgbs: Any) -> Any:
+    """ Return an (N, 3) int or float array from rgb values.
+        Raises ValueError for anything else, or values outside of 0-255.
+    """
+    values = np.asarray(rgbs)
+    if values.size == 0:
+        return np.zeros((0, 3), dtype=np.uint8)
+    if (values.ndim != 2) or (values.shape[1] != 3):
+        raise ValueError(
+            'Expecting an (N, 3) array of RGB values, got shape: {}'.format(
+                values.shape
+            )
+        )
+    if values.dtype.kind not in 'iuf':
+        raise ValueError(
+            'Expecting numbers for RGB values, got: {}'.format(values.dtype)
+        )
+    if (values.dtype.kind == 'f') and not np.isfinite(values).all():
+        raise ValueError('Expecting 0-255 for RGB values, got NaN/inf.')
+    if (values.min() < 0) or (values.max() > 255):
+        raise ValueError('Expecting 0-255 for RGB values.')
+    return values
+
 
 def fix_hex(hexval: str) -> str:
     hexval = hexval.strip().lstrip('#').lower()
@@ -377,9 +666,85 @@ def hex2rgb(hexval: str, allow_short: bool=False) -> RGB:
     return r, g, b
 
 
-def hex2term(hexval: str, allow_short: bool=False) -> str:
-    """ Convert a hex value into the nearest terminal code number. """
-    return rgb2term(*hex2rgb(hexval, allow_short=allow_short))
+def hex2rgb_array(hexvals: Iterable[str], allow_short: bool=False) -> Any:
+    """ Like `hex2rgb()`, for many hex strings at once.
+        With NumPy, this accepts an (N,) array (or list) of hex strings and
+        returns an (N, 3) uint8 array.
+        Without NumPy, this returns a list of (R, G, B) tuples.
+        Raises ValueError if any of the hex strings are invalid.
+    """
+    if _import_numpy() is None:
+        return [hex2rgb(hexval, allow_short=allow_short) for hexval in hexvals]
+    values = np.asarray(hexvals)
+    if values.size == 0:
+        return np.zeros((0, 3), dtype=np.uint8)
+    if (values.ndim != 1) or (values.dtype.kind != 'U'):
+        raise ValueError(
+            'Expecting an (N,) array of hex strings, got: {} {}'.format(
+                values.dtype,
+                values.shape,
+            )
+        )
+    values = np.char.lstrip(np.char.strip(values), '#')
+    lengths = np.char.str_len(values)
+    # Code points for each digit, so they can be looked up all at once.
+    digits = np.zeros((len(values), 6), dtype=np.uint32)
+    valid = lengths == 6
+    digits[valid] = values[valid].astype('U6').view(np.uint32).reshape(-1, 6)
+    if allow_short:
+        short = lengths == 3
+        digits[short] = np.repeat(
+            values[short].astype('U3').view(np.uint32).reshape(-1, 3),
+            2,
+            axis=1,
+        )
+        valid |= short
+    if not valid.all():
+        raise ValueError(
+            'Not a length 3 or 6 hex string (#RGB, #RRGGBB), got: {}'.format(
+                values[~valid][0]
+            )
+        )
+    nibbles = _batch_tables()['hex_values'][np.minimum(digits, 128)]
+    invalid = (nibbles < 0).any(axis=1)
+    if invalid.any():
+        raise ValueError('Invalid hex value: {}'.format(values[invalid][0]))
+    return ((nibbles[:, 0::2] << 4) | nibbles[:, 1::2]).astype(np.uint8)
+
+
+def hex2term(
+        hexval: str,
+        allow_short: bool=False,
+        perceptual: bool=False) -> str:
+    """ Convert a hex value into the nearest terminal code number.
+        If `perceptual` is truthy, the whole palette is searched for the
+        color that looks closest (see `rgb2term_nearest()`).
+    """
+    return '{:02}'.format(hex2term_int(
+        hexval,
+        allow_short=allow_short,
+        perceptual=perceptual,
+    ))
+
+
+def hex2term_int(
+        hexval: str,
+        allow_short: bool=False,
+        perceptual: bool=False) -> int:
+    """ Convert a hex value into the nearest terminal code number, as an
+        int. This skips the string formatting that `hex2term()` does.
+        If `perceptual` is truthy, the whole palette is searched for the
+        color that looks closest (see `rgb2term_nearest()`).
+    """
+    if isinstance(hexval, str) and (len(hexval) == 6) and (
+            _hex6_pat.match(hexval)):
+        value = int(hexval, 16)
+        r, g, b = (value >> 16), (value >> 8) & 0xff, value & 0xff
+    else:
+        r, g, b = hex2rgb(hexval, allow_short=allow_short)
+    if perceptual:
+        return rgb2term_nearest(r, g, b)
+    return rgb2term_int(r, g, b)
 
 
 def hex2termhex(hexval: str, allow_short: bool=False) -> str:
@@ -418,40 +783,114 @@ def rgb2hex(r: int, g: int, b: int) -> str:
     return '{:02x}{:02x}{:02x}'.format(r, g, b)
 
 
-def rgb2term(r: int, g: int, b: int) -> str:
-    """ Convert an rgb value to a terminal code. """
-    return hex2term_map[rgb2termhex(r, g, b)]
+def rgb2hex_array(rgbs: Iterable[RGB]) -> Any:
+    """ Like `rgb2hex()`, for many rgb values at once.
+        With NumPy, this accepts an (N, 3) array (or list) of rgb values and
+        returns an (N,) array of hex strings. Float values are truncated.
+        Without NumPy, this returns a list of hex strings.
+        Raises ValueError for values outside of 0-255.
+    """
+    if _import_numpy() is None:
+        return [rgb2hex(*rgb) for rgb in rgbs]
+    return _hex_array(_rgb_array(rgbs).astype(np.uint8))
+
+
+def rgb2term(r: int, g: int, b: int, perceptual: bool=False) -> str:
+    """ Convert an rgb value to a terminal code.
+        If `perceptual` is truthy, the whole palette is searched for the
+        color that looks closest (see `rgb2term_nearest()`).
+    """
+    if perceptual:
+        return '{:02}'.format(rgb2term_nearest(r, g, b))
+    return str(rgb2term_int(r, g, b))
+
+
+def rgb2term_array(rgbs: Iterable[RGB], perceptual: bool=False) -> Any:
+    """ Like `rgb2term_int()`, for many rgb values at once.
+        With NumPy, this accepts an (N, 3) array (or list) of rgb values and
+        returns an (N,) uint8 array of terminal codes.
+        Without NumPy, this returns an `array('B')` of terminal codes.
+        If `perceptual` is truthy, the whole palette is searched for the
+        color that looks closest (see `rgb2term_nearest()`).
+        Raises ValueError for values outside of 0-255.
+    """
+    if _import_numpy() is None:
+        convert = rgb2term_nearest if perceptual else rgb2term_int
+        return array('B', (convert(*rgb) for rgb in rgbs))
+    values = _rgb_array(rgbs)
+    if perceptual:
+        return _palette_nearest_array(values)
+    indexes = _cube_index_array(values).astype(np.intp)
+    codes = 16 + (36 * indexes[:, 0]) + (6 * indexes[:, 1]) + indexes[:, 2]
+    return codes.astype(np.uint8)
+
+
+def rgb2term_int(r: int, g: int, b: int) -> int:
+    """ Convert an rgb value to the nearest terminal code in the color
+        cube (16-231), as an int. This skips the string formatting that
+        `rgb2term()` does.
+    """
+    ri, gi, bi = _cube_indexes(r, g, b)
+    return 16 + (36 * ri) + (6 * gi) + bi
+
+
+def rgb2term_nearest(r: int, g: int, b: int) -> int:
+    """ Return the terminal code (0-255) for the palette color that looks
+        closest to an rgb value, measured in the OKLab color space.
+        Unlike `rgb2term_int()`, this also considers the basic colors and
+        the grayscale ramp, so grays and muted colors match much better.
+        Most colors are a table lookup, the rest only measure the distance
+        to a few candidates (see `nearest_data`).
+        Raises ValueError for values outside of 0-255.
+    """
+    if not ((0 <= r <= 255) and (0 <= g <= 255) and (0 <= b <= 255)):
+        raise ValueError(
+            'Expecting 0-255 for RGB code, got: {!r}'.format((r, g, b))
+        )
+    cells = _nearest_cells
+    if cells is None:
+        cells = _load_nearest_cells()
+    try:
+        cell = cells[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)]
+    except TypeError:
+        # Not ints.
+        r, g, b = int(r), int(g), int(b)
+        cell = cells[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)]
+    if cell.__class__ is int:
+        return cell
+    lab_l, lab_a, lab_b = _oklab(r, g, b)
+    labs = _nearest_labs
+    bestdist = float('inf')
+    bestcode = 0
+    for code in cell:
+        cand_l, cand_a, cand_b = labs[code]
+        dl, da, db = lab_l - cand_l, lab_a - cand_a, lab_b - cand_b
+        dist = dl * dl + da * da + db * db
+        if dist < bestdist:
+            bestdist, bestcode = dist, code
+    return bestcode
 
 
 def rgb2termhex(r: int, g: int, b: int) -> str:
     """ Convert an rgb value to the nearest hex value that matches a term code.
         The hex value will be one in `hex2term_map`.
     """
-    incs = [0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff]
+    ri, gi, bi = _cube_indexes(r, g, b)
+    cubehex = _cube_hex
+    return ''.join((cubehex[ri], cubehex[gi], cubehex[bi]))
 
-    res = []
-    parts = r, g, b
-    for part in parts:
-        if (part < 0) or (part > 255):
-            raise ValueError(
-                'Expecting 0-255 for RGB code, got: {!r}'.format(parts)
-            )
-        i = 0
-        while i < len(incs) - 1:
-            s, b = incs[i], incs[i + 1]  # smaller, bigger
-            if s <= part <= b:
-                s1 = abs(s - part)
-                b1 = abs(b - part)
-                if s1 < b1:
-                    closest = s
-                else:
-                    closest = b
-                res.append(closest)
-                break
-            i += 1
-
-    # Convert back into nearest hex value.
-    return rgb2hex(*res)
+
+def rgb2termhex_array(rgbs: Iterable[RGB]) -> Any:
+    """ Like `rgb2termhex()`, for many rgb values at once.
+        With NumPy, this accepts an (N, 3) array (or list) of rgb values and
+        returns an (N,) array of hex strings.
+        Without NumPy, this returns a list of hex strings.
+        Raises ValueError for values outside of 0-255.
+    """
+    if _import_numpy() is None:
+        return [rgb2termhex(*rgb) for rgb in rgbs]
+    steps = _batch_tables()['cube_steps']
+    return _hex_array(steps[_cube_index_array(_rgb_array(rgbs))])
 
 
 def term2hex(code: Numeric, default: Optional[str]=None) -> str:
@@ -469,11 +908,44 @@ def term2hex(code: Numeric, default: Optional[str]=None) -> str:
     return val
 
 
+def term2hex_array(codes: Iterable[Numeric]) -> Any:
+    """ Like `term2hex()`, for many terminal codes at once.
+        With NumPy, this accepts an (N,) array (or list) of codes and
+        returns an (N,) array of hex strings, and raises ValueError for
+        codes outside of 0-255.
+        Without NumPy, this returns a list of hex strings (or None for
+        unknown codes, like `term2hex()`).
+    """
+    if _import_numpy() is None:
+        return [term2hex(code) for code in codes]
+    return _batch_tables()['term_hex'][_code_array(codes)]
+
+
 def term2rgb(code: Numeric) -> RGB:
     """ Convert a terminal code to an rgb value. """
     return hex2rgb(term2hex(code))
 
 
+def term2rgb_array(codes: Iterable[Numeric]) -> Any:
+    """ Like `term2rgb()`, for many terminal codes at once.
+        With NumPy, this accepts an (N,) array (or list) of codes and
+        returns an (N, 3) uint8 array.
+        Without NumPy, this returns a list of (R, G, B) tuples.
+        Raises ValueError for codes outside of 0-255.
+    """
+    if _import_numpy() is None:
+        return [term2rgb(code) for code in codes]
+    return _batch_tables()['term_rgb'][_code_array(codes)]
+
+
+# Interned ColorCodes for `ColorCode.from_code()`, by (class, perceptual).
+# Each one is a tuple with one instance for every terminal code (0-255),
+# built on first use.
+_colorcode_palettes = {}  # type: Dict[Tuple[type, bool], tuple]
+# Interned rgb mode ColorCodes, by (class, kind, value, perceptual).
+colorcode_cache = LRUCache(maxsize=4096)
+
+
 class ColorCode(object):
     """ A color code value that automatically converts from/to hex, term, rgb.
         Initialize with a hex str, code str/int, or rgb tuple/list/generator,
@@ -482,53 +954,66 @@ class ColorCode(object):
             code   : Terminal code number as a string.
             hexval : Nearest matching hex value.
             rgb    : Tuple of nearest matching (Red, Green, Blue) values.
+        If `perceptual` is truthy, hex/rgb values match the palette color
+        that looks closest (see `rgb2term_nearest()`), instead of the
+        nearest color cube value.
+
+        ColorCodes are immutable, and compare equal when they have the same
+        values. The `from_*` class methods return shared (interned)
+        instances instead of building new ones.
     """
-    __slots__ = ('code', 'hexval', 'rgb', 'rgb_mode')
+    __slots__ = ('_hash', 'code', 'hexval', 'perceptual', 'rgb', 'rgb_mode')
 
     def __init__(
             self,
             code: Optional[Any]=None,
-            rgb_mode: Optional[bool]=False) -> None:
-        self.rgb = (0, 0, 0)  # type: RGB
-        self.hexval = None  # type: str
-        self.code = None  # type: str
-        self.rgb_mode = rgb_mode  # type: bool
-        # Init tries to be smart about converting code types.
-        typeerrmsg = 'Expecting hex, term-code, or rgb. Got: {}'.format(
-            getattr(code, '__name__', type(code).__name__)
-        )
-        if isinstance(code, (list, tuple, GeneratorType)):
-            try:
-                # cast is only needed to satisfy mypy. 'code' would work fine.
-                r, g, b = cast(RGB, code)
-            except ValueError:
-                raise TypeError(typeerrmsg)
-            self._init_rgb(r, g, b)
-        elif isinstance(code, str):
-            try:
-                # Try hex str.
-                rgb = hex2rgb(code)
-                self._init_rgb(*rgb)
-            except (TypeError, ValueError):
-                # Int as str.
-                try:
-                    termcode = int(code)
-                except (TypeError, ValueError):
-                    # Must be hex value.
-                    self._init_hex(code)
-                else:
-                    # Term code was passed by str.
-                    self._init_code(termcode)
-        elif isinstance(code, int):
-            # Term code was passed.
-            self._init_code(code)
+            rgb_mode: Optional[bool]=False,
+            perceptual: Optional[bool]=False) -> None:
+        object.__setattr__(self, 'rgb_mode', rgb_mode)
+        object.__setattr__(self, 'perceptual', perceptual)
+        kind, value = self._parse_value(code)
+        if kind == 'rgb':
+            self._init_rgb(*value)
+        elif kind == 'code':
+            self._init_code(value)
         else:
-            raise TypeError(typeerrmsg)
+            self._init_hex(value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('ColorCode instances are immutable.')
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, ColorCode):
+            return NotImplemented
+        return (self._hash == other._hash) and (
+            (self.code, self.hexval, self.rgb, self.rgb_mode) ==
+            (other.code, other.hexval, other.rgb, other.rgb_mode)
+        )
 
     def __format__(self, fmt: str) -> str:
         """ Pass on any format calls to str(self). """
         return format(str(self), fmt)
 
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        return (
+            self._from_values,
+            (
+                self.code,
+                self.hexval,
+                self.rgb,
+                self.rgb_mode,
+                self.perceptual,
+            ),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('ColorCode instances are immutable.')
+
     def __str__(self) -> str:
         """ A console friendly representation. """
         return ', '.join((
@@ -537,12 +1022,26 @@ class ColorCode(object):
             'RGB: {rgb}'
         )).format(s=self, rgb=', '.join('{:>3}'.format(i) for i in self.rgb))
 
+    @classmethod
+    def _from_values(
+            cls,
+            code: str,
+            hexval: str,
+            rgb: RGB,
+            rgb_mode: Optional[bool]=False,
+            perceptual: Optional[bool]=False) -> 'ColorCode':
+        """ Return a new ColorCode from values that are already known. """
+        c = cls.__new__(cls)
+        object.__setattr__(c, 'rgb_mode', rgb_mode)
+        object.__setattr__(c, 'perceptual', perceptual)
+        c._set_values(code, hexval, rgb)
+        return c
+
     def _init_code(self, code: int) -> None:
         """ Initialize from an int terminal code. """
         if -1 < code < 256:
-            self.code = '{:02}'.format(code)
-            self.hexval = term2hex(code)
-            self.rgb = hex2rgb(self.hexval)
+            hexval = term2hex(code)
+            self._set_values('{:02}'.format(code), hexval, hex2rgb(hexval))
         else:
             raise ValueError(' '.join((
                 'Code must be in the range 0-255, inclusive.',
@@ -551,20 +1050,68 @@ class ColorCode(object):
 
     def _init_hex(self, hexval: str) -> None:
         """ Initialize from a hex value string. """
-        self.hexval = hex2termhex(fix_hex(hexval))
-        self.code = hex2term(self.hexval)
-        self.rgb = hex2rgb(self.hexval)
+        self._init_rgb(*hex2rgb(fix_hex(hexval)))
 
     def _init_rgb(self, r: int, g: int, b: int) -> None:
         """ Initialize from red, green, blue args. """
         if self.rgb_mode:
-            self.rgb = (r, g, b)
-            self.hexval = rgb2hex(r, g, b)
+            hexval = rgb2hex(r, g, b)
+            self._set_values(
+                hex2term(hexval, perceptual=self.perceptual),
+                hexval,
+                (r, g, b),
+            )
+            return
+        if self.perceptual:
+            self._init_code(rgb2term_nearest(r, g, b))
         else:
-            self.rgb = hex2rgb(rgb2termhex(r, g, b))
-            self.hexval = rgb2termhex(r, g, b)
+            self._init_code(rgb2term_int(r, g, b))
+
+    @staticmethod
+    def _parse_value(code: Any) -> Tuple[str, Any]:
+        """ Figure out what kind of value was passed to `__init__()` or
+            `from_value()`.
+            Returns one of: ('code', int), ('hex', str), or ('rgb', RGB).
+            Raises TypeError for anything else.
+        """
+        # Tries to be smart about converting code types.
+        typeerrmsg = 'Expecting hex, term-code, or rgb. Got: {}'.format(
+            getattr(code, '__name__', type(code).__name__)
+        )
+        if isinstance(code, (list, tuple, GeneratorType)):
+            try:
+                # cast is only needed to satisfy mypy. 'code' would work fine.
+                r, g, b = cast(RGB, code)
+            except ValueError:
+                raise TypeError(typeerrmsg)
+            return 'rgb', (r, g, b)
+        elif isinstance(code, str):
+            try:
+                # Try hex str.
+                return 'rgb', hex2rgb(code)
+            except (TypeError, ValueError):
+                # Int as str.
+                try:
+                    termcode = int(code)
+                except (TypeError, ValueError):
+                    # Must be hex value.
+                    return 'hex', code
+                # Term code was passed by str.
+                return 'code', termcode
+        elif isinstance(code, int):
+            # Term code was passed.
+            return 'code', code
+        raise TypeError(typeerrmsg)
 
-        self.code = hex2term(self.hexval)
+    def _set_values(self, code: str, hexval: str, rgb: RGB) -> None:
+        """ Set the code, hex, and rgb values. This is only used while
+            initializing, because ColorCodes are immutable.
+        """
+        setvalue = object.__setattr__
+        setvalue(self, 'code', code)
+        setvalue(self, 'hexval', hexval)
+        setvalue(self, 'rgb', rgb)
+        setvalue(self, '_hash', hash((code, hexval, rgb, self.rgb_mode)))
 
     def example(self) -> str:
         """ Same as str(self), except the color codes are actually used. """
@@ -575,25 +1122,115 @@ class ColorCode(object):
         return '{code}{s}\033[0m'.format(code=colorcode, s=self)
 
     @classmethod
-    def from_code(cls, code: int) -> 'ColorCode':
-        """ Return a ColorCode from a terminal code. """
-        c = cls()
-        c._init_code(code)
-        return c
+    def from_code(
+            cls,
+            code: Numeric,
+            rgb_mode: Optional[bool]=False,
+            perceptual: Optional[bool]=False) -> 'ColorCode':
+        """ Return an interned ColorCode from a terminal code (0-255), as an
+            int or number string.
+            The values don't depend on `perceptual`, but it is kept on the
+            instance like `ColorCode(code, perceptual=True)` does.
+            Raises ValueError for anything else.
+        """
+        try:
+            index = int(code)
+        except (TypeError, ValueError):
+            raise ValueError(
+                'Expecting an int or number string, got: {!r}'.format(code)
+            )
+        perceptual = bool(perceptual)
+        if rgb_mode:
+            key = (cls, 'code', index, perceptual)
+            c = colorcode_cache.get(key)
+            if c is None:
+                c = colorcode_cache.set(
+                    key,
+                    cls(index, rgb_mode=True, perceptual=perceptual),
+                )
+            return c
+        palettekey = (cls, perceptual)
+        palette = _colorcode_palettes.get(palettekey)
+        if palette is None:
+            palette = _colorcode_palettes[palettekey] = tuple(
+                cls(i, perceptual=perceptual) for i in range(256)
+            )
+        if not (-1 < index < 256):
+            # Let ColorCode() build the error message.
+            cls(index)
+        return palette[index]
 
     @classmethod
-    def from_hex(cls, hexval: str) -> 'ColorCode':
-        """ Return a ColorCode from a hex string. """
-        c = cls()
-        c._init_hex(hexval)
-        return c
+    def from_hex(
+            cls,
+            hexval: str,
+            rgb_mode: Optional[bool]=False,
+            perceptual: Optional[bool]=False) -> 'ColorCode':
+        """ Return an interned ColorCode from a hex string (#RGB, #RRGGBB).
+            Raises ValueError for invalid hex strings.
+        """
+        if isinstance(hexval, str) and (len(hexval) == 6) and (
+                _hex6_pat.match(hexval)):
+            value = int(hexval, 16)
+            r, g, b = (value >> 16), (value >> 8) & 0xff, value & 0xff
+        else:
+            r, g, b = hex2rgb(hexval, allow_short=True)
+        return cls.from_rgb(r, g, b, rgb_mode=rgb_mode, perceptual=perceptual)
 
     @classmethod
-    def from_rgb(cls, r: int, g: int, b: int) -> 'ColorCode':
-        """ Return a ColorCode from a RGB tuple. """
-        c = cls()
-        c._init_rgb(r, g, b)
-        return c
+    def from_rgb(
+            cls,
+            r: int,
+            g: int,
+            b: int,
+            rgb_mode: Optional[bool]=False,
+            perceptual: Optional[bool]=False) -> 'ColorCode':
+        """ Return an interned ColorCode from red, green, and blue values.
+            Raises ValueError for values outside of 0-255.
+        """
+        if rgb_mode:
+            key = (cls, 'rgb', r, g, b, bool(perceptual))
+            c = colorcode_cache.get(key)
+            if c is None:
+                if not ((0 <= r <= 255) and (0 <= g <= 255) and (
+                        0 <= b <= 255)):
+                    raise ValueError(
+                        'Expecting 0-255 for RGB code, got: {!r}'.format(
+                            (r, g, b)
+                        )
+                    )
+                c = colorcode_cache.set(
+                    key,
+                    cls((r, g, b), rgb_mode=True, perceptual=perceptual),
+                )
+            return c
+        if perceptual:
+            return cls.from_code(rgb2term_nearest(r, g, b), perceptual=True)
+        return cls.from_code(rgb2term_int(r, g, b))
+
+    @classmethod
+    def from_value(
+            cls,
+            code: Any,
+            rgb_mode: Optional[bool]=False,
+            perceptual: Optional[bool]=False) -> 'ColorCode':
+        """ Return an interned ColorCode from a hex str, code str/int, or
+            rgb tuple/list/generator, like `ColorCode(code)` does.
+        """
+        kind, value = cls._parse_value(code)
+        if kind == 'rgb':
+            return cls.from_rgb(
+                *value,
+                rgb_mode=rgb_mode,
+                perceptual=perceptual
+            )
+        elif kind == 'code':
+            return cls.from_code(
+                value,
+                rgb_mode=rgb_mode,
+                perceptual=perceptual,
+            )
+        return cls.from_hex(value, rgb_mode=rgb_mode, perceptual=perceptual)
 
     def to_dict(self) -> dict:
         """ Return a dict of code, hexval, and rgb values. """
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" colr/width.py
+
+    Terminal column widths for text, so East Asian wide characters,
+    combining marks, and emoji sequences line up when justifying and
+    wrapping.
+
+    The MIT License (MIT)
+
+    Copyright (c) 2015-2017 Christopher Welborn
+
+    Permission is hereby granted, free of charge, to any person obtaining a
+    copy of this software and associated documentation files (the "Software"),
+    to deal in the Software without restriction, including without limitation
+    the rights to use, copy, modify, merge, publish, distribute, sublicense,
+    and/or sell copies of the Software, and to permit persons to whom the
+    Software is furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in
+    all copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+    THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+    FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+    DEALINGS IN THE SOFTWARE.
+"""
+import re
+from array import array
+from bisect import bisect_right
+from typing import (  # noqa
+    Tuple,
+)
+
+from .cache import LRUCache
+from .width_data import wide_ranges, zero_ranges
+
+__all__ = [
+    'char_width',
+    'column_offsets',
+    'str_fit',
+    'str_width',
+    'width_cache',
+]
+
+# Cache for str_width() on strings that are not plain ASCII.
+width_cache = LRUCache(maxsize=1024)
+
+# A character after a zero width joiner is drawn as part of the glyph
+# before it (emoji sequences like family members, or a flag with a
+# rainbow).
+_zwj_pat = re.compile('(?<=\u200d)(.)', flags=re.DOTALL)
+# Variation selector 16 asks for the wide (emoji) form of a narrow
+# character, unless that character was joined to the one before it.
+_vs16_pat = re.compile('(?<!\u200d)(.)(?=\ufe0f)', flags=re.DOTALL)
+
+
+def _build_table() -> Tuple[array, bytes]:
+    """ Build the width table from `width_data`.
+        Returns (bounds, widths), where every code point from `bounds[i]`
+        up to `bounds[i + 1]` is `widths[i]` columns wide.
+    """
+    ranges = sorted(
+        [(first, last, 0) for first, last in zero_ranges] +
+        [(first, last, 2) for first, last in wide_ranges]
+    )
+    bounds = array('I', [0])
+    widths = bytearray([1])
+    for first, last, width in ranges:
+        if bounds[-1] == first:
+            widths[-1] = width
+        else:
+            bounds.append(first)
+            widths.append(width)
+        bounds.append(last + 1)
+        widths.append(1)
+    return bounds, bytes(widths)
+
+
+_width_bounds, _width_values = _build_table()
+
+
+class _CharWidths(dict):
+    """ Width for each character, looked up in the table on first use.
+        There are only as many entries as there are distinct characters.
+    """
+    __slots__ = ()
+
+    def __missing__(self, char: str) -> int:
+        width = self[char] = _width_values[
+            bisect_right(_width_bounds, ord(char)) - 1
+        ]
+        return width
+
+
+_char_widths = _CharWidths()
+
+
+def _encodes_ascii(s: str) -> bool:
+    """ Return True if `s` only has ASCII characters, for Python versions
+        without `str.isascii()`.
+    """
+    try:
+        s.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+# str.isascii() is much faster, but it is new in Python 3.7.
+_is_ascii = getattr(str, 'isascii', _encodes_ascii)
+
+
+def char_width(char: str) -> int:
+    """ Return the number of terminal columns for a single character.
+        Combining marks and other zero width characters are 0, East Asian
+        wide/fullwidth characters are 2, and everything else is 1.
+    """
+    return _char_widths[char]
+
+
+def column_offsets(s: str) -> array:
+    """ Return the column where each character in `s` starts, with the
+        total width at the end. Zero width characters start at the same
+        column as the character after them, so a bisect on the offsets
+        never separates a character from its combining marks.
+        `s` should not have escape codes.
+    """
+    if _is_ascii(s):
+        return array('I', range(len(s) + 1))
+    widths = _char_widths
+    offsets = array('I', [0])
+    col = 0
+    prev = ''
+    joined = False
+    for char in s:
+        if prev == '\u200d':
+            joined = True
+        else:
+            if (char == '\ufe0f') and prev and (not joined):
+                col += widths[prev] == 1
+            else:
+                col += widths[char]
+            joined = False
+        offsets.append(col)
+        prev = char
+    return offsets
+
+
+def str_fit(s: str, width: int) -> int:
+    """ Return how many characters from the start of `s` fit in `width`
+        columns, including any zero width characters that follow them.
+        `s` should not have escape codes.
+    """
+    if _is_ascii(s):
+        return max(min(width, len(s)), 0)
+    if width < 0:
+        return 0
+    return bisect_right(column_offsets(s), width) - 1
+
+
+def str_width(s: str) -> int:
+    """ Return the number of terminal columns that `s` takes up.
+        This is `len(s)` for plain ASCII. Other strings are measured with
+        a table of East Asian wide and zero width characters, and cached
+        in `width_cache`.
+        `s` should not have escape codes.
+    """
+    if _is_ascii(s):
+        return len(s)
+    width = width_cache.get(s)
+    if width is not None:
+        return width
+    widths = _char_widths
+    width = sum(map(widths.__getitem__, s))
+    if '\u200d' in s:
+        width -= sum(map(widths.__getitem__, _zwj_pat.findall(s)))
+    if '\ufe0f' in s:
+        width += sum(
+            widths[char] == 1
+            for char in _vs16_pat.findall(s)
+        )
+    return width_cache.set(s, width)
@@ -0,0 +1,850 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" run_benchmarks.py
+    Run some rough benchmarks for the Colr library.
+    These are not unit tests, they just print timing information for
+    some of the hot paths, so regressions are easy to spot.
+"""
+
+import io
+import os
+import random
+import re
+import sys
+import textwrap
+import tracemalloc
+from timeit import Timer
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows.
+    resource = None
+
+try:
+    import numpy
+except ImportError:
+    # Only needed for bench_batch_convert.
+    numpy = None
+
+parentdir = os.path.split(os.path.abspath(sys.path[0]))[0]
+if parentdir.endswith('colr'):
+    # Use dev version before installed version.
+    sys.path.insert(0, parentdir)
+
+try:
+    from colr import (
+        __version__,
+        Colr,
+        color_mode,
+        colorize_batch,
+        complete_name,
+        docopt,
+        get_codes,
+        get_known_codes,
+        get_known_name,
+        iter_codes_bytes,
+        iter_sgr_states,
+        name_data,
+        nearest_name,
+        nearest_name_cache,
+        optimize,
+        parse_colr_arg,
+        strip_codes,
+        strip_codes_bytes,
+        StripStream,
+        str_width,
+    )
+    from colr.base import tokenize
+    from colr.sgr import (
+        truncate,
+        wrap,
+    )
+    from colr.controls import Control
+    from colr.trans import (
+        ColorCode,
+        hex2rgb,
+        hex2rgb_array,
+        hex2term,
+        hex2term_int,
+        hex2term_map,
+        rgb2hex,
+        rgb2hex_array,
+        rgb2term,
+        rgb2term_array,
+        rgb2term_int,
+        rgb2term_nearest,
+    )
+except ImportError as ex:
+    print('\nUnable to import Colr!: {}'.format(ex), file=sys.stderr)
+    sys.exit(1)
+
+
+# The alternation regex that the escape code parser replaced, for
+# bench_parser.
+legacy_codepat = re.compile(''.join((
+    '\033\\[(',
+    r'(([\d;]+)?m{1})|(\?25l)|(\?25h)|(([\d]+[;])?([\d]+[Hf]))|([su])|',
+    r'([\d]+[ABCDEFGHJKST])',
+    ')',
+)))
+
+
+def legacy_rgb2term(r, g, b):
+    """ The search that rgb2term() used before its lookup table, for
+        bench_term_lookup.
+    """
+    incs = [0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff]
+    res = []
+    for part in (r, g, b):
+        i = 0
+        while i < len(incs) - 1:
+            smaller, bigger = incs[i], incs[i + 1]
+            if smaller <= part <= bigger:
+                if abs(smaller - part) < abs(bigger - part):
+                    res.append(smaller)
+                else:
+                    res.append(bigger)
+                break
+            i += 1
+    return hex2term_map[rgb2hex(*res)]
+
+
+NAME = 'Colr Benchmarks'
+VERSIONSTR = '{} v. {}'.format(NAME, __version__)
+SCRIPT = os.path.split(os.path.abspath(sys.argv[0]))[1]
+SCRIPTDIR = os.path.abspath(sys.path[0])
+
+USAGESTR = """{versionstr}
+    Usage:
+        {script} -h | -v
+        {script} [-n num] [NAME...]
+
+    Options:
+        NAME                : Name of benchmark function to run, or part
+                              of it.
+                              Default: all benchmarks are run
+        -h,--help           : Show this help message.
+        -n num,--number num : Number of times to run each timed statement.
+                              Default: 1000
+        -v,--version        : Show version.
+""".format(script=SCRIPT, versionstr=VERSIONSTR)
+
+
+def main(argd):
+    """ Main entry point, expects doctopt arg dict as argd. """
+    try:
+        number = int(argd['--number'] or 1000)
+    except ValueError:
+        raise InvalidArg('not a number: {}'.format(argd['--number']))
+
+    benchfuncs = []
+    userargs = argd['NAME'] or ['.+']
+    for namearg in userargs:
+        benchfuncs.extend(find_benchmarks(namearg))
+    if not benchfuncs:
+        raise InvalidArg('No benchmarks found with: {}'.format(
+            ', '.join(a for a in userargs)
+        ))
+
+    print('Running {}'.format(Colr(VERSIONSTR, fore='red', style='bright')))
+    for func in sorted(benchfuncs, key=lambda f: f.__name__):
+        print('\n{}'.format(Colr(func.__doc__.strip(), 'blue')))
+        func(number=number)
+    return 0
+
+
+def bench_batch_convert(number=1000):
+    """ Converting an image worth of colors should be done on whole arrays,
+        not one color at a time.
+    """
+    if numpy is None:
+        print('    NumPy is not installed, skipping.')
+        return
+    rgbs = numpy.random.default_rng(22).integers(0, 256, (1000000, 3))
+    rgblist = rgbs.tolist()
+    hexvals = rgb2hex_array(rgbs)
+    hexlist = hexvals.tolist()
+    number = max(number // 1000, 1)
+    benches = (
+        ('rgb2term_int() for each color', lambda: [
+            rgb2term_int(*rgb) for rgb in rgblist
+        ]),
+        ('rgb2term_array()', lambda: rgb2term_array(rgbs)),
+        ('rgb2hex() for each color', lambda: [
+            rgb2hex(*rgb) for rgb in rgblist
+        ]),
+        ('rgb2hex_array()', lambda: rgb2hex_array(rgbs)),
+        ('hex2rgb() for each color', lambda: [
+            hex2rgb(hexval) for hexval in hexlist
+        ]),
+        ('hex2rgb_array()', lambda: hex2rgb_array(hexvals)),
+        (
+            'rgb2term_array(perceptual=True)',
+            lambda: rgb2term_array(rgbs, perceptual=True),
+        ),
+    )
+    print('    Colors: {}'.format(len(rgbs)))
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_bytes(number=1000):
+    """ Stripping bytes should not need a decode/encode round trip. """
+    line = str(Colr().join(
+        Colr(word, fore=i, style='bright')
+        for i, word in enumerate('This is a colorful log line. '.split())
+    )) + '\n'
+    data = (line * 1000).encode()
+    view = memoryview(data)
+    number = max(number // 10, 1)
+    print('    Data size: {:.2f}KB'.format(len(data) / 1024))
+    benches = (
+        (
+            'strip_codes(data.decode()).encode()',
+            lambda: strip_codes(data.decode()).encode(),
+        ),
+        ('strip_codes_bytes(data)', lambda: strip_codes_bytes(data)),
+        ('strip_codes_bytes(memoryview)', lambda: strip_codes_bytes(view)),
+        ('get_codes(data.decode())', lambda: get_codes(data.decode())),
+        ('list(iter_codes_bytes(data))', lambda: list(iter_codes_bytes(data))),
+    )
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_chained_scaling(number=1000):
+    """ Chaining many fragments should scale linearly. """
+    counts = (1000, 2000, 4000, 8000, 16000)
+    fragment = str(Colr('cell', 'red'))
+    number = max(number // 100, 1)
+
+    def chain(count):
+        clr = Colr()
+        for _ in range(count):
+            clr.chained(fragment)
+        return str(clr)
+
+    lasttime = None
+    for count in counts:
+        elapsed = timed(lambda: chain(count), number=number)
+        print_result(
+            'Colr.chained x {:>5}'.format(count),
+            elapsed,
+            number,
+            extra=(
+                '' if lasttime is None
+                else '(x{:.2f} from last)'.format(elapsed / lasttime)
+            ),
+        )
+        lasttime = elapsed
+
+
+def bench_color_many(number=1000):
+    """ Batch colorizing should beat a Colr per cell. """
+    cells = ['cell {}'.format(i) for i in range(1000)]
+    fores = [i % 256 for i in range(1000)]
+    number = max(number // 100, 1)
+    benches = (
+        ('Colr(cell, fore) x 1000', lambda: [
+            str(Colr(cell, fore)) for cell, fore in zip(cells, fores)
+        ]),
+        ('colorize_batch(cells, fores)', lambda: colorize_batch(
+            cells,
+            fores,
+        )),
+        ('Colr(cell, \'red\') x 1000', lambda: [
+            str(Colr(cell, 'red')) for cell in cells
+        ]),
+        ('colorize_batch(cells, fore=\'red\')', lambda: colorize_batch(
+            cells,
+            fore='red',
+        )),
+    )
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_colorcode(number=1000):
+    """ Looking up a ColorCode for a repeated value should not convert it
+        again.
+    """
+    rand = random.Random(23)
+    rgbs = [
+        tuple(rand.choice((0, 95, 128, 255)) for _ in range(3))
+        for _ in range(1000)
+    ]
+    codes = [rand.randint(0, 255) for _ in range(1000)]
+    hexvals = [rgb2hex(*rgb) for rgb in rgbs]
+    number = max(number // 10, 1)
+    benches = (
+        ('ColorCode(code)', lambda: [ColorCode(c) for c in codes]),
+        (
+            'ColorCode.from_code(code)',
+            lambda: [ColorCode.from_code(c) for c in codes],
+        ),
+        ('ColorCode(hexval)', lambda: [ColorCode(h) for h in hexvals]),
+        (
+            'ColorCode.from_hex(hexval)',
+            lambda: [ColorCode.from_hex(h) for h in hexvals],
+        ),
+        (
+            'ColorCode(rgb, rgb_mode=True)',
+            lambda: [ColorCode(rgb, rgb_mode=True) for rgb in rgbs],
+        ),
+        (
+            'ColorCode.from_rgb(*rgb, rgb_mode=True)',
+            lambda: [ColorCode.from_rgb(*rgb, rgb_mode=True) for rgb in rgbs],
+        ),
+    )
+    print('    Values: {}'.format(len(codes)))
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_downsample(number=1000):
+    """ RGB colors in 256/16-color modes should be reduced to palette
+        numbers before the code cache, so similar colors share entries.
+    """
+    text = 'This is a rainbow log line, in 256 and 16 colors. ' * 40
+    clr = Colr()
+    number = max(number // 20, 1)
+    print('    Characters: {}'.format(len(text)))
+    for mode in ('truecolor', 256, 16):
+        with color_mode(mode):
+            print_result(
+                'rainbow(rgb_mode=True), {}'.format(mode),
+                timed(
+                    lambda: str(clr.rainbow(text, rgb_mode=True)),
+                    number=number,
+                ),
+                number,
+            )
+            print_result(
+                'gradient_rgb(), {}'.format(mode),
+                timed(lambda: str(clr.gradient_rgb(text)), number=number),
+                number,
+            )
+
+
+def bench_escape_free(number=1000):
+    """ Plain text (no escape codes) should skip the regex machinery. """
+    text = 'This is a plain log line, with no escape codes at all. ' * 4
+    clr = Colr(text)
+    ctl = Control(text)
+    run_benchmarks_for_text(text, clr, ctl, number=number)
+
+
+def bench_escape_heavy(number=1000):
+    """ Text with many escape codes still has to be parsed. """
+    clr = Colr().join(
+        Colr(word, fore=i, style='bright')
+        for i, word in enumerate('This is a colorful log line. '.split() * 8)
+    )
+    text = str(clr)
+    ctl = Control(text).move_up().move_down()
+    run_benchmarks_for_text(text, clr, ctl, number=number)
+
+
+def bench_known_codes(number=1000):
+    """ Explaining the codes in a large log (`colr -z`) should look up each
+        code in the index, and explain each unique code once.
+    """
+    line = str(Colr().join(
+        Colr('word', fore=i, back=(i, 255 - i, 0), style='bright')
+        for i in range(0, 256, 16)
+    ))
+    text = '\n'.join(line for _ in range(20000))
+    codes = get_codes(text)
+    number = max(number // 1000, 1)
+    print('    Characters: {}, codes: {}, unique: {}'.format(
+        len(text),
+        len(codes),
+        len(set(codes)),
+    ))
+    benches = (
+        (
+            'get_known_name() for each code',
+            lambda: [get_known_name(code) for code in codes],
+        ),
+        (
+            'get_known_codes(unique=True)',
+            lambda: list(get_known_codes(text)),
+        ),
+        (
+            'get_known_codes(unique=False)',
+            lambda: list(get_known_codes(text, unique=False)),
+        ),
+    )
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_memory(number=1000):
+    """ Parsing a large colored log should not use much memory per part. """
+    line = str(Colr().join(
+        Colr(word, fore=i, style='bright')
+        for i, word in enumerate('This is a colorful log line. '.split())
+    )) + '\n'
+    # About 10MB of colored text.
+    text = line * ((10 * 1024 * 1024) // len(line))
+    clr = Colr(text)
+    maxrss_before = get_maxrss()
+    tracemalloc.start()
+    parts = clr.parts()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('    Text size: {:.2f}MB, {} parts.'.format(
+        len(text) / 1024 / 1024,
+        len(parts),
+    ))
+    print('    {:<40}: {:>10.2f}MB, {:>6.1f} bytes per part'.format(
+        'Peak traced memory for Colr.parts()',
+        peak / 1024 / 1024,
+        peak / len(parts),
+    ))
+    if maxrss_before is not None:
+        print('    {:<40}: {:>10.2f}MB (+{:.2f}MB)'.format(
+            'Peak RSS',
+            get_maxrss() / 1024,
+            (get_maxrss() - maxrss_before) / 1024,
+        ))
+
+
+def bench_names(number=1000):
+    """ Named color lookups should not build the info for every name. """
+    names = list(name_data)
+    rgbs = [
+        ((i * 7) % 256, (i * 13) % 256, (i * 29) % 256)
+        for i in range(1000)
+    ]
+    number = max(number // 100, 1)
+
+    def nearest_uncached():
+        nearest_name_cache.clear()
+        return [nearest_name(*rgb) for rgb in rgbs]
+
+    benches = (
+        ('parse_colr_arg(name) for each name', lambda: [
+            parse_colr_arg(name) for name in names
+        ]),
+        ('Colr().f_<name>() for each name', lambda: [
+            getattr(Colr(), 'f_' + name)() for name in names
+        ]),
+        ('complete_name(prefix) for each name', lambda: [
+            complete_name(name[:3]) for name in names
+        ]),
+        ('nearest_name() for 1000 colors, uncached', nearest_uncached),
+    )
+    print('    Names: {}'.format(len(names)))
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_nearest(number=1000):
+    """ Finding the perceptually closest palette color should be a table
+        lookup, with a few distance checks for colors near a boundary.
+    """
+    rgbs = [
+        ((i * 7) % 256, (i * 13) % 256, (i * 29) % 256)
+        for i in range(1000)
+    ]
+    # Colors that need the distance checks. When the opposite corner of a
+    # color's 8x8x8 cell has a different nearest code, the cell has more
+    # than one candidate.
+    rand = random.Random(21)
+    boundary = []
+    while len(boundary) < 1000:
+        rgb = tuple(rand.randint(0, 255) for _ in range(3))
+        opposite = tuple(part ^ 7 for part in rgb)
+        if rgb2term_nearest(*rgb) != rgb2term_nearest(*opposite):
+            boundary.append(rgb)
+    number = max(number // 100, 1)
+    benches = (
+        ('rgb2term_int() cube lookup', lambda: [
+            rgb2term_int(*rgb) for rgb in rgbs
+        ]),
+        ('rgb2term_nearest()', lambda: [
+            rgb2term_nearest(*rgb) for rgb in rgbs
+        ]),
+        ('rgb2term_nearest() near boundaries', lambda: [
+            rgb2term_nearest(*rgb) for rgb in boundary
+        ]),
+    )
+    print('    Colors: {}'.format(len(rgbs)))
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_optimize(number=1000):
+    """ Optimized output should be much smaller than Colr's output. """
+    line = 'This is a rainbow colored dashboard line. ' * 2
+    texts = (
+        ('Colr.rainbow()', str(Colr(line).rainbow(spread=3)) + '\n'),
+        (
+            'Colr.gradient()',
+            str(Colr(line).gradient(name='blue', spread=3)) + '\n',
+        ),
+        (
+            'Chained colors',
+            str(Colr().join(
+                Colr(word, fore='red', style='bright')
+                for word in line.split()
+            )) + '\n',
+        ),
+    )
+    number = max(number // 10, 1)
+    for name, text in texts:
+        text = text * 100
+        optimized = optimize(text)
+        print('    {}: {} chars, {} visible, {} optimized'.format(
+            name,
+            len(text),
+            len(strip_codes(text)),
+            len(optimized),
+        ))
+        print_result(
+            'optimize(text)',
+            timed(lambda: optimize(text), number=number),
+            number,
+            extra='({:.1f}x smaller)'.format(len(text) / len(optimized)),
+        )
+
+
+def bench_parser(number=1000):
+    """ The escape code parser should keep up with the old regex. """
+    line = str(Colr().join(
+        Colr(word, fore=i, style='bright')
+        for i, word in enumerate('This is a colorful log line. '.split())
+    )) + '\n'
+    texts = (
+        ('colored', line * 1000),
+        ('plain', strip_codes(line) * 1000),
+        ('pathological', ('\033[' + ('1;' * 50)) * 1000),
+    )
+    number = max(number // 10, 1)
+    for name, text in texts:
+        print('    {} text, length: {}'.format(name.title(), len(text)))
+        benches = (
+            (
+                'legacy_codepat.sub(\'\', text)',
+                lambda: legacy_codepat.sub('', text),
+            ),
+            ('strip_codes(text)', lambda: strip_codes(text)),
+            ('tokenize(text)', lambda: tokenize(text)),
+        )
+        for label, func in benches:
+            elapsed = timed(func, number=number)
+            print_result(
+                label,
+                elapsed,
+                number,
+                extra='{:>7.1f}MB/s'.format(
+                    (len(text) * number) / 1024 / 1024 / elapsed
+                ),
+            )
+
+
+def bench_sgr_states(number=1000):
+    """ Finding the state of each run of text should parse codes once. """
+    lines = [
+        str(Colr().join(
+            Colr(word, fore=(i + j) % 256, style='bright')
+            for j, word in enumerate('This is a colorful log line.'.split())
+        ))
+        for i in range(100)
+    ]
+    number = max(number // 10, 1)
+
+    def known_names():
+        for line in lines:
+            for code in get_codes(line):
+                get_known_name(code)
+
+    def sgr_states():
+        for line in lines:
+            for _ in iter_sgr_states(line):
+                pass
+
+    print('    Lines: {}, with {} codes.'.format(
+        len(lines),
+        sum(len(get_codes(line)) for line in lines),
+    ))
+    benches = (
+        ('get_known_name() for each code', known_names),
+        ('iter_sgr_states() for each line', sgr_states),
+    )
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_slicing(number=1000):
+    """ Slicing a long colored line should not walk every character. """
+    clr = Colr().join(
+        Colr(word, fore=i % 256, style='bright')
+        for i, word in enumerate('This is a colorful log line. '.split() * 80)
+    )
+    length = len(clr.stripped())
+    print('    Visible length: {}, with {} codes.'.format(
+        length,
+        len(get_codes(clr)),
+    ))
+    benches = (
+        ('Colr[:40]', lambda: clr[:40]),
+        (
+            'Colr[middle:middle + 40]',
+            lambda: clr[length // 2:length // 2 + 40],
+        ),
+        ('Colr[-40:]', lambda: clr[-40:]),
+    )
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_strip_stream(number=1000):
+    """ Stripping a stream should use constant memory for any chunk size. """
+    line = str(Colr().join(
+        Colr(word, fore=i, style='bright')
+        for i, word in enumerate('This is a colorful log line. '.split())
+    )) + '\n'
+    # About 10MB of colored text.
+    data = (line * ((10 * 1024 * 1024) // len(line))).encode()
+    print('    Data size: {:.2f}MB'.format(len(data) / 1024 / 1024))
+    for chunksize in (1024, 4096, 65536, 1024 * 1024):
+        fileobj = io.BytesIO(data)
+
+        def strip_stream():
+            fileobj.seek(0)
+            for _ in StripStream(fileobj, chunksize=chunksize):
+                pass
+
+        elapsed = timed(strip_stream, number=1)
+        # tracemalloc slows everything down, so it gets a separate run.
+        tracemalloc.start()
+        strip_stream()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print_result(
+            'StripStream, {:>7} byte chunks'.format(chunksize),
+            elapsed,
+            1,
+            extra='{:>7.1f}MB/s, peak {:.2f}KB'.format(
+                len(data) / 1024 / 1024 / elapsed,
+                peak / 1024,
+            ),
+        )
+
+
+def bench_term_lookup(number=1000):
+    """ Finding the nearest 256-color code should be a table lookup. """
+    rgbs = [
+        ((i * 7) % 256, (i * 13) % 256, (i * 29) % 256)
+        for i in range(1000)
+    ]
+    hexvals = [rgb2hex(*rgb) for rgb in rgbs]
+    number = max(number // 10, 1)
+    benches = (
+        (
+            'legacy rgb2term() search',
+            lambda: [legacy_rgb2term(*rgb) for rgb in rgbs],
+        ),
+        ('rgb2term()', lambda: [rgb2term(*rgb) for rgb in rgbs]),
+        ('rgb2term_int()', lambda: [rgb2term_int(*rgb) for rgb in rgbs]),
+        (
+            'legacy hex2term() search',
+            lambda: [
+                legacy_rgb2term(
+                    int(h[:2], 16),
+                    int(h[2:4], 16),
+                    int(h[4:], 16),
+                )
+                for h in hexvals
+            ],
+        ),
+        ('hex2term()', lambda: [hex2term(h) for h in hexvals]),
+        ('hex2term_int()', lambda: [hex2term_int(h) for h in hexvals]),
+        (
+            'Colr.rainbow() on 1000 characters',
+            lambda: Colr().rainbow('x' * 1000),
+        ),
+    )
+    print('    Colors: {}'.format(len(rgbs)))
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def bench_width(number=1000):
+    """ Measuring terminal columns should cost no more than 2x len(). """
+    ascii_lines = [
+        'This is log line number {}, with plain text.'.format(i)
+        for i in range(100)
+    ]
+    wide_lines = [
+        '\u65e5\u672c\u8a9e {} caf\xe9 \u2764\ufe0f'.format(i)
+        for i in range(100)
+    ]
+    number = max(number // 10, 1)
+    for label, lines in (('ASCII', ascii_lines), ('wide', wide_lines)):
+        # Fill the cache first, like repeated strings in a table would.
+        for line in lines:
+            str_width(line)
+        lentime = timed(lambda: [len(line) for line in lines], number=number)
+        widthtime = timed(
+            lambda: [str_width(line) for line in lines],
+            number=number,
+        )
+        print_result('len() for {} lines'.format(label), lentime, number)
+        print_result(
+            'str_width() for {} lines'.format(label),
+            widthtime,
+            number,
+            extra='({:.2f}x len())'.format(widthtime / lentime),
+        )
+    # Justifying used to measure with len(), through _text_length().
+    for label, lines in (('ASCII', ascii_lines), ('wide', wide_lines)):
+        clrs = [Colr(line, 'red') for line in lines]
+        lentime = timed(
+            lambda: [clr._text_length() for clr in clrs],
+            number=number,
+        )
+        widthtime = timed(
+            lambda: [clr._text_width() for clr in clrs],
+            number=number,
+        )
+        print_result(
+            'Colr._text_length() for {} lines'.format(label),
+            lentime,
+            number,
+        )
+        print_result(
+            'Colr._text_width() for {} lines'.format(label),
+            widthtime,
+            number,
+            extra='({:.2f}x len())'.format(widthtime / lentime),
+        )
+
+
+def bench_wrap(number=1000):
+    """ Wrapping should stay linear, even with 100k lines. """
+    line = str(Colr().join(
+        Colr(word, fore=i, style='bright')
+        for i, word in enumerate(
+            'This is a colorful log line that needs wrapping.'.split()
+        )
+    ))
+    text = '\n'.join(line for _ in range(100000))
+    stripped = strip_codes(text)
+    number = max(number // 1000, 1)
+    print('    Lines: 100000, characters: {}, visible: {}'.format(
+        len(text),
+        len(stripped),
+    ))
+    benches = (
+        (
+            'textwrap.wrap() for each stripped line',
+            lambda: [
+                textwrap.wrap(s, 20)
+                for s in stripped.splitlines()
+            ],
+        ),
+        ('wrap() for the whole text', lambda: wrap(text, 20)),
+        ('truncate() for the whole text', lambda: truncate(text, 20)),
+    )
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def find_benchmarks(pattern):
+    """ Find a bench_ function by regex. """
+    try:
+        repat = re.compile(pattern, flags=re.IGNORECASE)
+    except re.error as ex:
+        raise InvalidArg('Invalid name pattern: {}\n{}'.format(pattern, ex))
+
+    return [
+        val
+        for name, val in globals().items()
+        if (
+            name.startswith('bench_') and
+            (repat.search(name) is not None) and
+            callable(val)
+        )
+    ]
+
+
+def get_maxrss():
+    """ Return the peak resident set size for this process in KB, or None
+        if it is not available.
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def print_err(*args, **kwargs):
+    """ A wrapper for print() that uses stderr by default. """
+    if kwargs.get('file', None) is None:
+        kwargs['file'] = sys.stderr
+    print(*args, **kwargs)
+
+
+def print_result(label, elapsed, number, extra=''):
+    """ Print a single timing result, with the time per run. """
+    print('    {:<40}: {:>10.6f}s total, {:>12.3f}us per run {}'.format(
+        label,
+        elapsed,
+        (elapsed / number) * 1000000,
+        extra,
+    ))
+
+
+def run_benchmarks_for_text(text, clr, ctl, number=1000):
+    """ Run the strip/parse benchmarks for bench_escape_free and
+        bench_escape_heavy.
+    """
+    print('    Text length: {}, with {} codes.'.format(
+        len(text),
+        len(get_codes(text)),
+    ))
+    benches = (
+        ('Colr(text, \'red\')', lambda: Colr(text, 'red')),
+        ('get_codes(text)', lambda: get_codes(text)),
+        ('strip_codes(text)', lambda: strip_codes(text)),
+        ('Colr.parts()', lambda: clr.parts()),
+        ('Colr.stripped()', lambda: clr.stripped()),
+        ('Control.last_code()', lambda: ctl.last_code()),
+    )
+    for label, func in benches:
+        print_result(label, timed(func, number=number), number)
+
+
+def timed(func, number=1000):
+    """ Return the best total time of 3 runs of `func`, `number` times. """
+    return min(Timer(func).repeat(repeat=3, number=number))
+
+
+class InvalidArg(ValueError):
+    """ Raised when the user has used an invalid argument. """
+    def __init__(self, msg=None):
+        self.msg = msg or ''
+
+    def __str__(self):
+        if self.msg:
+            return 'Invalid argument, {}'.format(self.msg)
+        return 'Invalid argument!'
+
+
+if __name__ == '__main__':
+    try:
+        mainret = main(docopt(USAGESTR, version=VERSIONSTR, script=SCRIPT))
+    except InvalidArg as ex:
+        print_err(ex)
+        mainret = 1
+    except (EOFError, KeyboardInterrupt):
+        print_err('\nUser cancelled.\n')
+        mainret = 2
+    except BrokenPipeError:
+        print_err('\nBroken pipe, input/output was interrupted.\n')
+        mainret = 3
+    sys.exit(mainret)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" test_base.py
+    Unit tests for the escape code parser in colr/base.py
+"""
+
+import random
+import sys
+import unittest
+
+from colr import (
+    __version__,
+    Colr,
+    get_codes,
+    iter_strip_codes,
+    strip_codes,
+    strip_codes_bytes,
+)
+from colr.base import (
+    ChainedBase,
+    is_escape_code,
+    TOKEN_SGR,
+    TOKEN_TEXT,
+    tokenize,
+)
+from .testing_tools import ColrTestCase
+
+# Known sequences. (input, stripped output, get_codes() output)
+parser_corpus = (
+    # Colors, and the codes that the old parser knew about.
+    ('\033[31mred\033[0m', 'red', ['\033[31m', '\033[0m']),
+    ('\033[38;5;196mx\033[m', 'x', ['\033[38;5;196m']),
+    ('a\033[2Ab\033[?25lc\033[?25h', 'abc', []),
+    ('\033[1;2Ha\033[3fb\033[sc\033[u', 'abc', []),
+    # Erasing without parameters.
+    ('a\033[Kb\033[2Jc\033[J', 'abc', []),
+    # Private modes.
+    ('\033[?1049ha\033[?1049l\033[?2004h', 'a', []),
+    # Intermediate bytes (cursor style).
+    ('\033[2 qa', 'a', []),
+    # Sub-parameters are stripped, but are not simple color codes.
+    ('\033[38:2:1:2:3ma', 'a', []),
+    # OSC, ended by BEL or ST.
+    ('\033]0;title\007a', 'a', []),
+    ('\033]8;;http://example.com\033\\link\033]8;;\033\\', 'link', []),
+    # OSC ended early by another escape code.
+    ('\033]0;title\033[31ma', 'a', ['\033[31m']),
+    # DCS/APC strings.
+    ('\033P1$r0m\033\\a\033_hidden\033\\', 'a', []),
+    # Charset selection, save/restore cursor, keypad modes, and resets.
+    ('\033(Ba\033)0b\0337c\0338d\033=e\033>f\033cg', 'abcdefg', []),
+    # CAN/SUB cancel a string.
+    ('\033]0;title\030a', 'a', []),
+    # Broken or unfinished sequences are not codes.
+    ('a\033', 'a\033', []),
+    ('a\033[', 'a\033[', []),
+    ('a\033[1;2', 'a\033[1;2', []),
+    ('\033[1\033[31ma', '\033[1a', ['\033[31m']),
+    ('\033[\xe9a', '\033[\xe9a', []),
+    ('\033]0;unterminated', '\033]0;unterminated', []),
+    ('\033\001a', '\033\001a', []),
+)
+
+# Pieces for the fuzz tests, including broken and unfinished codes.
+fuzz_pieces = (
+    'a', 'text', ' ', '\xe9', '\n', '\007', '\030', '[', ']', 'm', ';',
+    '\033', '\033[', '\033[1', '\033[1;', '\033]', '\033P', '\033(',
+    '\033\\', '\033[31m', '\033[0m', '\033[m', '\033[38;5;9m', '\033[2K',
+    '\033[?25l', '\033[1 q', '\033]0;t\007', '\033]8;;x\033\\', '\0337',
+    '\033P+q\033\\', str(Colr('colr', 'red', back='blue', style='bright')),
+)
+
+
+class BaseTests(ColrTestCase):
+    """ Tests for the escape code parser in colr/base.py """
+
+    def test_corpus(self):
+        """ Known escape sequences should be stripped and grabbed. """
+        for s, stripped, codes in parser_corpus:
+            self.assertCallEqual(
+                strip_codes(s),
+                stripped,
+                func=strip_codes,
+                args=(s, ),
+                msg='Failed to strip known sequence.',
+            )
+            self.assertCallEqual(
+                get_codes(s),
+                codes,
+                func=get_codes,
+                args=(s, ),
+                msg='Failed to grab color codes.',
+            )
+            tokens = tokenize(s)
+            self.assertCallEqual(
+                (tokens.stripped(), tokens.codes()),
+                (stripped, codes),
+                func=tokenize,
+                args=(s, ),
+                msg='Tokens do not match strip_codes()/get_codes().',
+            )
+            self.assertCallEqual(
+                strip_codes_bytes(s.encode()),
+                stripped.encode(),
+                func=strip_codes_bytes,
+                args=(s.encode(), ),
+                msg='Bytes parser does not match the str parser.',
+            )
+            for start, stop, kind in tokens:
+                if kind == TOKEN_TEXT:
+                    continue
+                # OSC strings may be ended by the next code, so the code
+                # is checked in place.
+                self.assertTrue(
+                    is_escape_code(s[start:]),
+                    msg='Token is not an escape code: {!r}'.format(
+                        s[start:stop],
+                    ),
+                )
+
+    def test_fuzz(self):
+        """ Random strings should give the same results from every parser
+            entry point.
+        """
+        rand = random.Random(14)
+        for _ in range(500):
+            s = ''.join(
+                rand.choice(fuzz_pieces)
+                for _ in range(rand.randint(0, 30))
+            )
+            stripped = strip_codes(s)
+            tokens = tokenize(s)
+            # Tokens must cover the string, in order, without gaps.
+            pos = 0
+            for start, stop, kind in tokens:
+                self.assertEqual(start, pos, msg='Gap: {!r}'.format(s))
+                self.assertGreater(stop, start)
+                if kind == TOKEN_SGR:
+                    self.assertTrue(s[start:stop].endswith('m'))
+                pos = stop
+            self.assertEqual(pos, len(s), msg='Short tokens: {!r}'.format(s))
+            self.assertCallEqual(
+                tokens.stripped(),
+                stripped,
+                func=tokenize,
+                args=(s, ),
+                msg='Tokens do not match strip_codes().',
+            )
+            self.assertCallEqual(
+                tokens.codes(),
+                get_codes(s),
+                func=tokenize,
+                args=(s, ),
+                msg='Tokens do not match get_codes().',
+            )
+            self.assertCallEqual(
+                strip_codes_bytes(s.encode()),
+                stripped.encode(),
+                func=strip_codes_bytes,
+                args=(s.encode(), ),
+                msg='Bytes parser does not match the str parser.',
+            )
+            chained = ChainedBase(s)
+            self.assertCallEqual(
+                (chained.stripped(), chained.tokens().stripped()),
+                (stripped, stripped),
+                func=ChainedBase.stripped,
+                args=(chained, ),
+                msg='ChainedBase.stripped() does not match strip_codes().',
+            )
+            size = rand.randint(1, 8)
+            chunks = [s[i:i + size] for i in range(0, len(s), size)]
+            self.assertCallEqual(
+                ''.join(iter_strip_codes(chunks)),
+                stripped,
+                func=iter_strip_codes,
+                args=(chunks, ),
+                msg='Chunked parser does not match strip_codes().',
+            )
+
+    def test_pathological(self):
+        """ Long runs of unfinished codes should not backtrack forever. """
+        s = ('\033[' + ('1;' * 5000)) * 20
+        self.assertEqual(strip_codes(s), s)
+        s = '\033]' + ('x' * 100000)
+        self.assertEqual(strip_codes(s), s)
+        self.assertEqual(strip_codes(s + '\007'), '')
+
+
+if __name__ == '__main__':
+    print('Testing Colr.base v. {}'.format(__version__))
+    # unittest.main() calls sys.exit(status_code).
+    unittest.main(argv=sys.argv, verbosity=2)  # type: ignore
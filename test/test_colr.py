@@ -7,21 +7,65 @@
     -Christopher Welborn 12-09-2015
 """
 
+import io
+import os
+import pickle
 import random
+import struct
 import sys
+import tempfile
+import threading
 import unittest
+from copy import copy
+from unittest import mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from colr import (
     __version__,
+    auto_color_mode,
     closing_code,
+    code_cache,
     codes,
     color,
+    color_mode,
+    colorize_batch,
     Colr,
+    ColorMode,
+    detect_color_mode,
+    disable,
+    disabled,
+    enable,
+    get_color_mode,
     get_codes,
+    get_known_codes,
+    get_known_name,
     InvalidColr,
+    InvalidEscapeCode,
+    iter_codes_bytes,
+    iter_strip_codes,
     name_data,
+    parse_color_mode,
     strip_codes,
+    strip_codes_bytes,
+    StripStream,
+    Style,
+)
+from colr.colr import (
+    _downsample_code,
+    _get_known_name,
+)
+from colr.base import (
+    ChainedBase,
+    TOKEN_CODE,
+    TOKEN_SGR,
+    TOKEN_TEXT,
+    tokenize,
 )
+from colr.cache import LRUCache
 from colr.controls import Control
 from colr.trans import (
     is_code,
@@ -32,6 +76,42 @@ from colr.trans import (
 
 from .testing_tools import ColrTestCase
 
+
+class FakeTty(io.StringIO):
+    """ A stream that claims to be a tty, for detect_color_mode(). """
+    def fileno(self):
+        raise io.UnsupportedOperation('No fileno for FakeTty.')
+
+    def isatty(self):
+        return True
+
+
+def write_terminfo(dirpath, name, colors=None, extended=False):
+    """ Write a minimal compiled terminfo entry, with only the `colors`
+        number (or no numbers if `colors` is None).
+    """
+    names = name.encode() + b'\0'
+    if colors is None:
+        numbers = b''
+    elif extended:
+        numbers = struct.pack('<14i', *([-1] * 13 + [colors]))
+    else:
+        numbers = struct.pack('<14h', *([-1] * 13 + [colors]))
+    header = struct.pack(
+        '<6h',
+        0o1036 if extended else 0o432,
+        len(names),
+        0,
+        len(numbers) // (4 if extended else 2),
+        0,
+        0,
+    )
+    subdir = os.path.join(dirpath, name[0])
+    os.makedirs(subdir, exist_ok=True)
+    with open(os.path.join(subdir, name), 'wb') as f:
+        f.write(b''.join((header, names, b'\0' * (len(names) % 2), numbers)))
+
+
 # Save names in list format, for random.choice().
 name_data_names = list(name_data)
 
@@ -143,6 +223,41 @@ class ColrTests(ColrTestCase):
                     msg='str(Colr()) did not match.'
                 )
 
+    def test_auto_color_mode(self):
+        """ auto_color_mode() should set the global mode for a stream. """
+        tty = FakeTty()
+        try:
+            with mock.patch.dict(os.environ, {'TERM': 'xterm-256color'}):
+                os.environ.pop('NO_COLOR', None)
+                os.environ.pop('COLORTERM', None)
+                self.assertEqual(
+                    auto_color_mode(stream=tty),
+                    ColorMode.TERM256,
+                )
+            self.assertEqual(get_color_mode(), ColorMode.TERM256)
+            self.assertEqual(
+                str(Colr('test', (255, 0, 0))),
+                '\x1b[38;5;196mtest\x1b[0m',
+            )
+            # Context modes still win.
+            with color_mode('truecolor'):
+                self.assertEqual(
+                    str(Colr('test', (255, 0, 0))),
+                    '\x1b[38;2;255;0;0mtest\x1b[0m',
+                )
+            # Non-ttys disable colors.
+            self.assertEqual(
+                auto_color_mode(stream=io.StringIO()),
+                ColorMode.DISABLED,
+            )
+            self.assertTrue(disabled())
+        finally:
+            self.assertEqual(
+                auto_color_mode(enabled=False),
+                ColorMode.TRUECOLOR,
+            )
+        self.assertEqual(get_color_mode(), ColorMode.TRUECOLOR)
+
     def test_bytes(self):
         """ bytes(Colr()) should encode self.data. """
         s = 'test'
@@ -196,6 +311,166 @@ class ColrTests(ColrTestCase):
                     msg='Failed to raise for invalid values.'):
                 Colr().b_rgb(*invalidargs)
 
+    def test_chained_attr_table(self):
+        """ Chained color methods should be added to the class on first use.
+        """
+        for attr, kwargs in (
+                ('red', {'fore': 'red'}),
+                ('bgblue', {'back': 'blue'}),
+                ('bg_blue', {'back': 'blue'}),
+                ('bright', {'style': 'bright'}),
+                ('f_123', {'fore': 123}),
+                ('b256_123', {'back': 123}),
+                ('f_aliceblue', {'fore': 'aliceblue'}),
+                ('b_aliceblue', {'back': 'aliceblue'}),
+                ):
+            method = getattr(Colr('a'), attr)
+            self.assertCallEqual(
+                method('test'),
+                Colr('a').chained('test', **kwargs),
+                func=method,
+                args=('test', ),
+                msg='Chained method output was wrong.',
+            )
+            self.assertIn(
+                attr,
+                Colr.__dict__,
+                msg='Chained method was not added to the class.',
+            )
+        # Names that aren't in the table still work.
+        method = Colr().f_01
+        self.assertCallEqual(
+            method('test'),
+            Colr().chained('test', fore=1),
+            func=method,
+            args=('test', ),
+            msg='Chained method outside of the table failed.',
+        )
+        names = dir(Colr())
+        for attr in ('red', 'bgblue', 'f_123', 'b_aliceblue', 'chained'):
+            self.assertIn(attr, names, msg='Missing name in dir().')
+        with self.assertRaises(AttributeError):
+            Colr().NOTACOLOR
+        # Special names are not looked up, so copy/pickle work.
+        clr = Colr('test', 'red')
+        self.assertEqual(copy(clr), clr, msg='Copy was not equal.')
+        self.assertEqual(
+            pickle.loads(pickle.dumps(clr)),
+            clr,
+            msg='Pickled Colr was not equal.',
+        )
+
+    def test_chained_fragments(self):
+        """ Chained fragments should build the same data as joining. """
+        clr = Colr()
+        expected = []
+        for i in range(50):
+            clr.chained(str(i), fore=i)
+            expected.append(Colr(str(i), fore=i).data)
+        clr('end')
+        expected.append('end')
+        self.assertEqual(
+            clr.data,
+            ''.join(expected),
+            msg='Chained fragments did not build the correct data.',
+        )
+        self.assertEqual(
+            len(clr),
+            len(''.join(expected)),
+            msg='Chained fragments did not report the correct length.',
+        )
+        # Copies should not share fragments.
+        clrcopy = copy(clr)
+        clrcopy.red('copy')
+        self.assertNotEqual(
+            clr,
+            clrcopy,
+            msg='Copied Colr shared fragments with the original.',
+        )
+
+    def test_code_cache(self):
+        """ code_cache should cache escape codes without changing them. """
+        code_cache.clear()
+        argsets = (
+            {'fore': 'red'},
+            {'fore': 'RED', 'back': 'blue', 'style': 'bright'},
+            {'fore': 25, 'back': 'aliceblue'},
+            {'fore': (25, 25, 25), 'back': 'fff'},
+            {'fore': [25, 25, 25]},
+        )
+        expected = [Colr('test', **kwargs) for kwargs in argsets]
+        firstinfo = code_cache.info()
+        self.assertGreater(
+            firstinfo.misses,
+            0,
+            msg='Cache was not used for new codes.',
+        )
+        for kwargs, clr in zip(argsets, expected):
+            self.assertCallEqual(
+                Colr('test', **kwargs),
+                clr,
+                func=Colr,
+                args=('test', ),
+                kwargs=kwargs,
+                msg='Cached code was not the same.',
+            )
+        info = code_cache.info()
+        self.assertGreater(
+            info.hits,
+            firstinfo.hits,
+            msg='Cache was not hit for known codes.',
+        )
+        self.assertEqual(
+            info.misses,
+            firstinfo.misses,
+            msg='Cache missed for known codes.',
+        )
+        # Invalid args should still raise, and should not be cached.
+        with self.assertRaises(InvalidColr):
+            Colr('test', 'NOTACOLOR')
+        with self.assertRaises(InvalidColr):
+            Colr('test', 'NOTACOLOR')
+
+        # Resizing should evict the least recently used codes.
+        code_cache.resize(2)
+        self.assertLessEqual(
+            len(code_cache),
+            2,
+            msg='Cache was not resized.',
+        )
+        self.assertGreater(
+            code_cache.info().evictions,
+            0,
+            msg='Eviction count was not updated.',
+        )
+        code_cache.resize(1024)
+        code_cache.clear()
+        self.assertEqual(
+            code_cache.info(),
+            (0, 0, 0, 1024, 0),
+            msg='Cache was not cleared.',
+        )
+
+        # Hit/miss counters should be exact when shared between threads.
+        cache = LRUCache(maxsize=16)
+
+        def lookups():
+            for i in range(5000):
+                if cache.get(i % 32) is None:
+                    cache.set(i % 32, i)
+
+        threads = [threading.Thread(target=lookups) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        self.assertEqual(
+            info.hits + info.misses,
+            8 * 5000,
+            msg='Cache counters were not updated for every lookup.',
+        )
+
     def test_color(self):
         """ Colr.color should accept valid color names/values. """
         # None of these should raise a InvalidColr.
@@ -232,6 +507,183 @@ class ColrTests(ColrTestCase):
         with self.assertRaises(InvalidColr):
             Colr(s, (257, 0, 0))
 
+    def test_color_mode(self):
+        """ color_mode should set the color mode for the current context. """
+        text = Colr('test', (255, 0, 0), back=200, style='bright')
+        for mode, expected in (
+                (False, 'test'),
+                (
+                    16,
+                    '\x1b[1m\x1b[105m\x1b[91mtest\x1b[0m'
+                ),
+                (
+                    256,
+                    '\x1b[1m\x1b[48;5;200m\x1b[38;5;196mtest\x1b[0m'
+                ),
+                ('truecolor', str(text)),
+                ):
+            with color_mode(mode):
+                self.assertCallEqual(
+                    str(Colr('test', (255, 0, 0), back=200, style='bright')),
+                    expected,
+                    func=Colr,
+                    args=('test', (255, 0, 0)),
+                    kwargs={'back': 200, 'style': 'bright'},
+                    msg='Color mode {!r} was not used.'.format(mode),
+                )
+                style = Style((255, 0, 0), back=200, style='bright')
+                self.assertCallEqual(
+                    style('test'),
+                    expected,
+                    func=style,
+                    args=('test', ),
+                    msg='Color mode {!r} was not used by Style.'.format(mode),
+                )
+        # Modes are restored, and the global setting is the fallback.
+        self.assertEqual(get_color_mode(), ColorMode.TRUECOLOR)
+        disable()
+        try:
+            self.assertTrue(disabled())
+            with color_mode(True):
+                self.assertFalse(disabled())
+            self.assertTrue(disabled())
+        finally:
+            enable()
+
+        # Works as a decorator, and does not affect other threads.
+        results = {}
+        started = threading.Event()
+        finish = threading.Event()
+
+        @color_mode(False)
+        def plain():
+            started.set()
+            finish.wait(timeout=5)
+            results['plain'] = str(Colr('test', 'red'))
+
+        thread = threading.Thread(target=plain)
+        thread.start()
+        started.wait(timeout=5)
+        results['main'] = str(Colr('test', 'red'))
+        finish.set()
+        thread.join()
+        self.assertEqual(results['plain'], 'test')
+        self.assertEqual(results['main'], '\x1b[31mtest\x1b[0m')
+
+        with self.assertRaises(ValueError):
+            color_mode('NOTAMODE')
+
+    def test_color_mode_downsample(self):
+        """ rainbow() and gradient_rgb() should emit codes for the current
+            color mode, the same as downsampling the RGB codes.
+        """
+        text = 'test\n' * 20
+        clr = Colr()
+        calls = (
+            (clr.rainbow, {'rgb_mode': True}),
+            (clr.rainbow, {'rgb_mode': True, 'fore': 'red'}),
+            (clr.gradient_rgb, {'start': (255, 0, 0), 'stop': (0, 0, 255)}),
+            (clr.gradient_rgb, {'back': (0, 0, 0), 'movefactor': 2}),
+            (Colr, {'fore': [255, 0, 0], 'back': (1, 2, 3)}),
+        )
+        for func, kwargs in calls:
+            full = str(func(text, **kwargs))
+            for mode in (ColorMode.TERM256, ColorMode.TERM16):
+                with color_mode(mode):
+                    self.assertCallEqual(
+                        str(func(text, **kwargs)),
+                        _downsample_code(full, mode),
+                        func=func,
+                        args=(text, ),
+                        kwargs=kwargs,
+                        msg='Failed to downsample for {}.'.format(mode),
+                    )
+        # Invalid RGB values are still errors.
+        with color_mode(256):
+            with self.assertRaises(InvalidColr):
+                Colr('test', (256, 0, 0))
+
+    def test_color_many(self):
+        """ Colr.color_many should match Colr.color for every text. """
+        texts = ['a', 'test', '', 'x{}'.format(Colr('embedded', 'red')), 5]
+        styles = ['red', 56, None, ('blue', 'white'), ('red', None, 'bright')]
+        expected = [
+            Colr().color(text, fore='red', style='bright')
+            for text in texts
+        ]
+        self.assertCallEqual(
+            colorize_batch(texts, fore='red', style='bright'),
+            expected,
+            func=colorize_batch,
+            args=(texts, ),
+            kwargs={'fore': 'red', 'style': 'bright'},
+            msg='Single style batch did not match.',
+        )
+        expected = [
+            Colr().color(text, *(st if isinstance(st, tuple) else (st, )))
+            for text, st in zip(texts, styles)
+        ]
+        self.assertCallEqual(
+            Colr().color_many(texts, styles),
+            expected,
+            func=Colr().color_many,
+            args=(texts, styles),
+            msg='Parallel style batch did not match.',
+        )
+        self.assertCallEqual(
+            list(colorize_batch(texts, styles, lazy=True)),
+            expected,
+            func=colorize_batch,
+            args=(texts, styles),
+            kwargs={'lazy': True},
+            msg='Lazy batch did not match.',
+        )
+        with self.assertRaises(ValueError):
+            colorize_batch(texts, styles[:-1])
+        with self.assertRaises(InvalidColr):
+            colorize_batch(texts, ['NOTACOLOR'] * len(texts))
+        # Unhashable style args are not memoized, but still work (or fail)
+        # like they do for Colr.color().
+        self.assertEqual(
+            colorize_batch(['a', 'b'], [('red', [1, 2, 3])] * 2),
+            [Colr().color(s, 'red', [1, 2, 3]) for s in 'ab'],
+        )
+        for args in (('red', [1, 2]), ('red', [1, 2, 300])):
+            with self.assertRaises(Exception) as colorctx:
+                Colr().color('test', *args)
+            with self.assertRaises(type(colorctx.exception)):
+                colorize_batch(['test'], [args])
+
+    @unittest.skipUnless(numpy, 'NumPy is not installed.')
+    def test_color_many_numpy(self):
+        """ Colr.color_many should accept NumPy arrays of palette indexes.
+        """
+        texts = numpy.array(['a', 'b', 'c'])
+        fores = numpy.array([1, 2, 255])
+        expected = [
+            Colr().color(text, fore)
+            for text, fore in zip(texts.tolist(), fores.tolist())
+        ]
+        self.assertCallEqual(
+            colorize_batch(texts, fores),
+            expected,
+            func=colorize_batch,
+            args=(texts, fores),
+            msg='NumPy palette indexes did not match.',
+        )
+        pairs = numpy.array([[1, 2], [3, 4], [255, 0]])
+        expected = [
+            Colr().color(text, fore, back)
+            for text, (fore, back) in zip(texts.tolist(), pairs.tolist())
+        ]
+        self.assertCallEqual(
+            colorize_batch(texts, pairs),
+            expected,
+            func=colorize_batch,
+            args=(texts, pairs),
+            msg='NumPy (fore, back) rows did not match.',
+        )
+
     def test_closingcode(self):
         """ The reset/closing code should be appended when necessary. """
         # No code should be appended.
@@ -280,6 +732,80 @@ class ColrTests(ColrTestCase):
                 msg='Failed to add closing code for falsey value.',
             )
 
+    def test_detect_color_mode(self):
+        """ detect_color_mode() should use NO_COLOR, COLORTERM, TERM, and
+            ttys to find the color mode.
+        """
+        tty = FakeTty()
+        cases = (
+            ({'NO_COLOR': '1', 'COLORTERM': 'truecolor'}, ColorMode.DISABLED),
+            ({'NO_COLOR': '', 'COLORTERM': 'truecolor'}, ColorMode.TRUECOLOR),
+            ({'COLORTERM': '24bit', 'TERM': 'dumb'}, ColorMode.TRUECOLOR),
+            ({'TERM': 'dumb'}, ColorMode.DISABLED),
+            ({'TERM': 'xterm-direct'}, ColorMode.TRUECOLOR),
+            ({'TERM': 'xterm-256color'}, ColorMode.TERM256),
+            ({'TERM': 'screen.xterm-256color'}, ColorMode.TERM256),
+            ({'TERM': 'not-a-real-terminal'}, ColorMode.TERM16),
+        )
+        for env, expected in cases:
+            with mock.patch.dict(os.environ, clear=True, values=env):
+                self.assertCallEqual(
+                    detect_color_mode(tty, refresh=True),
+                    expected,
+                    func=detect_color_mode,
+                    args=(tty, ),
+                    kwargs={'refresh': True},
+                    msg='Failed to detect color mode for: {!r}'.format(env),
+                )
+                self.assertEqual(
+                    detect_color_mode(io.StringIO(), refresh=True),
+                    ColorMode.DISABLED,
+                    msg='Non-ttys should be disabled.',
+                )
+        # Results are cached until refreshed.
+        with mock.patch.dict(os.environ, {'TERM': 'xterm-256color'}):
+            os.environ.pop('NO_COLOR', None)
+            os.environ.pop('COLORTERM', None)
+            self.assertEqual(
+                detect_color_mode(tty, refresh=True),
+                ColorMode.TERM256,
+            )
+        with mock.patch.dict(os.environ, {'NO_COLOR': '1'}):
+            self.assertEqual(detect_color_mode(tty), ColorMode.TERM256)
+            self.assertEqual(
+                detect_color_mode(tty, refresh=True),
+                ColorMode.DISABLED,
+            )
+            with mock.patch.object(sys, 'stdout', tty):
+                self.assertEqual(parse_color_mode('auto'), ColorMode.DISABLED)
+
+        # Compiled terminfo entries are read for any TERM, in any order.
+        with tempfile.TemporaryDirectory() as dirpath:
+            entries = (
+                ('colr-test-mono', None, False, ColorMode.DISABLED),
+                ('colr-test-two', 2, False, ColorMode.DISABLED),
+                ('colr-test-eight', 8, False, ColorMode.TERM16),
+                ('colr-test-many', 256, False, ColorMode.TERM256),
+                ('colr-test-rgb', 16777216, True, ColorMode.TRUECOLOR),
+                ('colr-test-ext', 88, True, ColorMode.TERM16),
+            )
+            for name, colors, extended, _ in entries:
+                write_terminfo(dirpath, name, colors, extended=extended)
+            env = {'TERMINFO': dirpath, 'TERMINFO_DIRS': dirpath}
+            for name, colors, extended, expected in entries * 2:
+                env['TERM'] = name
+                with mock.patch.dict(os.environ, clear=True, values=env):
+                    self.assertCallEqual(
+                        detect_color_mode(tty, refresh=True),
+                        expected,
+                        func=detect_color_mode,
+                        args=(tty, ),
+                        kwargs={'refresh': True},
+                        msg='Failed to use terminfo colors for: {}'.format(
+                            name,
+                        ),
+                    )
+
     def test_format(self):
         """ Colr.__format__ should use Colr.ljust and friends. """
         testformats = {
@@ -375,6 +901,60 @@ class ColrTests(ColrTestCase):
             msg='Colr(\'{}\').format(Colr()) breaks formatting!',
         )
 
+    def test_get_known_name(self):
+        """ get_known_name() should answer from the index the same way it
+            answers by parsing, and get_known_codes() should explain them.
+        """
+        cases = (
+            ('\033[31m', ('fore', 'red')),
+            ('\033[104m', ('back', 'lightblue')),
+            ('\033[1m', ('style', 'bold')),
+            ('\033[39m', ('fore', 'reset')),
+            ('\033[38;5;9m', ('extended fore', 9)),
+            ('\033[48;5;196m', ('extended back', '196')),
+            ('\033[38;2;1;2;3m', ('rgb fore', (1, 2, 3))),
+            ('\033[48;2;255;0;9m', ('rgb back', (255, 0, 9))),
+            ('\033[1;31m', None),
+            ('\033[38m', None),
+            ('\033[2J', None),
+        )
+        for code, expected in cases:
+            self.assertCallEqual(
+                get_known_name(code),
+                expected,
+                func=get_known_name,
+                args=(code, ),
+                msg='Failed to find known name.',
+            )
+            self.assertEqual(_get_known_name(code), expected)
+        for number in range(256):
+            for code in (
+                    '\033[{}m'.format(number),
+                    '\033[38;5;{}m'.format(number),
+                    '\033[48;2;{0};{0};{0}m'.format(number)):
+                try:
+                    expected = _get_known_name(code)
+                except InvalidEscapeCode:
+                    with self.assertRaises(InvalidEscapeCode):
+                        get_known_name(code)
+                    continue
+                self.assertEqual(get_known_name(code), expected)
+        # Bad RGB values are still rejected.
+        for code in ('\033[38;2;1;2;256m', '\033[38;2;1;2m'):
+            with self.assertRaises(InvalidEscapeCode):
+                get_known_name(code)
+
+        s = ''.join((
+            str(Colr('a', 'red', back=(1, 2, 3))),
+            str(Colr('b', 'red')),
+        ))
+        explained = list(get_known_codes(s))
+        self.assertEqual(len(explained), 3)
+        self.assertTrue(explained[0].strip().startswith('Rgb Back:'))
+        self.assertTrue(explained[1].strip().startswith('Fore:'))
+        self.assertEqual(list(get_known_codes(s)), explained)
+        self.assertEqual(len(list(get_known_codes(s, unique=False))), 5)
+
     def test_getitem(self):
         """ Colr.__getitem__ should grab escape codes before and after. """
         # Simple string indexing, with color codes.
@@ -420,6 +1000,35 @@ class ColrTests(ColrTestCase):
             msg='Failed to keep color codes for chained __getitem__.',
         )
 
+    def test_getitem_index(self):
+        """ Colr.__getitem__ should use the visible index for slices. """
+        clr = Colr('test', 'red').blue('this').rgb(0, 0, 0, 'thing')
+        tokens = clr.tokens()
+        self.assertEqual(tokens.text_length(), len(clr.stripped()))
+        # Every code before the slice is kept, and codes inside it.
+        self.assertEqual(
+            tokens.slice_visible(5, 10),
+            ''.join((
+                '\x1b[31m',
+                closing_code,
+                '\x1b[34m',
+                'his',
+                closing_code,
+                '\x1b[38;2;0;0;0m',
+                'th',
+            )),
+        )
+        for start in range(len(clr.stripped())):
+            for stop in range(start + 1, len(clr.stripped()) + 1):
+                self.assertEqual(
+                    clr[start:stop].stripped(),
+                    clr.stripped()[start:stop],
+                    msg='Slice [{}:{}] had the wrong text.'.format(
+                        start,
+                        stop,
+                    ),
+                )
+
     def test_getitem_slice(self):
         """ Colr.__getitem__ should handle slices/ranges. """
         clr = Colr('test', 'red').blue('this').rgb(0, 0, 0, 'thing')
@@ -545,6 +1154,36 @@ class ColrTests(ColrTestCase):
                     func=Colr().gradient,
                 ))
 
+    def test_gradient_rgb(self):
+        """ Colr.gradient_rgb should color every character, from start to
+            stop.
+        """
+        for text in ('a', 'test', 'test\nline two', 'x' * 100):
+            for step in (1, 3, 200):
+                clr = Colr().gradient_rgb(
+                    text,
+                    start=(255, 0, 0),
+                    stop=(0, 0, 255),
+                    step=step,
+                )
+                self.assertCallEqual(
+                    clr.stripped(),
+                    text,
+                    func=Colr().gradient_rgb,
+                    args=(text, ),
+                    kwargs={'step': step},
+                    msg='Failed to keep all of the text.',
+                )
+        clr = Colr().gradient_rgb('ab', start=(255, 0, 0), stop=(0, 0, 255))
+        self.assertTrue(
+            str(clr).startswith('\x1b[38;2;255;0;0ma'),
+            msg='Failed to start with the start color: {!r}'.format(clr),
+        )
+        self.assertEqual(
+            str(Colr().gradient_rgb('', start=(255, 0, 0))),
+            '',
+        )
+
     def test_hash(self):
         """ hash(Colr()) should return a unique hash for self.data. """
         a, b = hash(Colr('test', 'red')), hash(Colr('test', 'red'))
@@ -839,6 +1478,101 @@ class ColrTests(ColrTestCase):
                 msg='Failed to strip characters from colorized Colr.',
             )
 
+    def test_style(self):
+        """ Style should produce the same output as Colr.color(). """
+        argsets = self.example_args()
+        argsets['none'] = {}
+        texts = ('test', '', Colr('embedded', 'red'), 'x{}'.format(
+            Colr('embedded', 'red')
+        ))
+        for argtype, kwargs in argsets.items():
+            style = Style(**kwargs)
+            for text in texts:
+                expected = Colr().color(text, **kwargs)
+                self.assertCallEqual(
+                    style(text),
+                    expected,
+                    func=style,
+                    args=(text, ),
+                    msg='Style ({}) output did not match.'.format(argtype),
+                )
+                self.assertCallEqual(
+                    style.bytes(text),
+                    expected.encode(),
+                    func=style.bytes,
+                    args=(text, ),
+                    msg='Style ({}) bytes did not match.'.format(argtype),
+                )
+        # Styles can be used as the `style` arg for Colr methods.
+        style = Style('red', back='blue', style='bright')
+        self.assertCallEqual(
+            Colr('test', style=style),
+            Colr('test', 'red', 'blue', style='bright'),
+            func=Colr,
+            args=('test', ),
+            kwargs={'style': style},
+            msg='Style did not work as a Colr style arg.',
+        )
+        self.assertCallEqual(
+            Colr(', ').join('a', 'b', style=style),
+            Colr(', ').join('a', 'b', fore='red', back='blue', style='bright'),
+            func=Colr.join,
+            args=('a', 'b'),
+            kwargs={'style': style},
+            msg='Style did not work with Colr.join.',
+        )
+        with self.assertRaises(InvalidColr):
+            Style('NOTACOLOR')
+
+    def test_slots(self):
+        """ Colr, Control, and parts should not have a __dict__. """
+        clr = Colr('test', 'red')
+        for obj in (clr, Control('test'), *clr.parts()):
+            self.assertFalse(
+                hasattr(obj, '__dict__'),
+                msg='{} has a __dict__.'.format(type(obj).__name__),
+            )
+        # Parts are sliced from the original string when needed.
+        self.assertEqual(
+            [str(part) for part in clr.parts()],
+            ['\x1b[31m', 'test', closing_code],
+            msg='Parts did not slice the original string.',
+        )
+
+    def test_tokenize(self):
+        """ tokenize() should split text and codes into span tables. """
+        s = ''.join((
+            'plain',
+            str(Colr('red', 'red')),
+            '\033[2A',
+            '\033[m',
+            'end',
+        ))
+        tokens = tokenize(s)
+        self.assertEqual(
+            [(s[start:stop], kind) for start, stop, kind in tokens],
+            [
+                ('plain', TOKEN_TEXT),
+                ('\033[31m', TOKEN_SGR),
+                ('red', TOKEN_TEXT),
+                (closing_code, TOKEN_SGR),
+                ('\033[2A', TOKEN_CODE),
+                ('\033[m', TOKEN_CODE),
+                ('end', TOKEN_TEXT),
+            ],
+            msg='Tokens were not split correctly.',
+        )
+        self.assertEqual(tokens.codes(), get_codes(s))
+        self.assertEqual(tokens.stripped(), strip_codes(s))
+        self.assertEqual(tokens.text_length(), len(strip_codes(s)))
+        self.assertEqual(len(tokenize('')), 0)
+        self.assertEqual(list(tokenize('plain')), [(0, 5, TOKEN_TEXT)])
+        # Tokens are cached until the data changes.
+        clr = Colr(s)
+        self.assertIs(clr.tokens(), clr.tokens())
+        clr.red('more')
+        self.assertEqual(clr.tokens().text, str(clr))
+
     def test_strip_codes(self):
         """ strip_codes() should strip all color and reset codes. """
         s = '\n'.join((
@@ -864,6 +1598,69 @@ class ColrTests(ColrTestCase):
                 msg='Failed to strip codes from {} string.'.format(desc),
             )
 
+    def test_strip_codes_bytes(self):
+        """ strip_codes_bytes() and iter_codes_bytes() should match the str
+            versions, for any buffer.
+        """
+        s = ''.join((
+            str(Colr('test', 'red', style='bright')),
+            '\033[2A\033[?25l\033[1;2H\033[m',
+            str(Colr('this', (0, 0, 0))),
+            ' thing',
+        ))
+        data = s.encode()
+        expected_codes = [c.encode() for c in get_codes(s)]
+        for buf in (data, bytearray(data), memoryview(data)):
+            self.assertCallEqual(
+                strip_codes_bytes(buf),
+                strip_codes(s).encode(),
+                func=strip_codes_bytes,
+                args=(buf, ),
+                msg='Failed to strip codes from bytes.',
+            )
+            spans = list(iter_codes_bytes(buf))
+            self.assertCallEqual(
+                [bytes(memoryview(buf)[start:stop]) for start, stop in spans],
+                expected_codes,
+                func=iter_codes_bytes,
+                args=(buf, ),
+                msg='Failed to find codes in bytes.',
+            )
+        self.assertIs(strip_codes_bytes(b'plain'), b'plain')
+        self.assertEqual(list(iter_codes_bytes(b'plain')), [])
+
+    def test_strip_stream(self):
+        """ iter_strip_codes() and StripStream should strip codes that are
+            split across chunks, for any chunk size.
+        """
+        s = ''.join((
+            str(Colr('test', 'red', style='bright')),
+            '\033[2A\033[?25l\033[12;2H\033[m\033[',
+            str(Colr('this', (0, 0, 0))),
+            ' thing\033[1',
+        ))
+        expected = strip_codes(s)
+        for size in range(1, len(s) + 1):
+            chunks = [s[i:i + size] for i in range(0, len(s), size)]
+            self.assertCallEqual(
+                ''.join(iter_strip_codes(chunks)),
+                expected,
+                func=iter_strip_codes,
+                args=(chunks, ),
+                msg='Failed to strip codes across chunks.',
+            )
+            stream = StripStream(io.BytesIO(s.encode()), chunksize=size)
+            self.assertCallEqual(
+                stream.read(3) + stream.read(),
+                expected.encode(),
+                func=StripStream.read,
+                args=(stream, ),
+                msg='Failed to strip codes from a stream.',
+            )
+        with StripStream(io.StringIO(s), chunksize=7) as stream:
+            self.assertEqual(''.join(stream), expected)
+        self.assertEqual(list(iter_strip_codes(['', 'plain', ''])), ['plain'])
+
     def test_stripped(self):
         """ Colr.stripped() should return strip_codes(Colr()). """
         data = 'This is a test.'
@@ -884,6 +1681,42 @@ class ColrTests(ColrTestCase):
             msg='Stripped Colr has different content.',
         )
 
+    def test_stripped_cache(self):
+        """ Colr.stripped() should be cached until the data changes. """
+        c = Colr('test', fore='red')
+        saved = ChainedBase.strip_passes_saved
+        self.assertEqual(c.stripped(), 'test')
+        self.assertEqual(c.stripped(), 'test')
+        self.assertEqual(
+            ChainedBase.strip_passes_saved - saved,
+            1,
+            msg='Second stripped() call was not cached.',
+        )
+        # Appending invalidates the cache.
+        for method, expected in (
+                (lambda: c.blue('this'), 'testthis'),
+                (lambda: c('thing'), 'testthisthing'),
+                (lambda: c.chained(' !'), 'testthisthing !'),
+                ):
+            method()
+            self.assertEqual(
+                c.stripped(),
+                expected,
+                msg='Stripped cache was not invalidated.',
+            )
+        saved = ChainedBase.strip_passes_saved
+        formatted = '{:<20}'.format(c)
+        self.assertEqual(strip_codes(formatted), 'testthisthing !     ')
+        self.assertGreater(
+            ChainedBase.strip_passes_saved,
+            saved,
+            msg='Formatting did not use the stripped cache.',
+        )
+        # write() clears the data.
+        with open(os.devnull, 'w') as devnull:
+            c.write(file=devnull)
+        self.assertEqual(c.stripped(), '')
+
 
 if __name__ == '__main__':
     print('Testing Colr v. {}'.format(__version__))
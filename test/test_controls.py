@@ -93,6 +93,20 @@ class ControlTests(ColrTestCase):
         # and perform the actions? I need to do some research.
         pass
 
+    def test_last_code(self):
+        """ Control.last_code() should return the last code, or ''. """
+        ctl = Control().move_up().move_down()
+        self.assertEqual(
+            str(move.down()),
+            ctl.last_code(),
+            msg='Control.last_code returned the wrong code.',
+        )
+        self.assertEqual(
+            '',
+            Control('no codes').last_code(),
+            msg='Control.last_code should return \'\' without codes.',
+        )
+
     def test_repeat(self):
         """ Control.repeat() should repeat the last code. """
         s = ''.join((
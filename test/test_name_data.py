@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" test_name_data.py
+    Unit tests for colr/name_data.py
+"""
+
+import random
+import sys
+import unittest
+
+from colr import (
+    __version__,
+    complete_name,
+    get_name_code,
+    name_data,
+    nearest_name,
+)
+from colr.trans import (
+    hex2rgb,
+    term2hex,
+    term2rgb,
+)
+from .testing_tools import ColrTestCase
+
+
+class NameDataTests(ColrTestCase):
+    """ Tests for colr/name_data.py """
+
+    def test_complete_name(self):
+        """ complete_name() should find names by prefix, and fuzzy matches.
+        """
+        names = list(name_data)
+        for prefix in ('', 'a', 'light', 'LightSteel', 'lightsteelblue5'):
+            expected = [
+                name
+                for name in names
+                if name.startswith(prefix.lower())
+            ]
+            self.assertCallEqual(
+                complete_name(prefix),
+                expected,
+                func=complete_name,
+                args=(prefix, ),
+                msg='Failed to complete name.',
+            )
+        self.assertEqual(complete_name('nosuchcolor'), [])
+        fuzzy = complete_name('ltsteelblu', fuzzy=True)
+        self.assertIn('lightsteelblue', fuzzy)
+        self.assertEqual(
+            complete_name('red', fuzzy=True)[:2],
+            ['red', 'red2'],
+            msg='Prefix matches should come first.',
+        )
+
+    def test_names(self):
+        """ name_data should map names to code/hexval/rgb info. """
+        names = list(name_data)
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(len(name_data), len(names))
+        self.assertEqual(
+            name_data['aliceblue'],
+            {'code': 231, 'hexval': 'ffffff', 'rgb': (255, 255, 255)},
+        )
+        # Red and yellow use the basic codes, not the cube codes.
+        self.assertEqual(name_data['red']['code'], 9)
+        self.assertEqual(name_data['yellow']['code'], 11)
+        for name in names:
+            info = name_data[name]
+            self.assertEqual(get_name_code(name), info['code'])
+            self.assertEqual(info['hexval'], term2hex(info['code']))
+            self.assertEqual(info['rgb'], hex2rgb(info['hexval']))
+        self.assertNotIn('nosuchcolor', name_data)
+        self.assertIsNone(name_data.get('nosuchcolor'))
+        self.assertIsNone(get_name_code('nosuchcolor'))
+        with self.assertRaises(KeyError):
+            name_data['nosuchcolor']
+
+    def test_nearest_name(self):
+        """ nearest_name() should find the name with the closest color. """
+        for name in name_data:
+            rgb = name_data[name]['rgb']
+            nearest = nearest_name(*rgb)
+            self.assertCallEqual(
+                name_data[nearest]['rgb'],
+                rgb,
+                func=nearest_name,
+                args=rgb,
+                msg='Failed to find a name with the exact color.',
+            )
+        self.assertEqual(nearest_name(0, 0, 0), 'black')
+        self.assertEqual(nearest_name(250, 5, 5), 'red')
+        self.assertEqual(nearest_name(*term2rgb(23)), 'darkslategray')
+        rand = random.Random(24)
+        codes = {name_data[name]['code'] for name in name_data}
+        for _ in range(100):
+            rgb = tuple(rand.randint(0, 255) for _ in range(3))
+            self.assertIn(get_name_code(nearest_name(*rgb)), codes)
+        for args in ((-1, 0, 0), (0, 256, 0)):
+            with self.assertRaises(ValueError):
+                nearest_name(*args)
+
+
+if __name__ == '__main__':
+    print('Testing Colr.name_data v. {}'.format(__version__))
+    # unittest.main() calls sys.exit(status_code).
+    unittest.main(argv=sys.argv, verbosity=2)  # type: ignore
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" test_sgr.py
+    Unit tests for colr/sgr.py
+"""
+
+import random
+import sys
+import unittest
+
+from colr import (
+    __version__,
+    Colr,
+    iter_sgr_states,
+    optimize,
+    sgr_state_at,
+    SgrState,
+    truncate,
+    wrap,
+)
+from colr.base import (
+    ChainedBase,
+    TOKEN_TEXT,
+    tokenize,
+)
+from colr.sgr import (
+    _default_state,
+    _next_state,
+)
+from .testing_tools import ColrTestCase
+
+# Pieces for the fuzz tests.
+sgr_pieces = (
+    'a', 'bc', ' ', '\n',
+    '\033[0m', '\033[m', '\033[1m', '\033[2m', '\033[22m', '\033[3m',
+    '\033[4m', '\033[24m', '\033[7m', '\033[27m', '\033[31m', '\033[39m',
+    '\033[41m', '\033[49m', '\033[91m', '\033[38;5;196m', '\033[48;5;22m',
+    '\033[38;2;1;2;3m', '\033[1;31;44m', '\033[0;32m', '\033[K',
+    '\033[2A', '\033[53m', '\033[38:5:1m', '\033]0;title\007',
+)
+
+
+def render(s):
+    """ Return the state for each visible character in `s`, and the state
+        at the end. Unknown states are None.
+    """
+    state = _default_state
+    chars = []
+    tokens = tokenize(s)
+    for start, stop, kind in tokens:
+        piece = tokens.text[start:stop]
+        if kind == TOKEN_TEXT:
+            chars.extend((c, state) for c in piece)
+        elif piece.startswith('\033[') and piece.endswith('m'):
+            state = _next_state(state, piece)
+    return chars, state
+
+
+class SgrTests(ColrTestCase):
+    """ Tests for colr/sgr.py """
+
+    def test_iter_sgr_states(self):
+        """ iter_sgr_states() should yield runs of text with their state. """
+        clr = Colr('ab', 'red', style='bright').join(
+            'x',
+            Colr('cd', 196, back=(1, 2, 3)),
+            '\033[2Aef',
+        )
+        expected = [
+            ('x', SgrState()),
+            ('ab', SgrState(fore=(31, ), bold=True)),
+            ('cd', SgrState(fore=(38, 5, 196), back=(48, 2, 1, 2, 3))),
+            ('ab', SgrState(fore=(31, ), bold=True)),
+            # Other codes are not part of the text.
+            ('ef', SgrState()),
+        ]
+        for s in (clr, str(clr)):
+            self.assertCallEqual(
+                list(iter_sgr_states(s)),
+                expected,
+                func=iter_sgr_states,
+                args=(s, ),
+                msg='Failed to find states for text runs.',
+            )
+        self.assertEqual(list(iter_sgr_states('')), [])
+        self.assertEqual(sgr_state_at(clr, 0), SgrState())
+        self.assertEqual(sgr_state_at(clr, 3).fore_name, '196')
+        self.assertEqual(sgr_state_at(clr, -3).back_name, None)
+        self.assertEqual(sgr_state_at(clr, -3).fore_name, 'red')
+        with self.assertRaises(IndexError):
+            sgr_state_at(clr, 9)
+
+    def test_optimize(self):
+        """ optimize() should drop and merge redundant codes. """
+        cases = (
+            ('', ''),
+            ('plain', 'plain'),
+            (
+                str(Colr('a', 'red')) + str(Colr('b', 'red')),
+                '\033[31mab\033[0m',
+            ),
+            (
+                str(Colr('a', 'red', style='bright')) + str(Colr('b', 'blue')),
+                '\033[1;31ma\033[0;34mb\033[0m',
+            ),
+            ('\033[1m\033[31m\033[44mx\033[0m', '\033[1;31;44mx\033[0m'),
+            ('\033[0mx\033[31m\033[0m', 'x'),
+            ('\033[31mx\033[31m\033[39;31my\033[0m', '\033[31mxy\033[0m'),
+            ('x\033[31m', 'x\033[31m'),
+            # Other codes are kept in place, after the colors they use.
+            ('\033[41m\033[K\033[0m', '\033[41m\033[K\033[0m'),
+            # Codes that aren't understood are kept as-is.
+            (
+                '\033[53mx\033[31my\033[0mz',
+                '\033[53mx\033[31my\033[0mz',
+            ),
+            (
+                '\033[38:5:1mx\033[0m\033[31my\033[0m',
+                '\033[38:5:1mx\033[0;31my\033[0m',
+            ),
+        )
+        for s, expected in cases:
+            self.assertCallEqual(
+                optimize(s),
+                expected,
+                func=optimize,
+                args=(s, ),
+                msg='Failed to optimize codes.',
+            )
+
+    def test_optimize_fuzz(self):
+        """ optimize() should never change how a string is displayed. """
+        rand = random.Random(15)
+        for _ in range(1000):
+            s = ''.join(
+                rand.choice(sgr_pieces)
+                for _ in range(rand.randint(0, 20))
+            )
+            optimized = optimize(s)
+            # Bare resets ('\033[m') are written as '\033[0m'.
+            self.assertLessEqual(
+                len(optimized),
+                len(s.replace('\033[m', '\033[0m')),
+            )
+            self.assertCallEqual(
+                render(optimized),
+                render(s),
+                func=optimize,
+                args=(s, ),
+                msg='Optimized string is displayed differently.',
+            )
+
+    def test_sgr_state(self):
+        """ SgrState.apply() should track each kind of parameter. """
+        cases = (
+            ('\033[1;2;3;4;5;7;8;9m', SgrState(
+                bold=True, dim=True, italic=True, underline=True,
+                flash=True, reverse=True, conceal=True, strike=True,
+            )),
+            ('\033[1;22;3;23;4;24;5;25;7;27;8;28;9;29m', SgrState()),
+            ('\033[31;42m', SgrState(fore=(31, ), back=(42, ))),
+            ('\033[91;101m', SgrState(fore=(91, ), back=(101, ))),
+            ('\033[38;2;1;2;3m', SgrState(fore=(38, 2, 1, 2, 3))),
+            ('\033[31;42;39;49m', SgrState()),
+            ('\033[0;1m', SgrState(bold=True)),
+            # Unknown parameters and broken colors are ignored.
+            ('\033[1;53;38;5m', SgrState(bold=True)),
+            ('\033[38:5:1m', SgrState()),
+            ('\033[2A', SgrState()),
+        )
+        for code, expected in cases:
+            self.assertCallEqual(
+                SgrState().apply(code),
+                expected,
+                func=SgrState.apply,
+                args=(SgrState(), code),
+                msg='Failed to apply code.',
+            )
+        start = SgrState(fore=(32, ), bold=True, italic=True)
+        self.assertEqual(
+            start.apply('\033[22;39;44m'),
+            SgrState(back=(44, ), italic=True),
+        )
+        self.assertEqual(start.apply('\033[0;4m'), SgrState(underline=True))
+        state = SgrState(fore=(91, ), back=(48, 5, 22), bold=True)
+        self.assertEqual(state.code(), '\033[1;91;48;5;22m')
+        self.assertEqual(SgrState().code(), '')
+        self.assertEqual(state.fore_name, 'lightred')
+        self.assertEqual(state.back_name, '22')
+        self.assertEqual(SgrState().apply(state.code()), state)
+
+    def test_optimized(self):
+        """ Colr.optimized() should optimize the Colr's data. """
+        clr = Colr('test', 'red').rainbow('rainbow', spread=2)
+        optimized = clr.optimized()
+        self.assertIsInstance(optimized, Colr)
+        self.assertLess(len(str(optimized)), len(str(clr)))
+        self.assertEqual(optimized.stripped(), clr.stripped())
+        self.assertEqual(str(optimized), optimize(str(clr)))
+
+    def test_truncate(self):
+        """ truncate() should cut visible characters, and keep the colors. """
+        red = str(Colr('abcdef', 'red'))
+        cases = (
+            (('plain', 10), 'plain'),
+            (('plain', 3), 'pl\u2026'),
+            (('plain', 0), ''),
+            ((red, 6), red),
+            ((red, 4), '\033[31mabc\u2026\033[0m'),
+            ((red, 4, '..'), '\033[31mab..\033[0m'),
+            ((red, 1), '\u2026'),
+            (('ab\033[1mcd\033[0mef', 3), 'ab\u2026'),
+            (('ab\033[1mcd\033[0mef', 4), 'ab\033[1mc\u2026\033[0m'),
+        )
+        for args, expected in cases:
+            self.assertCallEqual(
+                truncate(*args),
+                expected,
+                func=truncate,
+                args=args,
+                msg='Failed to truncate.',
+            )
+        clr = Colr('abcdef', 'red').truncate(4)
+        self.assertIsInstance(clr, Colr)
+        self.assertEqual(str(clr), '\033[31mabc\u2026\033[0m')
+
+    def test_wrap(self):
+        """ wrap() should wrap visible characters, and re-open the colors
+            on each line.
+        """
+        cases = (
+            (('', 5), []),
+            (('one two three', 7), ['one two', 'three']),
+            (('one\n\ntwo', 5), ['one', '', 'two']),
+            (('abcdefgh', 3), ['abc', 'def', 'gh']),
+            (
+                (str(Colr('one two', 'red')) + ' three', 5),
+                [
+                    '\033[31mone\033[0m',
+                    '\033[31mtwo\033[0m',
+                    'three',
+                ],
+            ),
+            (
+                ('\033[1mone \033[32mtwo\033[0m', 3),
+                ['\033[1mone\033[0m', '\033[1;32mtwo\033[0m'],
+            ),
+        )
+        for args, expected in cases:
+            self.assertCallEqual(
+                wrap(*args),
+                expected,
+                func=wrap,
+                args=args,
+                msg='Failed to wrap.',
+            )
+        with self.assertRaises(ValueError):
+            wrap('test', 0)
+        lines = Colr('one two', 'red').wrap(3)
+        self.assertTrue(all(isinstance(line, Colr) for line in lines))
+        self.assertEqual(
+            str(Colr('one two', 'red').fill(3)),
+            '\n'.join(str(line) for line in lines),
+        )
+
+    def test_wrap_fuzz(self):
+        """ wrap() and truncate() should cut like they do for plain text,
+            keep each character's colors, and close what they open.
+        """
+        rand = random.Random(17)
+        for _ in range(1000):
+            s = ''.join(
+                rand.choice(sgr_pieces)
+                for _ in range(rand.randint(0, 30))
+            )
+            width = rand.randint(1, 8)
+            lines = wrap(s, width)
+            self.assertCallEqual(
+                [ChainedBase(line).stripped() for line in lines],
+                wrap(ChainedBase(s).stripped(), width),
+                func=wrap,
+                args=(s, width),
+                msg='Colored lines are wrapped differently.',
+            )
+            # Every non-blank character is drawn in the same state.
+            chars = [c for c in render(s)[0] if not c[0].isspace()]
+            linechars = []
+            for line in lines:
+                rendered, end = render(line)
+                self.assertEqual(end, _default_state, msg=repr(s))
+                linechars.extend(c for c in rendered if not c[0].isspace())
+            self.assertEqual(len(linechars), len(chars))
+            for (char, state), (orig, origstate) in zip(linechars, chars):
+                self.assertEqual(char, orig)
+                if origstate is not None:
+                    self.assertEqual(state, origstate, msg=repr(s))
+            truncated = truncate(s, width)
+            self.assertCallEqual(
+                ChainedBase(truncated).stripped(),
+                truncate(ChainedBase(s).stripped(), width),
+                func=truncate,
+                args=(s, width),
+                msg='Colored string is truncated differently.',
+            )
+            if truncated != s:
+                self.assertEqual(render(truncated)[1], _default_state)
+
+
+if __name__ == '__main__':
+    print('Testing Colr.sgr v. {}'.format(__version__))
+    # unittest.main() calls sys.exit(status_code).
+    unittest.main(argv=sys.argv, verbosity=2)  # type: ignore
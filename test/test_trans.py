@@ -7,26 +7,47 @@
     -Christopher Welborn 03-29-2017
 """
 
+import pickle
+import random
 import sys
 import unittest
+from array import array
+from unittest import mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from colr import (
     __version__,
+    Colr,
 )
+from colr import trans
 from colr.trans import (
     ColorCode,
     fix_hex,
     hex2rgb,
+    hex2rgb_array,
     hex2term,
+    hex2term_int,
+    hex2term_map,
     hex2termhex,
     is_code,
     is_ext_code,
     is_rgb_code,
     rgb2hex,
+    rgb2hex_array,
     rgb2term,
+    rgb2term_array,
+    rgb2term_int,
+    rgb2term_nearest,
     rgb2termhex,
+    rgb2termhex_array,
     term2hex,
+    term2hex_array,
     term2rgb,
+    term2rgb_array,
 )
 from .testing_tools import ColrTestCase
 
@@ -57,6 +78,145 @@ class TransTests(ColrTestCase):
             ),
         )
 
+    def test_array_fallback(self):
+        """ The *_array() functions should work without NumPy. """
+        rgbs = [(0, 0, 0), (128, 128, 128), (250, 10, 99)]
+        hexvals = [rgb2hex(*rgb) for rgb in rgbs]
+        codes = [0, 15, 231]
+        with mock.patch.object(trans, 'np', None):
+            self.assertEqual(hex2rgb_array(hexvals), rgbs)
+            self.assertEqual(rgb2hex_array(rgbs), hexvals)
+            self.assertEqual(
+                rgb2term_array(rgbs),
+                array('B', (rgb2term_int(*rgb) for rgb in rgbs)),
+            )
+            self.assertEqual(
+                rgb2term_array(rgbs, perceptual=True),
+                array('B', (rgb2term_nearest(*rgb) for rgb in rgbs)),
+            )
+            self.assertEqual(
+                rgb2termhex_array(rgbs),
+                [rgb2termhex(*rgb) for rgb in rgbs],
+            )
+            self.assertEqual(
+                term2hex_array(codes),
+                [term2hex(code) for code in codes],
+            )
+            self.assertEqual(
+                term2rgb_array(codes),
+                [term2rgb(code) for code in codes],
+            )
+            with self.assertRaises(ValueError):
+                rgb2term_array([(0, 0, 256)])
+
+    @unittest.skipUnless(numpy, 'NumPy is not installed.')
+    def test_array_numpy(self):
+        """ The *_array() functions should match the single value
+            functions.
+        """
+        rand = random.Random(22)
+        rgblist = [
+            tuple(rand.randint(0, 255) for _ in range(3))
+            for _ in range(2000)
+        ]
+        # Every channel value, including the ties between cube steps.
+        rgblist.extend((i, i, i) for i in range(256))
+        rgbs = numpy.array(rgblist)
+        hexvals = [rgb2hex(*rgb) for rgb in rgblist]
+        codes = rgb2term_array(rgbs)
+        self.assertEqual(codes.dtype, numpy.uint8)
+        self.assertCallEqual(
+            codes.tolist(),
+            [rgb2term_int(*rgb) for rgb in rgblist],
+            func=rgb2term_array,
+            args=(rgbs, ),
+            msg='Failed to match rgb2term_int().',
+        )
+        # Grays can be exactly between two palette colors, like (1, 1, 1),
+        # so only the random colors are compared.
+        randrgbs = rgbs[:2000]
+        self.assertCallEqual(
+            rgb2term_array(randrgbs, perceptual=True).tolist(),
+            [rgb2term_nearest(*rgb) for rgb in rgblist[:2000]],
+            func=rgb2term_array,
+            args=(randrgbs, ),
+            kwargs={'perceptual': True},
+            msg='Failed to match rgb2term_nearest().',
+        )
+        self.assertCallEqual(
+            rgb2hex_array(rgbs).tolist(),
+            hexvals,
+            func=rgb2hex_array,
+            args=(rgbs, ),
+            msg='Failed to match rgb2hex().',
+        )
+        self.assertCallEqual(
+            rgb2termhex_array(rgbs).tolist(),
+            [rgb2termhex(*rgb) for rgb in rgblist],
+            func=rgb2termhex_array,
+            args=(rgbs, ),
+            msg='Failed to match rgb2termhex().',
+        )
+        self.assertCallEqual(
+            hex2rgb_array(hexvals).tolist(),
+            [list(rgb) for rgb in rgblist],
+            func=hex2rgb_array,
+            args=(hexvals, ),
+            msg='Failed to match hex2rgb().',
+        )
+        allcodes = numpy.arange(256)
+        self.assertCallEqual(
+            term2hex_array(allcodes).tolist(),
+            [term2hex(code) for code in range(256)],
+            func=term2hex_array,
+            args=(allcodes, ),
+            msg='Failed to match term2hex().',
+        )
+        self.assertCallEqual(
+            term2rgb_array(allcodes).tolist(),
+            [list(term2rgb(code)) for code in range(256)],
+            func=term2rgb_array,
+            args=(allcodes, ),
+            msg='Failed to match term2rgb().',
+        )
+
+        # Floats round like rgb2term_int(), ties going to the bigger step.
+        floats = numpy.array([(47.5, 114.9, 115.0), (47.4, 155.0, 234.9)])
+        self.assertEqual(
+            rgb2term_array(floats).tolist(),
+            [rgb2term_int(*rgb) for rgb in floats.tolist()],
+        )
+        self.assertEqual(
+            hex2rgb_array([' #FFF', 'ABCDEF', '#0a0'], allow_short=True)
+            .tolist(),
+            [[255, 255, 255], [171, 205, 239], [0, 170, 0]],
+        )
+        self.assertEqual(term2rgb_array(['07', '255']).tolist(), [
+            list(term2rgb(7)),
+            list(term2rgb(255)),
+        ])
+        self.assertEqual(rgb2term_array([]).tolist(), [])
+        self.assertEqual(hex2rgb_array([]).shape, (0, 3))
+
+        for func, badarg in (
+                (hex2rgb_array, ['ffffff', 'gggggg']),
+                (hex2rgb_array, ['#fff']),
+                (hex2rgb_array, [1, 2]),
+                (rgb2term_array, [(0, 0)]),
+                (rgb2term_array, [(0, 0, 256)]),
+                (rgb2term_array, [(-1, 0, 0)]),
+                (rgb2term_array, [(numpy.nan, 0, 0)]),
+                (rgb2hex_array, [('a', 'b', 'c')]),
+                (term2hex_array, [256]),
+                (term2rgb_array, ['x']),
+        ):
+            with self.assertCallRaises(
+                    ValueError,
+                    func=func,
+                    args=(badarg, ),
+                    msg='Failed to raise.'):
+                func(badarg)
+
     def test_colorcode(self):
         """ ColorCode should properly translate codes. """
 
@@ -81,6 +241,84 @@ class TransTests(ColrTestCase):
                 msg='Failed to find known close match.'
             )
 
+    def test_colorcode_interned(self):
+        """ ColorCode.from_* should return shared, immutable instances that
+            match ColorCode().
+        """
+        rand = random.Random(23)
+        values = [
+            tuple(rand.randint(0, 255) for _ in range(3))
+            for _ in range(200)
+        ]
+        values.extend(rgb2hex(*rgb) for rgb in values[:50])
+        values.extend(range(256))
+        values.extend(('07', '255', '#abc', 'fff'))
+        for value in values:
+            for kwargs in (
+                    {},
+                    {'rgb_mode': True},
+                    {'perceptual': True},
+                    {'rgb_mode': True, 'perceptual': True}):
+                expected = ColorCode(value, **kwargs)
+                colorcode = ColorCode.from_value(value, **kwargs)
+                self.assertCallEqual(
+                    colorcode.to_dict(),
+                    expected.to_dict(),
+                    func=ColorCode.from_value,
+                    args=(value, ),
+                    kwargs=kwargs,
+                    msg='Failed to match ColorCode().',
+                )
+                self.assertEqual(colorcode, expected)
+                self.assertEqual(hash(colorcode), hash(expected))
+                self.assertEqual(
+                    colorcode.perceptual,
+                    expected.perceptual,
+                    msg='Failed to keep the perceptual flag.',
+                )
+                self.assertIs(
+                    ColorCode.from_value(value, **kwargs),
+                    colorcode,
+                    msg='Failed to return the interned ColorCode.',
+                )
+
+        red = ColorCode.from_code(196)
+        self.assertIs(ColorCode.from_code('196'), red)
+        self.assertIs(ColorCode.from_hex('ff0000'), red)
+        self.assertIs(ColorCode.from_hex('#F00'), red)
+        self.assertIs(ColorCode.from_rgb(250, 10, 5), red)
+        perceptualred = ColorCode.from_rgb(255, 0, 0, perceptual=True)
+        self.assertEqual(perceptualred, red)
+        self.assertTrue(perceptualred.perceptual)
+        self.assertIs(ColorCode.from_code(196, perceptual=True), perceptualred)
+        self.assertNotEqual(
+            ColorCode.from_rgb(255, 0, 0, rgb_mode=True),
+            red,
+            msg='rgb mode should not match.',
+        )
+        self.assertEqual(len({red, ColorCode(196), ColorCode('ff0000')}), 1)
+        rgbcode = ColorCode.from_rgb(1, 2, 3, rgb_mode=True)
+        self.assertEqual(pickle.loads(pickle.dumps(rgbcode)), rgbcode)
+        with self.assertRaises(AttributeError):
+            red.code = '01'
+        with self.assertRaises(AttributeError):
+            del red.rgb
+        for func, args in (
+                (ColorCode.from_code, (256, )),
+                (ColorCode.from_code, ('x', )),
+                (ColorCode.from_hex, ('ff00', )),
+                (ColorCode.from_rgb, (0, 0, 256)),
+                (ColorCode.from_rgb, (-1, 0, 0)),
+        ):
+            for kwargs in ({}, {'rgb_mode': True}):
+                with self.assertCallRaises(
+                        ValueError,
+                        func=func,
+                        args=args,
+                        kwargs=kwargs,
+                        msg='Failed to raise.'):
+                    func(*args, **kwargs)
+
     def test_fix_hex(self):
         """ fix_hex should translate short-form hex strings. """
         for argset in (('#f',), ('#ffffffXX',), ('',)):
@@ -172,6 +410,135 @@ class TransTests(ColrTestCase):
             self.assertTrue(is_rgb_code(validcode))
         self.assertFalse(is_rgb_code(invalidcode))
 
+    def test_rgb2term_nearest(self):
+        """ rgb2term_nearest() should find the palette color that looks
+            closest, searching the whole palette.
+        """
+        def oklab(rgb):
+            def linear(c):
+                c /= 255
+                if c <= 0.04045:
+                    return c / 12.92
+                return ((c + 0.055) / 1.055) ** 2.4
+            r, g, b = (linear(c) for c in rgb)
+            l = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+            m = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+            s = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+            l, m, s = (x ** (1 / 3) for x in (l, m, s))
+            return (
+                0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+                1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+                0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s,
+            )
+
+        palette = {
+            int(code): oklab(term2rgb(code))
+            for code in hex2term_map.values()
+        }
+
+        def distance(rgb, code):
+            return sum(
+                (x - y) ** 2
+                for x, y in zip(oklab(rgb), palette[code])
+            )
+
+        rand = random.Random(21)
+        rgbs = [
+            tuple(rand.randint(0, 255) for _ in range(3))
+            for _ in range(500)
+        ]
+        # The corners of some 8x8x8 cells, where the nearest color changes.
+        for _ in range(100):
+            corner = tuple(rand.randint(0, 31) * 8 for _ in range(3))
+            rgbs.extend(
+                tuple(part + (7 if (i >> j) & 1 else 0)
+                      for j, part in enumerate(corner))
+                for i in range(8)
+            )
+        for rgb in rgbs:
+            best = min(distance(rgb, code) for code in palette)
+            code = rgb2term_nearest(*rgb)
+            self.assertAlmostEqual(
+                distance(rgb, code),
+                best,
+                msg='Failed to find the closest color for: {!r}'.format(
+                    rgb
+                ),
+            )
+        self.assertEqual(rgb2term_nearest(128, 128, 128), 244)
+        self.assertEqual(rgb2term_nearest(192, 192, 192), 7)
+        self.assertEqual(rgb2term_nearest(128.0, 128, 128.5), 244)
+        for args in ((-1, 0, 0), (0, 256, 0)):
+            with self.assertRaises(ValueError):
+                rgb2term_nearest(*args)
+
+        # Opt-in through the other conversion functions.
+        self.assertEqual(hex2term('808080'), '102')
+        self.assertEqual(hex2term('808080', perceptual=True), '244')
+        self.assertEqual(rgb2term(128, 128, 128, perceptual=True), '244')
+        self.assertEqual(
+            hex2term_int('#888', allow_short=True, perceptual=True),
+            rgb2term_nearest(0x88, 0x88, 0x88),
+        )
+        self.assertEqual(
+            ColorCode('808080', perceptual=True).to_dict(),
+            {'code': '244', 'hexval': '808080', 'rgb': (128, 128, 128)},
+        )
+        self.assertEqual(
+            str(Colr().hex('808080', 'test', perceptual=True)),
+            '\033[38;5;244mtest\033[0m',
+        )
+        self.assertEqual(
+            str(Colr().b_hex('808080', 'test', perceptual=True)),
+            '\033[48;5;244mtest\033[0m',
+        )
+
+    def test_term_int(self):
+        """ rgb2term_int() and hex2term_int() should match the nearest cube
+            color, rounding ties up.
+        """
+        steps = (0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff)
+
+        def nearest(part):
+            # Closest step, preferring the bigger one on a tie.
+            return min(
+                range(len(steps)),
+                key=lambda i: (abs(steps[i] - part), -i),
+            )
+
+        for part in range(256):
+            for r, g, b in ((part, 0, 0), (0, part, 0), (0, 0, part)):
+                expected = 16 + (36 * nearest(r)) + (6 * nearest(g)) + (
+                    nearest(b)
+                )
+                self.assertCallEqual(
+                    rgb2term_int(r, g, b),
+                    expected,
+                    func=rgb2term_int,
+                    args=(r, g, b),
+                    msg='Failed to find nearest cube color.',
+                )
+        for r in steps:
+            for g in steps:
+                for b in steps:
+                    hexval = rgb2hex(r, g, b)
+                    code = hex2term_map[hexval]
+                    self.assertEqual(rgb2term_int(r, g, b), int(code))
+                    self.assertEqual(hex2term_int(hexval), int(code))
+                    self.assertEqual(rgb2term(r, g, b), code)
+                    self.assertEqual(rgb2termhex(r, g, b), hexval)
+        # Ties go to the bigger step.
+        self.assertEqual(rgb2termhex(0x2f, 0x73, 0x2f), '008700')
+        self.assertEqual(rgb2termhex(0x30, 0x00, 0xfe), '5f00ff')
+        self.assertEqual(hex2term_int('#FFF', allow_short=True), 231)
+        self.assertEqual(hex2term_int('#ff0000'), 196)
+        for args in ((-1, 0, 0), (0, 256, 0)):
+            with self.assertRaises(ValueError):
+                rgb2term_int(*args)
+        for hexval in ('ff00', 'gggggg', '', None):
+            with self.assertRaises(ValueError):
+                hex2term_int(hexval)
+
     def test_trans(self):
         """ Translation functions should translate codes properly. """
         for v in self.conversions:
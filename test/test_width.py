@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" test_width.py
+    Unit tests for colr/width.py
+"""
+
+import random
+import sys
+import unicodedata
+import unittest
+from unittest import mock
+
+from colr import (
+    __version__,
+    char_width,
+    Colr,
+    str_width,
+    truncate,
+    wrap,
+)
+from colr import sgr, width, width_data
+from colr.base import ChainedBase
+from colr.width import (
+    _encodes_ascii,
+    column_offsets,
+    str_fit,
+)
+from .testing_tools import ColrTestCase
+
+# Pieces for the fuzz tests, with wide, zero width, and joined characters.
+width_pieces = (
+    'a', 'bc', ' ', '\n', '日本', '語', 'e\u0301', '가',
+    '\U0001f468\u200d\U0001f469\u200d\U0001f467', '❤\ufe0f',
+    '\u200d', '\ufe0f', '\033[31m', '\033[1;44m', '\033[0m',
+)
+
+
+class WidthTests(ColrTestCase):
+    """ Tests for colr/width.py """
+
+    def test_char_width(self):
+        """ char_width() should know wide and zero width characters. """
+        cases = (
+            ('a', 1),
+            ('\xe9', 1),
+            ('\u0301', 0),
+            ('\u200b', 0),
+            ('\u200d', 0),
+            ('\xad', 1),
+            ('\u1160', 0),
+            ('日', 2),
+            ('가', 2),
+            ('\uff21', 2),
+            ('\uff71', 1),
+            ('\U0001f600', 2),
+            ('\U00020000', 2),
+            ('\U0002fffd', 2),
+            ('\U000e0001', 0),
+        )
+        for char, expected in cases:
+            self.assertCallEqual(
+                char_width(char),
+                expected,
+                func=char_width,
+                args=(char, ),
+                msg='Wrong width for character.',
+            )
+
+    @unittest.skipUnless(
+        unicodedata.unidata_version == width_data.unicode_version,
+        'width_data was built from another Unicode version.',
+    )
+    def test_char_width_unicodedata(self):
+        """ char_width() should agree with unicodedata for assigned
+            characters, so width_data is not stale or hand edited.
+        """
+        rand = random.Random(18)
+        codepoints = set(rand.sample(range(sys.maxunicode + 1), 20000))
+        # Both ends of every range, and their neighbours.
+        for first, last in width_data.zero_ranges + width_data.wide_ranges:
+            codepoints.update((first - 1, first, last, last + 1))
+        for codepoint in sorted(codepoints):
+            if not (0 <= codepoint <= sys.maxunicode):
+                continue
+            char = chr(codepoint)
+            category = unicodedata.category(char)
+            if category == 'Cn':
+                # Unassigned, only reserved CJK blocks are wide.
+                continue
+            if (
+                    (category in ('Mn', 'Me')) or
+                    (category == 'Cf' and codepoint != 0x00ad) or
+                    (0x1160 <= codepoint <= 0x11ff) or
+                    (codepoint == 0x200b)):
+                expected = 0
+            elif unicodedata.east_asian_width(char) in ('W', 'F'):
+                expected = 2
+            else:
+                expected = 1
+            self.assertCallEqual(
+                char_width(char),
+                expected,
+                func=char_width,
+                args=(char, ),
+                msg='Failed to match unicodedata for U+{:04X}.'.format(
+                    codepoint,
+                ),
+            )
+
+    def test_encodes_ascii(self):
+        """ The Python 3.6 stand-in for str.isascii() should only accept
+            ASCII, and should give the same widths.
+        """
+        samples = list(width_pieces) + ['', 'test', '\x7f', '\x80', 'caf\xe9']
+        for s in samples:
+            self.assertCallEqual(
+                _encodes_ascii(s),
+                all(ord(c) < 128 for c in s),
+                func=_encodes_ascii,
+                args=(s, ),
+                msg='Failed to match str.isascii().',
+            )
+        s = ''.join(samples)
+        expected = (str_width(s), wrap(s, 5), truncate(s, 7))
+        with mock.patch.object(width, '_is_ascii', _encodes_ascii):
+            with mock.patch.object(sgr, '_is_ascii', _encodes_ascii):
+                width.width_cache.clear()
+                self.assertEqual(
+                    (str_width(s), wrap(s, 5), truncate(s, 7)),
+                    expected,
+                )
+
+    def test_justify(self):
+        """ ljust/rjust/center and format() should pad by columns. """
+        clr = Colr('日本', 'red')
+        cases = (
+            (clr.ljust(6), '\033[31m日本\033[0m  '),
+            (clr.rjust(6), '  \033[31m日本\033[0m'),
+            (clr.center(8), '  \033[31m日本\033[0m  '),
+            (clr.ljust(3), str(clr)),
+            (Colr('e\u0301').ljust(3), 'e\u0301  '),
+            ('{:<6}'.format(clr), '\033[31m日本\033[0m  '),
+            (
+                Colr('x').ljust(5, text='日', squeeze=True),
+                'x日  ',
+            ),
+        )
+        for result, expected in cases:
+            self.assertEqual(str(result), expected)
+
+    def test_str_width(self):
+        """ str_width() should count terminal columns. """
+        cases = (
+            ('', 0),
+            ('test', 4),
+            ('日本語', 6),
+            ('cafe\u0301', 4),
+            ('\U0001f468\u200d\U0001f469\u200d\U0001f467', 2),
+            ('❤\ufe0f', 2),
+            ('\U0001f468\u200d❤\ufe0f\u200d\U0001f468', 2),
+            ('\U0001f1fa\U0001f1f8', 2),
+        )
+        for s, expected in cases:
+            self.assertCallEqual(
+                str_width(s),
+                expected,
+                func=str_width,
+                args=(s, ),
+                msg='Wrong width for string.',
+            )
+            self.assertEqual(column_offsets(s)[-1], expected)
+        self.assertEqual(str_fit('日本', 3), 1)
+        self.assertEqual(str_fit('cafe\u0301s', 4), 5)
+        self.assertEqual(str_fit('test', 9), 4)
+        self.assertEqual(str_fit('日', -1), 0)
+
+    def test_width_fuzz(self):
+        """ Column offsets, wrap(), and truncate() should agree with
+            str_width().
+        """
+        rand = random.Random(18)
+        for _ in range(1000):
+            s = ''.join(
+                rand.choice(width_pieces)
+                for _ in range(rand.randint(0, 20))
+            )
+            plain = ChainedBase(s).stripped()
+            self.assertCallEqual(
+                column_offsets(plain)[-1],
+                str_width(plain),
+                func=column_offsets,
+                args=(plain, ),
+                msg='Offsets do not match str_width().',
+            )
+            width = rand.randint(2, 10)
+            for line in wrap(s, width):
+                self.assertLessEqual(
+                    str_width(ChainedBase(line).stripped()),
+                    width,
+                    msg='Line is too wide: {!r}'.format(line),
+                )
+            self.assertLessEqual(
+                str_width(ChainedBase(truncate(s, width)).stripped()),
+                width,
+                msg='Truncated string is too wide: {!r}'.format(s),
+            )
+
+    def test_wrap(self):
+        """ wrap() and truncate() should count columns. """
+        s = str(Colr('日本語 日本', 'red'))
+        self.assertEqual(
+            wrap(s, 4),
+            [
+                '\033[31m日本\033[0m',
+                '\033[31m語\033[0m',
+                '\033[31m日本\033[0m',
+            ],
+        )
+        self.assertEqual(
+            truncate(s, 5),
+            '\033[31m日本…\033[0m',
+        )
+        self.assertEqual(truncate('cafe\u0301s', 5), 'cafe\u0301s')
+        self.assertEqual(truncate('cafe\u0301s!', 5), 'cafe\u0301…')
+
+
+if __name__ == '__main__':
+    print('Testing Colr.width v. {}'.format(__version__))
+    # unittest.main() calls sys.exit(status_code).
+    unittest.main(argv=sys.argv, verbosity=2)  # type: ignore
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" gen_nearest_data.py
+    Rebuild colr/nearest_data.py, the candidate palette colors that
+    `rgb2term_nearest()` looks up, by checking every RGB value against
+    every color in the terminal palette. Needs NumPy.
+"""
+
+import base64
+import os
+import sys
+import zlib
+
+parentdir = os.path.split(os.path.abspath(sys.path[0]))[0]
+if os.path.isdir(os.path.join(parentdir, 'colr')):
+    # Use dev version before installed version.
+    sys.path.insert(0, parentdir)
+
+try:
+    import numpy as np
+    from colr import docopt
+    from colr import trans
+except ImportError as ex:
+    print('\nUnable to import modules: {}\n'.format(ex), file=sys.stderr)
+    sys.exit(1)
+
+NAME = 'Colr Nearest Data Generator'
+VERSION = '0.0.1'
+VERSIONSTR = '{} v. {}'.format(NAME, VERSION)
+SCRIPT = os.path.split(os.path.abspath(sys.argv[0]))[1]
+DATAFILE = os.path.join(parentdir, 'colr', 'nearest_data.py')
+
+USAGESTR = """{versionstr}
+
+    Rebuild {datafile} by checking all 16777216 RGB values
+    against the terminal palette.
+
+    Usage:
+        {script} -h | -v
+        {script} [-c]
+
+    Options:
+        -c,--check    : Don't write anything, exit with 1 if the data file
+                        is out of date.
+        -h,--help     : Show this help message.
+        -v,--version  : Show version.
+""".format(
+    datafile=os.path.relpath(DATAFILE),
+    script=SCRIPT,
+    versionstr=VERSIONSTR,
+)
+
+# Colors within this distance of the nearest one are kept as candidates,
+# so rounding differences can't drop a color that ties for nearest.
+TOLERANCE = 1e-9
+# Cells are CELLSIZE values wide on each channel (see `rgb2term_nearest()`).
+CELLSIZE = 8
+CELLS = 256 // CELLSIZE
+
+
+def main(argd):
+    """ Main entry point, expects docopt arg dict as argd. """
+    with open(DATAFILE, 'r') as f:
+        old = f.read()
+    new = build_module(old)
+    if argd['--check']:
+        if new == old:
+            print('Up to date: {}'.format(DATAFILE))
+            return 0
+        print_err('Out of date: {}'.format(DATAFILE))
+        return 1
+    with open(DATAFILE, 'w') as f:
+        f.write(new)
+    print('Wrote: {}'.format(DATAFILE))
+    return 0
+
+
+def build_module(old):
+    """ Return the new data module source, keeping the docstring/license
+        header from the `old` source.
+    """
+    header = old[:old.index('"""', old.index('"""') + 3) + 3]
+    packed = base64.b64encode(zlib.compress(pack_cells(get_cells()), 9))
+    lines = [
+        header,
+        '',
+        '# Candidate terminal codes for `rgb2term_nearest()`, for each 8x8x8 '
+        'cell of',
+        '# RGB values. Cells are in (r >> 3, g >> 3, b >> 3) order, and each '
+        'one is a',
+        '# count byte followed by that many codes, in ascending order. Every '
+        'color in a',
+        '# cell is nearest (in OKLab) to one of the cell\'s codes. This was '
+        'built by',
+        '# checking all 16777216 RGB values against every color in the '
+        'palette, and is',
+        '# stored zlib compressed, and base64 encoded.',
+        'cells_packed = (',
+    ]
+    for i in range(0, len(packed), 72):
+        lines.append("    '{}'".format(packed[i:i + 72].decode('ascii')))
+    lines.append(')')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def get_cells():
+    """ Return (cells, codes), where `cells` is a bool array shaped
+        (CELLS, CELLS, CELLS, len(codes)) that marks the palette codes
+        nearest to some color in each cell.
+    """
+    palette = sorted(
+        (int(code), trans.hex2rgb(hexval))
+        for hexval, code in trans.hex2term_map.items()
+    )
+    codes = np.array([code for code, _ in palette], dtype=np.uint8)
+    palette_lab = np.array([trans._oklab(*rgb) for _, rgb in palette])
+    palette_sq = (palette_lab * palette_lab).sum(axis=1)
+    linear = np.array(trans._srgb_linear)
+    to_lms = np.array((
+        (0.4122214708, 0.5363325363, 0.0514459929),
+        (0.2119034982, 0.6806995451, 0.1073969566),
+        (0.0883024619, 0.2817188376, 0.6299787005),
+    ))
+    to_lab = np.array((
+        (0.2104542553, 0.7936177850, -0.0040720468),
+        (1.9779984951, -2.4285922050, 0.4505937099),
+        (0.0259040371, 0.7827717662, -0.8086757660),
+    ))
+    green, blue = np.meshgrid(linear, linear, indexing='ij')
+    cells = np.zeros((CELLS, CELLS, CELLS, len(codes)), dtype=bool)
+    # One red value at a time, for all 65536 green/blue values.
+    for red in range(256):
+        rgb = np.stack(
+            (np.full(green.size, linear[red]), green.ravel(), blue.ravel()),
+            axis=1,
+        )
+        lab = np.cbrt(rgb @ to_lms.T) @ to_lab.T
+        dists = (
+            (lab * lab).sum(axis=1)[:, None] +
+            palette_sq -
+            2 * (lab @ palette_lab.T)
+        )
+        near = dists <= dists.min(axis=1, keepdims=True) + TOLERANCE
+        near = near.reshape(
+            CELLS, CELLSIZE, CELLS, CELLSIZE, len(codes)
+        ).any(axis=(1, 3))
+        cells[red // CELLSIZE] |= near
+    return cells, codes
+
+
+def pack_cells(cells_codes):
+    """ Pack the cells from `get_cells()` into bytes, a count byte followed
+        by the codes for each cell.
+    """
+    cells, codes = cells_codes
+    packed = bytearray()
+    for cell in cells.reshape(-1, len(codes)):
+        cellcodes = codes[cell]
+        packed.append(len(cellcodes))
+        packed.extend(cellcodes.tobytes())
+    return bytes(packed)
+
+
+def print_err(*args, **kwargs):
+    """ A wrapper for print() that uses stderr by default. """
+    if kwargs.get('file', None) is None:
+        kwargs['file'] = sys.stderr
+    print(*args, **kwargs)
+
+
+if __name__ == '__main__':
+    try:
+        mainret = main(docopt(USAGESTR, version=VERSIONSTR, script=SCRIPT))
+    except (EOFError, KeyboardInterrupt):
+        print_err('\nUser cancelled.\n')
+        mainret = 2
+    sys.exit(mainret)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+""" gen_width_data.py
+    Rebuild colr/width_data.py from the `unicodedata` module, so the
+    character width table matches the Unicode version of the running
+    Python.
+"""
+
+import os
+import sys
+import unicodedata
+
+parentdir = os.path.split(os.path.abspath(sys.path[0]))[0]
+if os.path.isdir(os.path.join(parentdir, 'colr')):
+    # Use dev version before installed version.
+    sys.path.insert(0, parentdir)
+
+try:
+    from colr import docopt
+except ImportError as ex:
+    print('\nUnable to import colr modules: {}\n'.format(ex), file=sys.stderr)
+    sys.exit(1)
+
+NAME = 'Colr Width Data Generator'
+VERSION = '0.0.1'
+VERSIONSTR = '{} v. {}'.format(NAME, VERSION)
+SCRIPT = os.path.split(os.path.abspath(sys.argv[0]))[1]
+DATAFILE = os.path.join(parentdir, 'colr', 'width_data.py')
+
+USAGESTR = """{versionstr}
+
+    Rebuild {datafile} from the unicodedata module
+    (Unicode {unidata}).
+
+    Usage:
+        {script} -h | -v
+        {script} [-c]
+
+    Options:
+        -c,--check    : Don't write anything, exit with 1 if the data file
+                        is out of date.
+        -h,--help     : Show this help message.
+        -v,--version  : Show version.
+""".format(
+    datafile=os.path.relpath(DATAFILE),
+    script=SCRIPT,
+    unidata=unicodedata.unidata_version,
+    versionstr=VERSIONSTR,
+)
+
+# Unassigned code points in these blocks are East Asian Wide by default
+# (see EastAsianWidth.txt), because they are reserved for CJK ideographs.
+DEFAULT_WIDE = (
+    (0x03400, 0x04dbf),
+    (0x04e00, 0x09fff),
+    (0x0f900, 0x0faff),
+    (0x20000, 0x2fffd),
+    (0x30000, 0x3fffd),
+)
+
+
+def main(argd):
+    """ Main entry point, expects docopt arg dict as argd. """
+    with open(DATAFILE, 'r') as f:
+        old = f.read()
+    new = build_module(old)
+    if argd['--check']:
+        if new == old:
+            print('Up to date: {}'.format(DATAFILE))
+            return 0
+        print_err('Out of date: {}'.format(DATAFILE))
+        return 1
+    with open(DATAFILE, 'w') as f:
+        f.write(new)
+    print('Wrote: {}'.format(DATAFILE))
+    return 0
+
+
+def build_module(old):
+    """ Return the new data module source, keeping the docstring/license
+        header from the `old` source.
+    """
+    header = old[:old.index('"""', old.index('"""') + 3) + 3]
+    version = '.'.join(unicodedata.unidata_version.split('.')[:2])
+    return '\n'.join((
+        header,
+        '',
+        '# The unicodedata version these tables were built from.',
+        'unicode_version = {!r}'.format(unicodedata.unidata_version),
+        '',
+        '# Code point ranges (first, last) for characters that are not one '
+        'column',
+        '# wide in a terminal, built from the Unicode {} database.'.format(
+            version,
+        ),
+        '# Zero width: combining marks (Mn, Me), format characters (Cf) '
+        'except the',
+        '# soft hyphen, Hangul medial vowels/final consonants, and U+200B.',
+        '# Wide: East Asian Wide (W) and Fullwidth (F) characters.',
+        '# Everything else is one column wide.',
+        format_ranges('zero_ranges', get_ranges(is_zero_width)),
+        '',
+        format_ranges('wide_ranges', get_ranges(is_wide)),
+        '',
+    ))
+
+
+def format_ranges(name, ranges):
+    """ Format a tuple of ranges as Python source, three per line. """
+    lines = ['{} = ('.format(name)]
+    for i in range(0, len(ranges), 3):
+        lines.append('    {},'.format(', '.join(
+            '(0x{:05x}, 0x{:05x})'.format(first, last)
+            for first, last in ranges[i:i + 3]
+        )))
+    lines.append(')')
+    return '\n'.join(lines)
+
+
+def get_ranges(predicate):
+    """ Return a list of (first, last) ranges for the code points where
+        predicate(codepoint) is True.
+    """
+    ranges = []
+    first = None
+    for codepoint in range(sys.maxunicode + 1):
+        if predicate(codepoint):
+            if first is None:
+                first = codepoint
+        elif first is not None:
+            ranges.append((first, codepoint - 1))
+            first = None
+    if first is not None:
+        ranges.append((first, sys.maxunicode))
+    return ranges
+
+
+def is_wide(codepoint):
+    """ Returns True if a code point is two columns wide. """
+    if is_zero_width(codepoint):
+        return False
+    char = chr(codepoint)
+    if unicodedata.category(char) == 'Cn':
+        return any(
+            first <= codepoint <= last
+            for first, last in DEFAULT_WIDE
+        )
+    return unicodedata.east_asian_width(char) in ('W', 'F')
+
+
+def is_zero_width(codepoint):
+    """ Returns True if a code point takes up no columns. """
+    category = unicodedata.category(chr(codepoint))
+    if category in ('Mn', 'Me'):
+        return True
+    if category == 'Cf':
+        # The soft hyphen is usually drawn.
+        return codepoint != 0x00ad
+    # Hangul medial vowels/final consonants join the character before them.
+    return (0x1160 <= codepoint <= 0x11ff) or (codepoint == 0x200b)
+
+
+def print_err(*args, **kwargs):
+    """ A wrapper for print() that uses stderr by default. """
+    if kwargs.get('file', None) is None:
+        kwargs['file'] = sys.stderr
+    print(*args, **kwargs)
+
+
+if __name__ == '__main__':
+    try:
+        mainret = main(docopt(USAGESTR, version=VERSIONSTR, script=SCRIPT))
+    except (EOFError, KeyboardInterrupt):
+        print_err('\nUser cancelled.\n')
+        mainret = 2
+    sys.exit(mainret)